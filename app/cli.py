@@ -0,0 +1,119 @@
+"""
+Maintenance commands.
+
+Usage:
+    python -m app.cli create-schema
+    python -m app.cli check-schema
+    python -m app.cli ensure-history-partitions [--ahead 3]
+    python -m app.cli build-openapi [--output app/openapi.json]
+    python -m app.cli profile-startup [--path /] [--top 15]
+    python -m app.cli archive-history --before 2023-01-01 [--dir /var/lib/ppdapi/archive]
+"""
+import argparse
+import os
+from datetime import datetime, timezone
+
+from app import db
+from app.utils import archive, partitions, schema, startup
+
+
+def create_schema(args) -> int:
+    engine = db.create_db_engine()
+    schema.create_schema(engine)
+    print(f"Schema created at revision {', '.join(sorted(schema.head_revisions()))}")
+    return 0
+
+
+def check_schema(args) -> int:
+    engine = db.create_db_engine()
+    with engine.connect() as connection:
+        current = schema.current_revisions(connection)
+    head = schema.head_revisions()
+    print(f"Database: {', '.join(sorted(current)) or 'no revision'}; migrations head: {', '.join(sorted(head))}")
+    return 0 if current == head else 1
+
+
+def ensure_history_partitions(args) -> int:
+    engine = db.create_db_engine()
+    with engine.begin() as connection:
+        created = partitions.ensure_history_partitions(connection, ahead=args.ahead)
+    print(f"Created history partitions: {', '.join(created) or 'none'}")
+    return 0
+
+
+def archive_history(args) -> int:
+    before = int(datetime.fromisoformat(args.before).replace(tzinfo=timezone.utc).timestamp())
+    db.init_db()
+    with db.SessionLocal(bind=db.engine) as session:
+        moved = archive.archive_history(session, before, directory=args.dir, batch_size=args.batch_size)
+    print(f"Archived {moved} history rows created before {args.before}")
+    return 0
+
+
+def build_openapi(args) -> int:
+    # The schema does not depend on the database: build it against the
+    # in-memory SQLite so the build step needs no connection.
+    os.environ["DATABASE"] = "sqlite"
+    from app.main import app
+    from app.utils.openapi import write_openapi
+
+    print(f"OpenAPI schema written to {write_openapi(app, args.output)}")
+    return 0
+
+
+def profile_startup(args) -> int:
+    print(startup.report(args.module, args.path, args.top))
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser(
+        "create-schema",
+        help="Create all tables on an empty database and stamp it with the Alembic head",
+    ).set_defaults(handler=create_schema)
+    commands.add_parser(
+        "check-schema",
+        help="Compare alembic_version with the migrations head (exit code 1 if they differ)",
+    ).set_defaults(handler=check_schema)
+
+    partitions_parser = commands.add_parser(
+        "ensure-history-partitions",
+        help="Create the monthly history partitions up to a few months ahead (PostgreSQL; schedule monthly)",
+    )
+    partitions_parser.add_argument("--ahead", type=int, default=None, help="Months ahead (default: HISTORY_PARTITIONS_AHEAD)")
+    partitions_parser.set_defaults(handler=ensure_history_partitions)
+
+    openapi_parser = commands.add_parser(
+        "build-openapi",
+        help="Generate the OpenAPI document served at /openapi.json",
+    )
+    openapi_parser.add_argument("--output", default=None, help="Output file (default: OPENAPI_FILE or app/openapi.json)")
+    openapi_parser.set_defaults(handler=build_openapi)
+
+    profile_parser = commands.add_parser(
+        "profile-startup",
+        help="Report per-module import cost and time to first response of the API",
+    )
+    profile_parser.add_argument("--module", default="app.main", help="Module exposing the ASGI app")
+    profile_parser.add_argument("--path", default="/", help="Path of the first request")
+    profile_parser.add_argument("--top", type=int, default=15, help="Modules listed per section")
+    profile_parser.set_defaults(handler=profile_startup)
+
+    archive_parser = commands.add_parser(
+        "archive-history",
+        help="Move old history rows to compressed Arrow files under HISTORY_ARCHIVE_DIR",
+    )
+    archive_parser.add_argument("--before", required=True, help="Cutoff date (YYYY-MM-DD, UTC)")
+    archive_parser.add_argument("--dir", default=None, help="Archive directory (default: HISTORY_ARCHIVE_DIR)")
+    archive_parser.add_argument("--batch-size", type=int, default=50000, help="Rows moved per transaction")
+    archive_parser.set_defaults(handler=archive_history)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
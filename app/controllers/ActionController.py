@@ -3,19 +3,21 @@ from fastapi import HTTPException
 from app.controllers import ActionTypeController, PpdaController, UserController
 from app.models import ActionType
 from app.models.Action import Action, ActionPublic
+from app.utils.responses import table_select
 import sqlmodel as sql
 
-async def get_all(session : sql.Session) -> list[Action]:
+async def get_all(session : sql.Session, columns: list | None = None) -> list[Action]:
     """
     Retrieves a complete list of all actions in the system.
 
     Args:
         session: Database session
+        columns: Only select these Action columns (``fields=``)
 
     Returns:
-        List[Action]: All registered actions with their IDs and descriptions
+        List[Action]: All registered actions, as result rows with the Action columns
     """
-    actions = session.exec(sql.select(Action)).all()
+    actions = session.exec(table_select(Action, columns)).all()
     return actions
 
 async def get_by_id(id_action: int, session : sql.Session) -> Action:
@@ -60,7 +62,6 @@ async def create_action(action: Action, session : sql.Session) -> Action:
     
     session.add(action)
     session.commit()
-    session.refresh(action)
     return action
 
 async def update_action(action: Action, session : sql.Session) -> Action:
@@ -96,7 +97,6 @@ async def update_action(action: Action, session : sql.Session) -> Action:
         setattr(db_action, field, value)
     session.add(db_action)
     session.commit()
-    session.refresh(db_action)
     return db_action
   
 async def delete_action(id_action: int, session : sql.Session) -> Action:
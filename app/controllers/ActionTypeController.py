@@ -65,7 +65,6 @@ async def create_action_type(action_type: ActionType, session: sql.Session) -> A
     )
   session.add(action_type)
   session.commit()
-  session.refresh(action_type)
   return action_type
 
 async def update_action_type(id: int, action_type: ActionTypeUpdate, session: sql.Session) -> ActionType:
@@ -91,7 +90,6 @@ async def update_action_type(id: int, action_type: ActionTypeUpdate, session: sq
     )
   db_action_type.action_type = action_type.action_type
   session.commit()
-  session.refresh(db_action_type)
   return db_action_type
 
 async def delete_action_type(id: int, session: sql.Session) -> None:
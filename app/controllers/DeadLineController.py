@@ -2,16 +2,21 @@ from fastapi import HTTPException, status
 from app.models.DeadLine import DeadLine, DeadLineBase
 from sqlmodel import select, Session
 from datetime import datetime
+from app.utils.filters import ListQuery
+from app.utils.mutations import delete_returning, update_returning
 
-async def get_all(session: Session):
+async def get_all(session: Session, query: ListQuery | None = None):
     """
     Retrieve all deadlines from the database.
     Args:
         session (Session): The database session.
+        query (ListQuery | None): Filters and sort order from the query string.
     Returns:
         List[DeadLine]: A list of all deadline objects.
     """
     statement = select(DeadLine)
+    if query:
+        statement = query.apply(statement)
     return session.exec(statement).all()
 
 async def get_by_id(id: str, session: Session):
@@ -43,7 +48,6 @@ async def create_deadline(deadline_data, session: Session):
     deadline = DeadLine(**deadline_data.model_dump()) if hasattr(deadline_data, 'model_dump') else DeadLine(**dict(deadline_data))
     session.add(deadline)
     session.commit()
-    session.refresh(deadline)
     return deadline
 
 async def update_deadline(id: str, deadline_data, session: Session):
@@ -58,16 +62,8 @@ async def update_deadline(id: str, deadline_data, session: Session):
     Raises:
         HTTPException: If the deadline is not found (404).
     """
-    statement = select(DeadLine).where(DeadLine.id_deadline == id)
-    deadline = session.exec(statement).first()
-    if not deadline:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deadline not found")
-    for key, value in (deadline_data.model_dump().items() if hasattr(deadline_data, 'model_dump') else dict(deadline_data).items()):
-        setattr(deadline, key, value)
-    session.add(deadline)
-    session.commit()
-    session.refresh(deadline)
-    return deadline
+    update_dict = deadline_data.model_dump() if hasattr(deadline_data, 'model_dump') else dict(deadline_data)
+    return update_returning(DeadLine, DeadLine.id_deadline == id, update_dict, session, not_found_detail="Deadline not found")
 
 async def delete_deadline(id: str, session: Session):
     """
@@ -80,12 +76,7 @@ async def delete_deadline(id: str, session: Session):
     Raises:
         HTTPException: If the deadline is not found (404).
     """
-    statement = select(DeadLine).where(DeadLine.id_deadline == id)
-    deadline = session.exec(statement).first()
-    if not deadline:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deadline not found")
-    session.delete(deadline)
-    session.commit()
+    delete_returning(DeadLine, DeadLine.id_deadline == id, session, not_found_detail="Deadline not found")
     return {"detail": "Deadline deleted", "id": id}
 
 async def get_by_action(id_action: str, session: Session):
@@ -1,19 +1,54 @@
 import sqlmodel as sql
 from fastapi import HTTPException, status
 from app.models.History import History, HistoryBase
-from typing import List
+from app.utils.archive import archive_enabled, with_archive
+from app.utils.mutations import delete_returning, update_returning
+from app.utils.responses import json_rows_response, sql_json_available, table_select
+from typing import List, Optional
 
-async def get_all(session: sql.Session) -> List[History]:
+def _within(statement, from_date: Optional[int], to_date: Optional[int]):
+    """
+    Restricts a history query to created_at in [from_date, to_date).
+
+    On PostgreSQL history is partitioned by month on created_at, so a bounded
+    window only scans the partitions it overlaps.
+    """
+    if from_date is not None:
+        statement = statement.where(History.created_at >= from_date)
+    if to_date is not None:
+        statement = statement.where(History.created_at < to_date)
+    return statement
+
+def _list(session: sql.Session, statement, filters: Optional[dict], from_date: Optional[int], to_date: Optional[int], stream_json: bool, columns: Optional[list] = None):
+    """
+    Runs a history listing restricted to the created_at window.
+
+    On PostgreSQL (when JSON is wanted and there is no archive to merge) the
+    JSON is built by the database and streamed as the response; otherwise
+    the rows are returned, followed by the matching archived ones.
+    """
+    statement = _within(statement, from_date, to_date)
+    if columns and archive_enabled() and "id_history" not in {column.key for column in columns}:
+        # Needed to skip archived rows still present in the database
+        statement = statement.add_columns(History.__table__.c.id_history)
+    if stream_json and not archive_enabled() and sql_json_available(session, statement):
+        return json_rows_response(session, statement)
+    return with_archive(session.exec(statement).all(), session, filters, from_date, to_date)
+
+async def get_all(session: sql.Session, from_date: Optional[int] = None, to_date: Optional[int] = None, stream_json: bool = True, columns: Optional[list] = None) -> List[History]:
     """
     Retrieve all history records from the database.
     Args:
         session (sql.Session): Database session for operations.
+        from_date (Optional[int]): Only records created at or after this unix timestamp.
+        to_date (Optional[int]): Only records created before this unix timestamp.
+        stream_json (bool): Allow the PostgreSQL JSON response; False when
+            the client asked for another format and needs the rows.
+        columns (Optional[list]): Only select these History columns (``fields=``).
     Returns:
-        List[History]: List of all history records.
+        List[History]: All history records, as result rows with the History columns.
     """
-    statement = sql.select(History)
-    histories = session.exec(statement).all()
-    return histories
+    return _list(session, table_select(History, columns), None, from_date, to_date, stream_json, columns)
 
 async def get_by_id(id: str, session: sql.Session) -> History:
     """
@@ -44,7 +79,6 @@ async def create_history(history_data: HistoryBase, session: sql.Session) -> His
     history = History(**history_data.model_dump()) if hasattr(history_data, 'model_dump') else History(**dict(history_data))
     session.add(history)
     session.commit()
-    session.refresh(history)
     return history
 
 async def update_history(id: str, history_data: HistoryBase, session: sql.Session) -> History:
@@ -59,16 +93,12 @@ async def update_history(id: str, history_data: HistoryBase, session: sql.Sessio
     Raises:
         HTTPException: 404 if history record is not found.
     """
-    statement = sql.select(History).where(History.id_history == id)
-    history = session.exec(statement).first()
-    if not history:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="History not found")
-    for key, value in history_data.model_dump().items() if hasattr(history_data, 'model_dump') else dict(history_data).items():
-        setattr(history, key, value)
-    session.add(history)
-    session.commit()
-    session.refresh(history)
-    return history
+    update_dict = history_data.model_dump() if hasattr(history_data, 'model_dump') else dict(history_data)
+    # Missing timestamps keep the stored created_at; updated_at is set by the database
+    for column in ("created_at", "updated_at"):
+        if update_dict.get(column) is None:
+            update_dict.pop(column, None)
+    return update_returning(History, History.id_history == id, update_dict, session, not_found_detail="History not found")
 
 async def delete_history(id: str, session: sql.Session) -> dict:
     """
@@ -81,52 +111,53 @@ async def delete_history(id: str, session: sql.Session) -> dict:
     Raises:
         HTTPException: 404 if history record is not found.
     """
-    statement = sql.select(History).where(History.id_history == id)
-    history = session.exec(statement).first()
-    if not history:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="History not found")
-    session.delete(history)
-    session.commit()
+    delete_returning(History, History.id_history == id, session, not_found_detail="History not found")
     return {"detail": "History deleted", "id": id}
 
-# Métodos adicionales de consulta
-async def get_by_var_and_report(id_variable: str, id_report: str, session: sql.Session):
+# Métodos adicionales de consulta: devuelven filas con las columnas de History
+# (sin construir objetos ORM), o en PostgreSQL el JSON ya armado por la base
+async def get_by_var_and_report(id_variable: str, id_report: str, session: sql.Session, from_date: Optional[int] = None, to_date: Optional[int] = None, stream_json: bool = True, columns: Optional[list] = None):
     """
     Get all history records for a given variable and report.
+    Records can be limited to created_at in [from_date, to_date) (unix timestamps).
     """
-    statement = sql.select(History).where(
+    statement = table_select(History, columns).where(
         (History.id_variable == id_variable) & (History.id_report == id_report)
     )
-    return session.exec(statement).all()
+    return _list(session, statement, {"id_variable": id_variable, "id_report": id_report}, from_date, to_date, stream_json, columns)
 
-async def get_by_variable(id_variable: str, session: sql.Session):
+async def get_by_variable(id_variable: str, session: sql.Session, from_date: Optional[int] = None, to_date: Optional[int] = None, stream_json: bool = True, columns: Optional[list] = None):
     """
     Get all history records for a given variable.
+    Records can be limited to created_at in [from_date, to_date) (unix timestamps).
     """
-    statement = sql.select(History).where(History.id_variable == id_variable)
-    return session.exec(statement).all()
+    statement = table_select(History, columns).where(History.id_variable == id_variable)
+    return _list(session, statement, {"id_variable": id_variable}, from_date, to_date, stream_json, columns)
 
-async def get_by_report(id_report: str, session: sql.Session):
+async def get_by_report(id_report: str, session: sql.Session, from_date: Optional[int] = None, to_date: Optional[int] = None, stream_json: bool = True, columns: Optional[list] = None):
     """
     Get all history records for a given report.
+    Records can be limited to created_at in [from_date, to_date) (unix timestamps).
     """
-    statement = sql.select(History).where(History.id_report == id_report)
-    return session.exec(statement).all()
+    statement = table_select(History, columns).where(History.id_report == id_report)
+    return _list(session, statement, {"id_report": id_report}, from_date, to_date, stream_json, columns)
 
-async def get_by_kpi(id_kpi: str, session: sql.Session):
+async def get_by_kpi(id_kpi: str, session: sql.Session, from_date: Optional[int] = None, to_date: Optional[int] = None, stream_json: bool = True, columns: Optional[list] = None):
     """
     Get all history records for a given KPI (requires join to Variable or Report).
+    Records can be limited to created_at in [from_date, to_date) (unix timestamps).
     """
     # Suponiendo que Variable tiene id_kpi y que History -> Variable -> KPI
     from app.models.Variable import Variable
-    statement = sql.select(History).join(Variable).where(Variable.id_kpi == id_kpi)
-    return session.exec(statement).all()
+    statement = table_select(History, columns).join(Variable).where(Variable.id_kpi == id_kpi)
+    return _list(session, statement, {"id_kpi": id_kpi}, from_date, to_date, stream_json, columns)
 
-async def get_by_action(id_action: str, session: sql.Session):
+async def get_by_action(id_action: str, session: sql.Session, from_date: Optional[int] = None, to_date: Optional[int] = None, stream_json: bool = True, columns: Optional[list] = None):
     """
     Get all history records for a given Action (requires join to Report or Variable).
+    Records can be limited to created_at in [from_date, to_date) (unix timestamps).
     """
     # Suponiendo que Report tiene id_action y que History -> Report -> Action
     from app.models.Report import Report
-    statement = sql.select(History).join(Report).where(Report.id_action == id_action)
-    return session.exec(statement).all()
+    statement = table_select(History, columns).join(Report).where(Report.id_action == id_action)
+    return _list(session, statement, {"id_action": id_action}, from_date, to_date, stream_json, columns)
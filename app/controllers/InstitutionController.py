@@ -1,20 +1,24 @@
 import sqlmodel as sql
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 
 from app.models import Institution, InstitutionCreate, InstitutionUpdate
+from app.utils.mutations import update_returning
+from app.utils.responses import table_select
 
-async def get_all(session : sql.Session):
+async def get_all(session : sql.Session, columns: list | None = None):
     """
         Retrieve all institutions from the database.
 
         Args:
         session (sql.Session): Database session for operations.
+        columns (list | None): Only select these Institution columns (``fields=``).
 
         Returns:
-            List[Institution]: List of all institution objects.
+            List[Institution]: List of all institutions, as result rows with the Institution columns.
     """
-    statement = sql.select(Institution)
+    statement = table_select(Institution, columns)
     institutions = session.exec(statement).all()
     return institutions
 
@@ -77,7 +81,6 @@ async def create_institution(institution: InstitutionCreate, session: sql.Sessio
         new_institution = Institution.model_validate(institution)
         session.add(new_institution)
         session.commit()
-        session.refresh(new_institution)
         
         return new_institution
         
@@ -154,56 +157,54 @@ async def update_institution(id: str, institution: InstitutionUpdate, session: s
         HTTPException: 409 if name/type combination exists.
         HTTPException: 500 for database errors.
     """
-    # Verificar si la institución existe
-    existing = await get_by_id(id, session)
-    if not existing:
+    from app.models import InstitutionType
+    changes = institution.model_dump(exclude_unset=True)
+    
+    # Una sola consulta obtiene la institución y valida nombre/tipo nuevos
+    other = aliased(Institution)
+    new_name = changes.get('institution_name', Institution.institution_name)
+    new_type = changes.get('id_institution_type', Institution.id_institution_type)
+    duplicate = sql.select(other.id_institution).where(
+        other.institution_name == new_name,
+        other.id_institution_type == new_type,
+        other.id_institution != Institution.id_institution
+    ).exists()
+    type_exists = sql.select(InstitutionType.id_institution_type).where(
+        InstitutionType.id_institution_type == new_type
+    ).exists()
+    row = session.exec(
+        sql.select(Institution, duplicate, type_exists).where(Institution.id_institution == id)
+    ).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Institution with ID {id} not found"
         )
     
-    changes = institution.model_dump(exclude_unset=True)
+    existing, is_duplicate, is_valid_type = row
     if not changes:
         return existing
     
-    # Validar si se actualiza el nombre o tipo
-    if 'institution_name' in changes or 'id_institution_type' in changes:
-        new_name = changes.get('institution_name', existing.institution_name)
-        new_type = changes.get('id_institution_type', existing.id_institution_type)
-        
-        # Verificar si ya existe otra institución con el mismo nombre y tipo
-        duplicate = session.exec(
-            sql.select(Institution).where(
-                Institution.institution_name == new_name,
-                Institution.id_institution_type == new_type,
-                Institution.id_institution != id  # Excluir la actual
-            )
-        ).first()
-        
-        if duplicate:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="An institution with this name and type already exists"
-            )
+    if ('institution_name' in changes or 'id_institution_type' in changes) and is_duplicate:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An institution with this name and type already exists"
+        )
     
-    # Validar tipo de institución si se actualiza
-    if 'id_institution_type' in changes:
-        from app.models import InstitutionType
-        institution_type = session.get(InstitutionType, changes['id_institution_type'])
-        if not institution_type:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Institution type with ID {changes['id_institution_type']} not found"
-            )
+    if 'id_institution_type' in changes and not is_valid_type:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Institution type with ID {changes['id_institution_type']} not found"
+        )
     
     try:
-        statement = sql.update(Institution).\
-            where(Institution.id_institution == id).\
-            values(changes)
-        session.exec(statement)
-        session.commit()
-        session.refresh(existing)
-        return await get_by_id(id, session)
+        return update_returning(
+            Institution,
+            Institution.id_institution == id,
+            changes,
+            session,
+            not_found_detail=f"Institution with ID {id} not found"
+        )
     except IntegrityError as e:
         session.rollback()
         raise HTTPException(
@@ -61,7 +61,6 @@ def create_institution_type(institution_type: InstitutionTypeCreate, session: Se
     db_institution = InstitutionType.model_validate(institution_type)
     session.add(db_institution)
     session.commit()
-    session.refresh(db_institution)
     return db_institution
 
 def delete_institution_type(id: int, session: Session):
@@ -121,5 +120,4 @@ def update_institution_type(id: int, institution_type: InstitutionTypeCreate, se
     
     session.add(db_institution)
     session.commit()
-    session.refresh(db_institution)
     return db_institution
\ No newline at end of file
@@ -2,6 +2,14 @@ from fastapi import HTTPException, status
 from typing import List, Optional
 from sqlmodel import Session, select
 from app.models.Kpi import Kpi
+from app.utils.mutations import delete_returning, update_returning
+from app.utils.responses import json_rows_response, sql_json_available, table_select
+
+def _list(session: Session, statement, stream_json: bool):
+    """Rows of a KPI listing, or on PostgreSQL the JSON built and streamed by the database."""
+    if stream_json and sql_json_available(session, statement):
+        return json_rows_response(session, statement)
+    return session.exec(statement).all()
 
 async def create_kpi(kpi: Kpi, session: Session) -> Kpi:
     """
@@ -16,7 +24,6 @@ async def create_kpi(kpi: Kpi, session: Session) -> Kpi:
     """
     session.add(kpi)
     session.commit()
-    session.refresh(kpi)
     return kpi
 
 async def get_kpi_by_id(id_kpi: str, session: Session) -> Kpi:
@@ -38,7 +45,7 @@ async def get_kpi_by_id(id_kpi: str, session: Session) -> Kpi:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="KPI not found")
     return kpi
 
-async def get_all_kpis(session: Session) -> List[Kpi]:
+async def get_all_kpis(session: Session, stream_json: bool = True, columns: Optional[list] = None) -> List[Kpi]:
     """
     Get all KPIs in the database.
 
@@ -46,10 +53,10 @@ async def get_all_kpis(session: Session) -> List[Kpi]:
         session (Session): Database session.
 
     Returns:
-        List[Kpi]: List of all KPIs.
+        List[Kpi]: All KPIs, as result rows with the Kpi columns.
     """
-    statement = select(Kpi)
-    return session.exec(statement).all()
+    statement = table_select(Kpi, columns)
+    return _list(session, statement, stream_json)
 
 async def update_kpi(id_kpi: str, kpi_data: Kpi, session: Session) -> Kpi:
     """
@@ -66,15 +73,13 @@ async def update_kpi(id_kpi: str, kpi_data: Kpi, session: Session) -> Kpi:
     Raises:
         HTTPException: 404 if KPI not found.
     """
-    kpi = session.get(Kpi, id_kpi)
-    if not kpi:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="KPI not found")
-    for key, value in kpi_data.model_dump(exclude_unset=True).items():
-        setattr(kpi, key, value)
-    session.add(kpi)
-    session.commit()
-    session.refresh(kpi)
-    return kpi
+    return update_returning(
+        Kpi,
+        Kpi.id_kpi == id_kpi,
+        kpi_data.model_dump(exclude_unset=True),
+        session,
+        not_found_detail="KPI not found"
+    )
 
 async def delete_kpi(id_kpi: str, session: Session) -> dict:
     """
@@ -90,14 +95,10 @@ async def delete_kpi(id_kpi: str, session: Session) -> dict:
     Raises:
         HTTPException: 404 if KPI not found.
     """
-    kpi = session.get(Kpi, id_kpi)
-    if not kpi:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="KPI not found")
-    session.delete(kpi)
-    session.commit()
+    delete_returning(Kpi, Kpi.id_kpi == id_kpi, session, not_found_detail="KPI not found")
     return {"detail": "KPI deleted", "id": id_kpi}
 
-async def get_kpis_by_action(id_action: str, session: Session) -> List[Kpi]:
+async def get_kpis_by_action(id_action: str, session: Session, stream_json: bool = True, columns: Optional[list] = None) -> List[Kpi]:
     """
     Get all KPIs associated with a specific action.
 
@@ -106,7 +107,7 @@ async def get_kpis_by_action(id_action: str, session: Session) -> List[Kpi]:
         session (Session): Database session.
 
     Returns:
-        List[Kpi]: List of KPIs related to the action.
+        List[Kpi]: KPIs related to the action, as result rows with the Kpi columns.
     """
-    statement = select(Kpi).where(Kpi.id_action == id_action)
-    return session.exec(statement).all()
+    statement = table_select(Kpi, columns).where(Kpi.id_action == id_action)
+    return _list(session, statement, stream_json)
@@ -1,21 +1,151 @@
-from fastapi import HTTPException, status
 import sqlmodel as sql
+from fastapi import HTTPException, status
+from app.models import Role, User, UserInstitution
 from app.models.Ppda import Ppda, PpdaCreate, PpdaUpdate
+from app.utils.filters import ListQuery
+from app.utils.mutations import delete_returning, update_returning
+from app.utils.responses import table_select
+from app.utils.spatial import BBox, intersecting, point_bbox
 
-async def get_all(session : sql.Session):
+async def get_all(session : sql.Session, columns: list | None = None, query: ListQuery | None = None):
   """
   Retrieves all ppda from the database.
   
   Args:
       session (Session): Database session for operations.
+      columns (list | None): Only select these Ppda columns (``fields=``).
+      query (ListQuery | None): Filters and sort order from the query string.
   
   Returns:
-      List[Ppda]: List of all ppda objects.
+      List[Ppda]: List of all ppda, as result rows with the Ppda columns.
   """
-  statement = sql.select(Ppda)
+  statement = table_select(Ppda, columns)
+  if query:
+    statement = query.apply(statement)
   ppda = session.exec(statement).all()
   return ppda
 
+async def get_at(lat: float, lon: float, session: sql.Session, columns: list | None = None):
+  """
+  Retrieves the ppda whose bounding box contains a location.
+
+  Args:
+      lat (float): Latitude [WGS84 degrees].
+      lon (float): Longitude [WGS84 degrees].
+      session (Session): Database session for operations.
+      columns (list | None): Only select these Ppda columns (``fields=``).
+
+  Returns:
+      List[Ppda]: Matching ppda, as result rows with the Ppda columns.
+  """
+  return await get_within(point_bbox(lat, lon), session, columns)
+
+async def get_within(bbox: BBox, session: sql.Session, columns: list | None = None):
+  """
+  Retrieves the ppda whose bounding box intersects ``bbox``, through the
+  database's spatial index.
+
+  Args:
+      bbox (BBox): Area to look in.
+      session (Session): Database session for operations.
+      columns (list | None): Only select these Ppda columns (``fields=``).
+
+  Returns:
+      List[Ppda]: Matching ppda, as result rows with the Ppda columns.
+  """
+  statement = intersecting(table_select(Ppda, columns), session, bbox)
+  return session.exec(statement).all()
+
+def _roles_from(role: Role) -> list[Role]:
+  # The enum is stored by name, so "at least" is matched as a set of names
+  return [member for member in Role if member >= role]
+
+def _page(statement, query: ListQuery | None, limit: int, offset: int):
+  if query:
+    statement = query.apply(statement)
+  # id_ppda breaks ties so pages don't overlap
+  return statement.order_by(Ppda.id_ppda).limit(limit).offset(offset)
+
+async def get_mine(
+  username: str,
+  session: sql.Session,
+  role: Role = Role.VIEWER,
+  columns: list | None = None,
+  query: ListQuery | None = None,
+  limit: int = 50,
+  offset: int = 0,
+):
+  """
+  Retrieves a page of the ppda of the institutions the user belongs to.
+
+  The memberships are joined in the same statement, so the plans are read
+  with one query instead of one per membership.
+
+  Args:
+      username (str): Username of the caller (the token's ``sub``).
+      session (Session): Database session for operations.
+      role (Role): Only institutions where the user has at least this role.
+      columns (list | None): Only select these Ppda columns (``fields=``).
+      query (ListQuery | None): Filters and sort order from the query string.
+      limit (int): Maximum number of ppda.
+      offset (int): Number of ppda to skip.
+
+  Returns:
+      List[Ppda]: The page of ppda, as result rows with the Ppda columns.
+  """
+  statement = table_select(Ppda, columns).\
+      join(UserInstitution, UserInstitution.id_institution == Ppda.id_institution).\
+      join(User, User.id_user == UserInstitution.id_user).\
+      where(User.username == username, UserInstitution.role.in_(_roles_from(role)))
+  return session.exec(_page(statement, query, limit, offset)).all()
+
+async def get_by_institution(
+  id_institution: str,
+  username: str,
+  session: sql.Session,
+  columns: list | None = None,
+  query: ListQuery | None = None,
+  limit: int = 50,
+  offset: int = 0,
+):
+  """
+  Retrieves a page of the ppda of an institution, if the user is an admin
+  or a member of it.
+
+  The membership check is an EXISTS in the same statement; it is only run
+  on its own when the page is empty, to tell "no ppda" from "no access".
+
+  Args:
+      id_institution (str): The UUID of the institution.
+      username (str): Username of the caller (the token's ``sub``).
+      session (Session): Database session for operations.
+      columns (list | None): Only select these Ppda columns (``fields=``).
+      query (ListQuery | None): Filters and sort order from the query string.
+      limit (int): Maximum number of ppda.
+      offset (int): Number of ppda to skip.
+
+  Returns:
+      List[Ppda]: The page of ppda, as result rows with the Ppda columns.
+
+  Raises:
+      HTTPException: 403 if the user is not a member of the institution.
+  """
+  access = sql.select(User.id_user).\
+      outerjoin(UserInstitution, sql.and_(
+        UserInstitution.id_user == User.id_user,
+        UserInstitution.id_institution == id_institution
+      )).\
+      where(User.username == username, sql.or_(User.is_admin, UserInstitution.id_user.is_not(None)))
+  statement = table_select(Ppda, columns).\
+      where(Ppda.id_institution == id_institution, access.exists())
+  ppda = session.exec(_page(statement, query, limit, offset)).all()
+  if not ppda and session.exec(access).first() is None:
+    raise HTTPException(
+      status_code=status.HTTP_403_FORBIDDEN,
+      detail="User in not member of all required institutions"
+    )
+  return ppda
+
 async def get_by_id(id:str, session : sql.Session):
   """
   Get a single ppda by its ID.
@@ -46,31 +176,30 @@ async def create_ppda(ppda: PpdaCreate, session: sql.Session):
   new_ppda = Ppda(**ppda.model_dump())
   session.add(new_ppda)
   session.commit()
-  session.refresh(new_ppda)
   return new_ppda
 
-async def update_ppda(ppda: Ppda, session: sql.Session):
+async def update_ppda(id: str, ppda: PpdaUpdate, session: sql.Session):
   """
   Updates an existing ppda in the database.
   
   Args:
       id (str): The UUID of the ppda to update.
-      ppda (Ppda): The updated ppda object.
+      ppda (PpdaUpdate): The updated ppda fields.
       session (Session): Database session for operations.
   
   Returns:
       Ppda: The updated ppda object.
+
+  Raises:
+      HTTPException: 404 if ppda not found.
   """
-  db_ppda = await get_by_id(ppda.id_ppda, session)
-  if not db_ppda:
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ppda not found")
-  statement = sql.select(Ppda).\
-      where(Ppda.id_ppda == ppda.id_ppda)
-  existing_ppda = session.exec(statement).first()
-  existing_ppda.id_institution = ppda.id_institution
-  session.commit()
-  session.refresh(existing_ppda)
-  return existing_ppda
+  return update_returning(
+    Ppda,
+    Ppda.id_ppda == id,
+    ppda.model_dump(exclude_unset=True),
+    session,
+    not_found_detail="Ppda not found"
+  )
 
 async def delete_ppda(id: str, session: sql.Session):
   """
@@ -82,13 +211,9 @@ async def delete_ppda(id: str, session: sql.Session):
   
   Returns:
       dict: Confirmation message.
+
+  Raises:
+      HTTPException: 404 if ppda not found.
   """
-  db_ppda = await get_by_id(id, session)
-  if not db_ppda:
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ppda not found")
-  statement = sql.select(Ppda).\
-      where(Ppda.id_ppda == id)
-  ppda = session.exec(statement).first()
-  session.delete(ppda)
-  session.commit()
+  delete_returning(Ppda, Ppda.id_ppda == id, session, not_found_detail="Ppda not found")
   return {"message": "Ppda deleted successfully"}
\ No newline at end of file
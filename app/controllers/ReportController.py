@@ -1,18 +1,25 @@
 import sqlmodel as sql
 from fastapi import HTTPException, status
 from app.models.Report import Report
+from app.utils.mutations import delete_returning, update_returning
+from app.utils.responses import json_rows_response, sql_json_available, table_select
 
-async def get_all(session: sql.Session):
+def _list(session: sql.Session, statement, stream_json: bool):
+    """Rows of a report listing, or on PostgreSQL the JSON built and streamed by the database."""
+    if stream_json and sql_json_available(session, statement):
+        return json_rows_response(session, statement)
+    return session.exec(statement).all()
+
+async def get_all(session: sql.Session, stream_json: bool = True):
     """
     Retrieve all reports from the database.
     Args:
         session (sql.Session): Database session for operations.
+        stream_json (bool): Allow the PostgreSQL JSON response.
     Returns:
-        List[Report]: List of all report objects.
+        List[Report]: All reports, as result rows with the Report columns.
     """
-    statement = sql.select(Report)
-    reports = session.exec(statement).all()
-    return reports
+    return _list(session, table_select(Report), stream_json)
 
 async def get_by_id(id: str, session: sql.Session):
     """
@@ -43,7 +50,6 @@ async def create_report(report_data, session: sql.Session):
     report = Report(**report_data.model_dump()) if hasattr(report_data, 'model_dump') else Report(**dict(report_data))
     session.add(report)
     session.commit()
-    session.refresh(report)
     return report
 
 async def update_report(id: str, report_data, session: sql.Session):
@@ -58,16 +64,8 @@ async def update_report(id: str, report_data, session: sql.Session):
     Raises:
         HTTPException: 404 if report is not found.
     """
-    statement = sql.select(Report).where(Report.id_report == id)
-    report = session.exec(statement).first()
-    if not report:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
     update_dict = report_data.model_dump(exclude_unset=True) if hasattr(report_data, 'model_dump') else dict(report_data)
-    for key, value in update_dict.items():
-        setattr(report, key, value)
-    session.commit()
-    session.refresh(report)
-    return report
+    return update_returning(Report, Report.id_report == id, update_dict, session, not_found_detail="Report not found")
 
 async def delete_report(id: str, session: sql.Session):
     """
@@ -80,22 +78,18 @@ async def delete_report(id: str, session: sql.Session):
     Raises:
         HTTPException: 404 if report is not found.
     """
-    statement = sql.select(Report).where(Report.id_report == id)
-    report = session.exec(statement).first()
-    if not report:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
-    session.delete(report)
-    session.commit()
+    delete_returning(Report, Report.id_report == id, session, not_found_detail="Report not found")
     return {"detail": "Report deleted", "id": id}
 
-async def get_by_action(id_action: str, session: sql.Session):
+async def get_by_action(id_action: str, session: sql.Session, stream_json: bool = True):
     """
     Get all reports for a given action.
     Args:
         id_action (str): The action ID to filter reports.
         session (sql.Session): Database session for operations.
+        stream_json (bool): Allow the PostgreSQL JSON response.
     Returns:
-        List[Report]: List of reports associated with the given action ID.
+        List[Report]: Reports of the action, as result rows with the Report columns.
     """
-    statement = sql.select(Report).where(Report.id_action == id_action)
-    return session.exec(statement).all()
+    statement = table_select(Report).where(Report.id_action == id_action)
+    return _list(session, statement, stream_json)
@@ -0,0 +1,36 @@
+import sqlmodel as sql
+from app.models.Search import SearchPage, SearchResult
+from app.utils.search import SEARCH_SOURCES, count_statement, get_index, search_statement
+
+async def search(q: str, session: sql.Session, kinds: list[str] | None = None, limit: int = 20, offset: int = 0) -> SearchPage:
+    """
+    Full-text search over PPDAs (name, description, municipality) and
+    institutions (name), ranked by relevance.
+
+    On PostgreSQL the query runs against the GIN indexed tsvector documents;
+    elsewhere against an in-process inverted index of the same columns.
+
+    Args:
+        q (str): Words to look for, in web search syntax on PostgreSQL
+            ("quoted phrases", -excluded).
+        session (Session): Database session for operations.
+        kinds (list[str] | None): Restrict to "ppda" and/or "institution".
+        limit (int): Page size.
+        offset (int): Results to skip.
+
+    Returns:
+        SearchPage: The requested page and the total number of matches.
+    """
+    kinds = [kind for kind in SEARCH_SOURCES if not kinds or kind in kinds]
+    if session.get_bind().dialect.name == "postgresql":
+        rows = session.execute(search_statement(kinds), {"q": q, "limit": limit, "offset": offset}).all()
+        if rows:
+            total = rows[0].total
+        else:
+            # Past the last hit the page has no rows to read the total from
+            total = session.execute(count_statement(kinds), {"q": q}).scalar() if offset else 0
+        results = [SearchResult(kind=row.kind, id=row.id, title=row.title, rank=row.rank) for row in rows]
+    else:
+        total, hits = get_index(session).search(q, kinds, limit, offset)
+        results = [SearchResult(**hit._asdict()) for hit in hits]
+    return SearchPage(total=total, limit=limit, offset=offset, results=results)
@@ -38,7 +38,6 @@ def create_user(user: UserCreate, session: Session):
     new_user = User.model_validate(user)
     session.add(new_user)
     session.commit()
-    session.refresh(new_user)
     return new_user
 
 def get_all(session : Session):
@@ -1,8 +1,43 @@
 from fastapi import HTTPException, status
 import sqlmodel as sql
+from sqlalchemy.exc import IntegrityError
 
-from app.controllers import InstitutionController, UserController
-from app.models import UserInstitution, UserInstitutionPublic, UserInstitutionCreate, UserInstitutionUpdate
+from app.controllers import InstitutionController
+from app.models import Institution, User, UserInstitution, UserInstitutionPublic, UserInstitutionCreate, UserInstitutionUpdate
+from app.models.Search import Suggestion
+from app.utils.autocomplete import suggest
+from app.utils.mutations import dialect_insert, is_foreign_key_violation, update_returning
+
+def _to_public(user_institution) -> UserInstitutionPublic:
+  return UserInstitutionPublic(
+    id_user = user_institution.id_user,
+    id_institution = user_institution.id_institution,
+    is_active = user_institution.is_active,
+    role = user_institution.role
+  )
+
+def _raise_missing(id_user : str, id_institution : str, session : sql.Session, conflict_detail : str | None = None):
+  """
+  Explains why a membership statement matched no row.
+
+  Only runs on the failure path, so the happy path keeps a single statement.
+
+  Raises:
+      HTTPException: 404 if the user or institution is not found
+      HTTPException: 409 with ``conflict_detail`` if both exist and it is given
+      HTTPException: 404 if the user-institution relationship does not exist
+  """
+  user_exists, institution_exists = session.exec(
+    sql.select(
+      sql.select(User.id_user).where(User.id_user == id_user).exists(),
+      sql.select(Institution.id_institution).where(Institution.id_institution == id_institution).exists()
+    )
+  ).one()
+  if not user_exists or not institution_exists:
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User or institution not found")
+  if conflict_detail:
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=conflict_detail)
+  raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User-institution relationship not found")
 
 async def get_all(session : sql.Session):
   """
@@ -49,24 +84,23 @@ async def get_by_ids(id_user : str, id_institution : str, session : sql.Session)
   Raises:
       HTTPException: 404 if the user or institution is not found
   """
-  user = UserController.get_by_id(id_user, session)
-  institution = await InstitutionController.get_by_id(id_institution, session)
-  if not user or not institution:
+  row = session.exec(
+    sql.select(User.id_user, UserInstitution)
+    .select_from(User)
+    .join(Institution, Institution.id_institution == id_institution)
+    .outerjoin(UserInstitution, sql.and_(
+      UserInstitution.id_user == User.id_user,
+      UserInstitution.id_institution == Institution.id_institution
+    ))
+    .where(User.id_user == id_user)
+  ).first()
+  if not row:
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User or institution not found")
   
-  statement = sql.select(
-    UserInstitution,
-  ).where(UserInstitution.id_user == id_user).where(UserInstitution.id_institution == id_institution)
-  user_institution = session.exec(statement).first()
+  _, user_institution = row
   if not user_institution:
     return None
-  user_institution = UserInstitutionPublic(
-    id_user = user_institution.id_user,
-    id_institution = user_institution.id_institution,
-    is_active = user_institution.is_active,
-    role = user_institution.role
-  )
-  return user_institution
+  return _to_public(user_institution)
 
 async def get_by_user(id_user : str, session : sql.Session):
   """
@@ -127,7 +161,7 @@ async def get_by_institution(id_institution : str, session : sql.Session):
       id_user = user_intitution.id_user,
       id_institution = user_intitution.id_institution,
       is_active = user_intitution.is_active,
-      role = user_intitution.user_rol_name
+      role = user_intitution.role
     ) for (user_intitution) in user_institution_list
   ]
   return user_institution_list
@@ -152,25 +186,43 @@ async def create(user_institution: UserInstitutionCreate, session : sql.Session)
       HTTPException: 404 if the user or institution is not found
       HTTPException: 409 if the user-institution relationship already exists
   """
-  user = UserController.get_by_id(user_institution.id_user, session)
-  institution = await InstitutionController.get_by_id(user_institution.id_institution, session)
-  if not user or not institution:
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User or institution not found")
-  
-  user_institution_db = await get_by_ids(user_institution.id_user, user_institution.id_institution, session)
-  if user_institution_db:
-    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="User-institution relationship already exists")
-  
-  new_user_institution = UserInstitution()
-  new_user_institution.id_user = user_institution.id_user
-  new_user_institution.id_institution = user_institution.id_institution
-  new_user_institution.id_user_rol = user_institution.id_user_rol
-  session.add(new_user_institution)
+  role_type = UserInstitution.__table__.c.role.type
+  statement = dialect_insert(UserInstitution, session).from_select(
+    ["id_user", "id_institution", "role", "is_active"],
+    sql.select(
+      User.id_user,
+      Institution.id_institution,
+      sql.literal(user_institution.role, role_type),
+      sql.true()
+    ).select_from(User).join(
+      Institution, Institution.id_institution == user_institution.id_institution
+    ).where(User.id_user == user_institution.id_user)
+  ).on_conflict_do_nothing(
+    index_elements=["id_user", "id_institution"]
+  ).returning(
+    UserInstitution.id_user,
+    UserInstitution.id_institution,
+    UserInstitution.is_active,
+    UserInstitution.role
+  )
+  try:
+    created = session.exec(statement).first()
+  except IntegrityError as e:
+    session.rollback()
+    if is_foreign_key_violation(e):
+      raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User or institution not found") from e
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="User-institution relationship already exists") from e
+
+  if not created:
+    session.rollback()
+    _raise_missing(
+      user_institution.id_user,
+      user_institution.id_institution,
+      session,
+      conflict_detail="User-institution relationship already exists"
+    )
   session.commit()
-  session.refresh(new_user_institution)
-  
-  user_institution = await get_by_ids(user_institution.id_user, user_institution.id_institution, session)
-  return user_institution
+  return _to_public(created)
 
 async def delete(id_user : str, id_institution : str, session : sql.Session):
   """
@@ -191,19 +243,15 @@ async def delete(id_user : str, id_institution : str, session : sql.Session):
       HTTPException: 404 if the user or institution is not found
       HTTPException: 404 if the user-institution relationship does not exist
   """
-  user = UserController.get_by_id(id_user, session)
-  institution = await InstitutionController.get_by_id(id_institution, session)
-  if not user or not institution:
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User or institution not found")
-  
-  user_institution = session.exec(
-    sql.select(UserInstitution).\
+  deleted = session.exec(
+    sql.delete(UserInstitution).\
       where(UserInstitution.id_user == id_user).\
-      where(UserInstitution.id_institution == id_institution)
-    ).first()
-  if not user_institution:
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User-institution relationship not found")
-  session.delete(user_institution)
+      where(UserInstitution.id_institution == id_institution).\
+      returning(UserInstitution.id_user)
+  ).first()
+  if not deleted:
+    session.rollback()
+    _raise_missing(id_user, id_institution, session)
   session.commit()
   return {
     "message": "User-institution relationship deleted successfully"
@@ -229,17 +277,35 @@ async def update(user_institution: UserInstitutionUpdate, session : sql.Session)
       HTTPException: 404 if the user-institution relationship is not found.
   """
 
-  user_institution_db = session.exec(
-    sql.select(UserInstitution).\
-      where(UserInstitution.id_user == user_institution.id_user).\
-      where(UserInstitution.id_institution == user_institution.id_institution)
-  ).first()
-  if not user_institution_db:
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User-institution relationship not found")
-  
-  updated_user_institution = user_institution.model_dump(exclude_unset=True)
-  user_institution_db.sqlmodel_update(updated_user_institution)
-  session.add(user_institution_db)
-  session.commit()
-  session.refresh(user_institution_db)
-  return user_institution_db
\ No newline at end of file
+  changes = user_institution.model_dump(exclude_unset=True, exclude_none=True, exclude={"id_user", "id_institution"})
+  return update_returning(
+    UserInstitution,
+    sql.and_(
+      UserInstitution.id_user == user_institution.id_user,
+      UserInstitution.id_institution == user_institution.id_institution
+    ),
+    changes,
+    session,
+    not_found_detail="User-institution relationship not found"
+  )
+
+async def autocomplete(source : str, prefix : str, limit : int, session : sql.Session):
+  """
+  Type-ahead for assigning users to institutions.
+
+  Matches the start of usernames and emails ("users") or institution names
+  ("institutions"), ignoring case. Hot prefixes are answered from memory;
+  the rest with an index range scan.
+
+  Args:
+      source (str): "users" or "institutions".
+      prefix (str): What has been typed so far.
+      limit (int): Maximum number of suggestions.
+
+  Returns:
+      List[Suggestion]: Matches ordered by the matched value.
+  """
+  return [
+    Suggestion(id=match.id, label=match.label, detail=match.detail)
+    for match in suggest(session, source, prefix, limit)
+  ]
@@ -44,7 +44,6 @@ async def create_variable(variable_data: VariableBase, session: sql.Session) ->
     variable = Variable(**variable_data.model_dump())
     session.add(variable)
     session.commit()
-    session.refresh(variable)
     return variable
 
 async def update_variable(id: str, variable_data: VariableBase, session: sql.Session) -> Variable:
@@ -64,7 +63,6 @@ async def update_variable(id: str, variable_data: VariableBase, session: sql.Ses
         setattr(variable, key, value)
     session.add(variable)
     session.commit()
-    session.refresh(variable)
     return variable
 
 async def delete_variable(id: str, session: sql.Session) -> dict:
@@ -1,13 +1,85 @@
 import os
+from contextvars import ContextVar
+from inspect import iscoroutinefunction
 from dotenv import load_dotenv
+from fastapi import Request
+from fastapi.routing import APIRoute
+from limits.storage import storage_from_string
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.dml import UpdateBase
+from starlette.concurrency import run_in_threadpool
 from sqlmodel import SQLModel, create_engine, Session
 
+from app.utils.clients import client_key
+from app.utils.schema import check_schema
+
 load_dotenv()
 
 engine = None
+# Réplica de solo lectura opcional (DATABASE_REPLICA_URL)
+replica_engine = None
+# Segundos que un cliente sigue leyendo del primario después de escribir
+replica_sticky_seconds = int(os.getenv("DATABASE_REPLICA_STICKY_SECONDS", "5"))
+# Marcas de escritura por cliente, compartidas entre workers como los contadores de rate limit
+replica_sticky_storage = None
 
-def init_db():
-    global engine
+
+class RoutingSession(Session):
+    """
+    Sesión que envía las consultas SELECT de las peticiones de lectura a la
+    réplica y todo lo demás al primario.
+
+    En cuanto la sesión escribe (flush o INSERT/UPDATE/DELETE) el resto de sus
+    consultas van al primario, para no leer datos que la réplica aún no tiene.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["wrote"] = True
+        elif (
+            replica_engine is not None
+            and not self.info.get("wrote")
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+            and self._reads_from_replica()
+        ):
+            return replica_engine
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+    def _reads_from_replica(self) -> bool:
+        """Consulta la marca de escritura del cliente en la primera lectura y la guarda."""
+        if "read_only" not in self.info:
+            request = self.info.get("request")
+            self.info["read_only"] = request is not None and reads_from_replica(request)
+        return self.info["read_only"]
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _stick_to_primary(session):
+    """Tras confirmar una escritura, el cliente lee del primario durante la ventana configurada."""
+    request = session.info.get("request")
+    if session.info.get("wrote") and request is not None and replica_sticky_storage is not None:
+        replica_sticky_storage.incr(
+            f"replica-sticky:{client_key(request)}", replica_sticky_seconds, elastic_expiry=True
+        )
+
+
+def reads_from_replica(request: Request) -> bool:
+    """Indica si las consultas de la petición pueden ir a la réplica."""
+    if replica_engine is None or request.method not in ("GET", "HEAD"):
+        return False
+    return replica_sticky_storage.get(f"replica-sticky:{client_key(request)}") == 0
+
+
+# Sesiones de una petición: los objetos confirmados conservan sus valores
+# tras commit() (no hace falta refresh() ni se recargan al serializar) y el
+# flush solo ocurre en commit() o cuando el controlador lo pide explícitamente.
+SessionLocal = sessionmaker(class_=RoutingSession, expire_on_commit=False, autoflush=False)
+
+def create_db_engine():
+    """Crea el engine del primario a partir de las variables DATABASE_*."""
     db = os.getenv("DATABASE")
 
     if db == "sqlite": # Use SQLite for testing
@@ -20,12 +92,124 @@ def init_db():
         db_sslmode = os.getenv("DATABASE_SSLMODE")
         db_url = f"{db}://{db_user}:{db_password}@{db_host}/{db_name}?sslmode={db_sslmode}"
 
-    engine = create_engine(db_url, connect_args={"check_same_thread": False} if db == "sqlite" else {})
-    SQLModel.metadata.create_all(engine, checkfirst=True)
+    return create_engine(db_url, connect_args={"check_same_thread": False} if db == "sqlite" else {})
+
+
+def init_db():
+    global engine
+    engine = create_db_engine()
+    if os.getenv("DATABASE") == "sqlite":
+        # La base en memoria nace vacía en cada proceso
+        SQLModel.metadata.create_all(engine)
+    else:
+        # El esquema lo crean Alembic o `python -m app.cli create-schema`;
+        # aquí solo se compara la versión con una consulta
+        check_schema(engine)
+    init_replica(os.getenv("DATABASE_REPLICA_URL"))
+
+
+def init_replica(replica_url: str | None):
+    """Configura la réplica de lectura, o la desactiva si no hay URL."""
+    global replica_engine, replica_sticky_storage
+    if not replica_url:
+        replica_engine = None
+        replica_sticky_storage = None
+        return
+    replica_engine = create_engine(
+        replica_url,
+        connect_args={"check_same_thread": False} if replica_url.startswith("sqlite") else {}
+    )
+    replica_sticky_storage = storage_from_string(
+        os.getenv("DATABASE_REPLICA_STICKY_STORAGE_URI", os.getenv("RATE_LIMIT_STORAGE_URI", "memory://"))
+    )
+
+
+# Sesiones perezosas entregadas durante la petición en curso
+_request_sessions: ContextVar[list | None] = ContextVar("request_sessions", default=None)
+
+
+class LazySession:
+    """
+    Proxy de ``Session`` que solo la crea (y toma una conexión del pool) la
+    primera vez que se usa.
+
+    Las peticiones que fallan en la autenticación o en la validación antes de
+    consultar la base nunca abren una sesión.
+    """
+
+    def __init__(self, bind, info: dict | None = None):
+        self._bind = bind
+        self._info = info or {}
+        self._session = None
+
+    def __getattr__(self, name):
+        if self._session is None:
+            self._session = SessionLocal(bind=self._bind, info=dict(self._info))
+        return getattr(self._session, name)
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None
+
+    def release(self):
+        """Cierra la sesión y devuelve su conexión al pool, si llegó a abrirse."""
+        if self._session is not None:
+            session, self._session = self._session, None
+            session.close()
+
+
+def release_request_sessions():
+    """Libera las sesiones entregadas durante la petición en curso."""
+    for session in _request_sessions.get() or ():
+        session.release()
+
+
+class SessionRoute(APIRoute):
+    """
+    Ruta que libera la sesión de la petición apenas termina el endpoint.
+
+    FastAPI cierra las dependencias con ``yield`` después de serializar la
+    respuesta; con esta clase la conexión vuelve al pool antes de serializar.
+    Los controladores devuelven objetos ya cargados (``expire_on_commit=False``),
+    así que la serialización no necesita la sesión.
+    """
+
+    def get_route_handler(self):
+        endpoint = self.dependant.call
+
+        async def call(**values):
+            try:
+                if iscoroutinefunction(endpoint):
+                    return await endpoint(**values)
+                return await run_in_threadpool(endpoint, **values)
+            finally:
+                release_request_sessions()
+
+        self.dependant.call = call
+        handler = super().get_route_handler()
+
+        async def route_handler(request):
+            token = _request_sessions.set([])
+            try:
+                return await handler(request)
+            finally:
+                release_request_sessions()
+                _request_sessions.reset(token)
+
+        return route_handler
 
 
-def get_session():
+def get_session(request: Request):
     if engine is None:
         raise RuntimeError("DB engine not initialized. Call init_db() first.")
-    with Session(engine) as session:
-        yield session
\ No newline at end of file
+    # La réplica se decide en la primera lectura, no al abrir la sesión:
+    # las peticiones que no consultan la base no tocan las marcas de escritura
+    info = {"request": request} if replica_engine is not None else {}
+    session = LazySession(engine, info)
+    sessions = _request_sessions.get()
+    if sessions is not None:
+        sessions.append(session)
+    try:
+        yield session
+    finally:
+        session.release()
\ No newline at end of file
@@ -1,17 +1,19 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware import Middleware
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 from slowapi.middleware import SlowAPIMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 import os
 from dotenv import load_dotenv
 
-from app.routes import InstitutionType, User, Institution, Ppda, Auth, UserInstitution, Report, DeadLine, History, Kpi, Variable, ActionType, Action
+from app.routes import InstitutionType, User, Institution, Ppda, Auth, UserInstitution, Report, DeadLine, History, Kpi, Variable, ActionType, Action, Search
 from app.utils.docs import tags_metadata
+from app.utils.openapi import install_openapi
 from app.db import init_db
+from app.utils import rate_limit
+from app.utils.compression import CompressionMiddleware
 
 load_dotenv()
 init_db()
@@ -32,6 +34,7 @@ middleware = [
 
 app = FastAPI(
   middleware=middleware,
+  default_response_class=ORJSONResponse,
   openapi_tags=tags_metadata
 )
 
@@ -48,21 +51,31 @@ app.include_router(Kpi.router)
 app.include_router(Variable.router)
 app.include_router(ActionType.router)
 app.include_router(Action.router)
+app.include_router(Search.router)
 
 
-# this defines a max; if a router sets a limit less than this one, then
-# the router limit prevails. if a router sets a limit higher than this one,
-# the default prevails.
-limiter = Limiter(key_func=get_remote_address, default_limits=[os.getenv("RATE_LIMIT")])
+# one budget per client shared by every route; a limit declared on a router
+# is checked in addition to it. each request consumes the cost of its route
+# (see app.utils.rate_limit) and is keyed by the JWT subject or the client address.
+limiter = rate_limit.WeightedLimiter(
+  application_limits=[os.getenv("RATE_LIMIT")],
+  storage_uri=rate_limit.storage_uri,
+  strategy=rate_limit.strategy,
+)
 
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(SlowAPIMiddleware)
+# outermost: compresses every response, including rate-limit errors
+app.add_middleware(CompressionMiddleware)
 
 @app.get("/")
 async def root():
   return {"message": "You should not be seeing this"}
 
+# /openapi.json is served from the document generated at build time
+install_openapi(app)
+
 if __name__ == "__main__":
   import uvicorn
   uvicorn.run(app)
\ No newline at end of file
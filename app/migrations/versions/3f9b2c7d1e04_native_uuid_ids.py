@@ -0,0 +1,77 @@
+"""[perf] Store UUID ids as native uuid columns
+
+Revision ID: 3f9b2c7d1e04
+Revises: 7da3ee564779
+Create Date: 2026-10-19 10:12:41.530217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9b2c7d1e04'
+down_revision: Union[str, None] = '7da3ee564779'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Primary keys and every foreign key pointing at them
+UUID_COLUMNS = {
+    'user': ['id_user'],
+    'institution': ['id_institution'],
+    'ppda': ['id_ppda', 'id_institution'],
+    'action': ['id_action', 'id_ppda', 'id_user'],
+    'deadline': ['id_deadline', 'id_action'],
+    'message': ['id_message', 'id_deadline'],
+    'kpi': ['id_kpi', 'id_action'],
+    'variable': ['id_variable', 'id_kpi'],
+    'report': ['id_report', 'id_action'],
+    'history': ['id_history', 'id_report', 'id_variable'],
+    'refresh_token': ['id_token', 'id_user'],
+    'user_institution': ['id_user', 'id_institution'],
+}
+
+
+def _convert(target_type: str, using: str) -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # Other databases keep ids as text
+        return
+
+    inspector = sa.inspect(bind)
+    foreign_keys = [
+        (table, fk)
+        for table in UUID_COLUMNS
+        for fk in inspector.get_foreign_keys(table)
+        if fk['referred_table'] in UUID_COLUMNS
+    ]
+    for table, fk in foreign_keys:
+        op.drop_constraint(fk['name'], table, type_='foreignkey')
+
+    for table, columns in UUID_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f'ALTER TABLE "{table}" ALTER COLUMN "{column}" '
+                f'TYPE {target_type} USING "{column}"::{using}'
+            )
+
+    for table, fk in foreign_keys:
+        op.create_foreign_key(
+            fk['name'],
+            table,
+            fk['referred_table'],
+            fk['constrained_columns'],
+            fk['referred_columns'],
+            **fk.get('options', {}),
+        )
+
+
+def upgrade() -> None:
+    _convert('uuid', 'uuid')
+
+
+def downgrade() -> None:
+    _convert('varchar', 'text')
@@ -0,0 +1,58 @@
+"""[perf] Full-text search indexes on ppda and institution
+
+Revision ID: 5d2f8e61c3a9
+Revises: e41c7a9b2f05
+Create Date: 2026-10-19 13:48:07.251396
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8e61c3a9'
+down_revision: Union[str, None] = 'e41c7a9b2f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_CONFIG = 'es_unaccent'
+# index name -> (table, document); app.utils.search.document_sql builds the same expressions
+SEARCH_INDEXES = {
+    'ix_ppda_search': (
+        'ppda',
+        "to_tsvector('es_unaccent', coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || coalesce(municipality, ''))",
+    ),
+    'ix_institution_search': (
+        'institution',
+        "to_tsvector('es_unaccent', coalesce(institution_name, ''))",
+    ),
+}
+
+
+def upgrade() -> None:
+    # Spanish stemming on unaccented words, GIN indexes on the searched text.
+    # SQLite searches with an in-process inverted index instead.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # As a configuration (not a call to unaccent()) it can be used in index expressions
+    op.execute(f"CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = spanish)")
+    op.execute(
+        f"ALTER TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} "
+        "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem"
+    )
+    for name, (table, document) in SEARCH_INDEXES.items():
+        op.execute(f"CREATE INDEX {name} ON {table} USING gin ({document})")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name in SEARCH_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.execute(f"DROP TEXT SEARCH CONFIGURATION IF EXISTS {SEARCH_CONFIG}")
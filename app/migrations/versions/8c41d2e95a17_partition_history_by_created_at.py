@@ -0,0 +1,80 @@
+"""[perf] Partition history by created_at
+
+Revision ID: 8c41d2e95a17
+Revises: 3f9b2c7d1e04
+Create Date: 2026-10-19 11:02:18.904113
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d2e95a17'
+down_revision: Union[str, None] = '3f9b2c7d1e04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months of partitions created ahead of the current one; later months are
+# added by `python -m app.cli ensure-history-partitions`
+PARTITIONS_AHEAD = 3
+
+
+def _month(index: int) -> datetime:
+    """First instant (UTC) of month number ``index`` (year * 12 + month - 1)."""
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _create_monthly_partitions(first: datetime) -> None:
+    # Named history_y<YYYY>m<MM>, the names app.utils.partitions looks for
+    now = datetime.now(timezone.utc)
+    for index in range(first.year * 12 + first.month - 1, now.year * 12 + now.month + PARTITIONS_AHEAD):
+        lower, upper = _month(index), _month(index + 1)
+        op.execute(
+            f"CREATE TABLE history_y{lower.year}m{lower.month:02d} PARTITION OF history_partitioned "
+            f"FOR VALUES FROM ({int(lower.timestamp())}) TO ({int(upper.timestamp())})"
+        )
+
+
+def _add_constraints(primary_key: list[str]) -> None:
+    op.create_primary_key('history_pkey', 'history', primary_key)
+    op.create_foreign_key('history_id_report_fkey', 'history', 'report', ['id_report'], ['id_report'])
+    op.create_foreign_key('history_id_variable_fkey', 'history', 'variable', ['id_variable'], ['id_variable'])
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    # The partition key cannot be NULL
+    op.execute("UPDATE history SET created_at = COALESCE(updated_at, 0) WHERE created_at IS NULL")
+    first = bind.execute(sa.text("SELECT min(created_at) FROM history WHERE created_at > 0")).scalar()
+
+    op.execute("CREATE TABLE history_partitioned (LIKE history INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)")
+    op.execute("ALTER TABLE history_partitioned ALTER COLUMN created_at SET NOT NULL")
+    op.execute("CREATE TABLE history_default PARTITION OF history_partitioned DEFAULT")
+    # Monthly partitions from the oldest reading up to a few months ahead,
+    # created empty so the copy routes each row to its month; anything
+    # outside them stays in history_default.
+    _create_monthly_partitions(datetime.fromtimestamp(first, timezone.utc) if first else datetime.now(timezone.utc))
+    op.execute("INSERT INTO history_partitioned SELECT * FROM history")
+    op.drop_table('history')
+    op.execute("ALTER TABLE history_partitioned RENAME TO history")
+    _add_constraints(['id_history', 'created_at'])
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE TABLE history_plain (LIKE history INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO history_plain SELECT * FROM history")
+    op.execute("DROP TABLE history CASCADE")
+    op.execute("ALTER TABLE history_plain RENAME TO history")
+    op.alter_column('history', 'created_at', nullable=True)
+    _add_constraints(['id_history'])
@@ -0,0 +1,39 @@
+"""[perf] Prefix indexes for user and institution autocomplete
+
+Revision ID: a63e0d9c4b18
+Revises: 5d2f8e61c3a9
+Create Date: 2026-10-19 14:31:26.804519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a63e0d9c4b18'
+down_revision: Union[str, None] = '5d2f8e61c3a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# index name -> (table, column); declared on the models as well
+PREFIX_INDEXES = {
+    'ix_user_username_prefix': ('user', 'username'),
+    'ix_user_email_prefix': ('user', 'email'),
+    'ix_institution_name_prefix': ('institution', 'institution_name'),
+}
+
+
+def upgrade() -> None:
+    # text_pattern_ops lets PostgreSQL use the index for LIKE 'prefix%'
+    # whatever the database collation is
+    ops = ' text_pattern_ops' if op.get_bind().dialect.name == 'postgresql' else ''
+    for name, (table, column) in PREFIX_INDEXES.items():
+        op.execute(f'CREATE INDEX {name} ON "{table}" (lower({column}){ops})')
+
+
+def downgrade() -> None:
+    for name, (table, column) in PREFIX_INDEXES.items():
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,60 @@
+"""[perf] Generate created_at/updated_at in the database
+
+Revision ID: b7e3d0a4c912
+Revises: 8c41d2e95a17
+Create Date: 2026-10-19 12:20:36.118402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3d0a4c912'
+down_revision: Union[str, None] = '8c41d2e95a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMPED_TABLES = ['user', 'ppda', 'history', 'refresh_token']
+EPOCH_NOW = 'CAST(EXTRACT(EPOCH FROM now()) AS INTEGER)'
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        # SQLite is only used in memory and built from the models
+        return
+
+    # Keeps updated_at current for writes that do not go through the models;
+    # an UPDATE that sets updated_at explicitly keeps its value.
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+                NEW.updated_at := {EPOCH_NOW};
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TIMESTAMPED_TABLES:
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN created_at SET DEFAULT {EPOCH_NOW}')
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN updated_at SET DEFAULT {EPOCH_NOW}')
+        # On the partitioned history table the trigger is cloned to every partition
+        op.execute(
+            f'CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON "{table}" '
+            f'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in TIMESTAMPED_TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_set_updated_at ON "{table}"')
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN created_at DROP DEFAULT')
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN updated_at DROP DEFAULT')
+    op.execute('DROP FUNCTION IF EXISTS set_updated_at()')
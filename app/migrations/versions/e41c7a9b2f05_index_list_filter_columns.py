@@ -0,0 +1,37 @@
+"""[perf] Index the columns list routes filter and sort by
+
+Revision ID: e41c7a9b2f05
+Revises: b7e3d0a4c912
+Create Date: 2026-10-19 13:05:52.417730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41c7a9b2f05'
+down_revision: Union[str, None] = 'b7e3d0a4c912'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Whitelisted in app.utils.filters.list_query for /ppda and /deadline
+INDEXED_COLUMNS = {
+    'ppda': ['status', 'region', 'municipality', 'start_date', 'end_date'],
+    'deadline': ['deadline_date', 'year'],
+}
+
+
+def upgrade() -> None:
+    for table, columns in INDEXED_COLUMNS.items():
+        for column in columns:
+            op.create_index(op.f(f'ix_{table}_{column}'), table, [column], unique=False)
+
+
+def downgrade() -> None:
+    for table, columns in INDEXED_COLUMNS.items():
+        for column in columns:
+            op.drop_index(op.f(f'ix_{table}_{column}'), table_name=table)
@@ -0,0 +1,61 @@
+"""[perf] Bounding box and spatial index for ppda
+
+Revision ID: f20b6c8d5e37
+Revises: a63e0d9c4b18
+Create Date: 2026-10-19 15:12:44.630915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f20b6c8d5e37'
+down_revision: Union[str, None] = 'a63e0d9c4b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BBOX_COLUMNS = ('min_lon', 'min_lat', 'max_lon', 'max_lat')
+SQLITE_RTREE = 'ppda_rtree'
+# R*Tree keyed by the ppda rowid, kept in sync by triggers
+SQLITE_RTREE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS ppda_rtree USING rtree(id, min_lon, max_lon, min_lat, max_lat)",
+    "CREATE TRIGGER IF NOT EXISTS ppda_rtree_insert AFTER INSERT ON ppda WHEN NEW.min_lon IS NOT NULL BEGIN "
+    "INSERT INTO ppda_rtree VALUES (NEW.rowid, NEW.min_lon, NEW.max_lon, NEW.min_lat, NEW.max_lat); END",
+    "CREATE TRIGGER IF NOT EXISTS ppda_rtree_update AFTER UPDATE OF min_lon, min_lat, max_lon, max_lat ON ppda BEGIN "
+    "DELETE FROM ppda_rtree WHERE id = OLD.rowid; "
+    "INSERT INTO ppda_rtree SELECT NEW.rowid, NEW.min_lon, NEW.max_lon, NEW.min_lat, NEW.max_lat "
+    "WHERE NEW.min_lon IS NOT NULL; END",
+    "CREATE TRIGGER IF NOT EXISTS ppda_rtree_delete AFTER DELETE ON ppda BEGIN "
+    "DELETE FROM ppda_rtree WHERE id = OLD.rowid; END",
+]
+
+
+def upgrade() -> None:
+    for column in BBOX_COLUMNS:
+        op.add_column('ppda', sa.Column(column, sa.Float(), nullable=True))
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute(
+            "CREATE INDEX ix_ppda_bbox ON ppda USING gist "
+            "(box(point(min_lon, min_lat), point(max_lon, max_lat)))"
+        )
+    elif bind.dialect.name == 'sqlite' and bind.execute(sa.text("SELECT sqlite_compileoption_used('ENABLE_RTREE')")).scalar():
+        for statement in SQLITE_RTREE_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.drop_index('ix_ppda_bbox', table_name='ppda')
+    elif bind.dialect.name == 'sqlite':
+        op.execute(f"DROP TABLE IF EXISTS {SQLITE_RTREE}")
+        for trigger in ('insert', 'update', 'delete'):
+            op.execute(f"DROP TRIGGER IF EXISTS {SQLITE_RTREE}_{trigger}")
+    for column in reversed(BBOX_COLUMNS):
+        op.drop_column('ppda', column)
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Optional
-import uuid
 from sqlmodel import Relationship, SQLModel, Field
+from pydantic import field_validator
+from app.utils.ids import UUIDString, new_id, uuid_field
 
 if TYPE_CHECKING: 
   from app.models import ActionType, Ppda, DeadLine, Kpi, Report, User
@@ -13,9 +14,10 @@ class ActionBase(SQLModel):
         id_user (Optional[str]): Foreign key referencing the user who created this action
         id_action_type (Optional[int]): Foreign key referencing the type of action
     """
-    id_ppda : Optional[str] = Field(default=None, foreign_key="ppda.id_ppda")
-    id_user : Optional[str] = Field(default=None, foreign_key="user.id_user")
+    id_ppda : Optional[str] = Field(default=None, foreign_key="ppda.id_ppda", sa_type=UUIDString)
+    id_user : Optional[str] = Field(default=None, foreign_key="user.id_user", sa_type=UUIDString)
     id_action_type: Optional[int] = Field(default=None, foreign_key="action_type.id_action_type")
+    ids_must_be_uuids = field_validator("id_ppda", "id_user")(uuid_field)
   
 class Action(ActionBase, table=True):
     """Database model for actions within the PPDA system.
@@ -32,7 +34,7 @@ class Action(ActionBase, table=True):
         user (Optional[User]): Relationship to the user who created this action
     """
     __tablename__ = "action"
-    id_action: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, unique=True)
+    id_action: Optional[str] = Field(default_factory=new_id, sa_type=UUIDString, primary_key=True, unique=True)
  
     action_type : Optional["ActionType"] = Relationship(back_populates="action") 
     ppda : Optional["Ppda"] = Relationship(back_populates="actions")
@@ -65,6 +67,7 @@ class ActionUpdate(SQLModel):
     id_ppda : Optional[str]
     id_action_type: Optional[int]
     id_user : Optional[str]
+    ids_must_be_uuids = field_validator("id_ppda", "id_user")(uuid_field)
 
 class ActionPublic(SQLModel):
     """Model for public representation of actions.
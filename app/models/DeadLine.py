@@ -1,7 +1,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
-import uuid
 from sqlmodel import Field, Relationship, SQLModel
+from pydantic import field_validator
+from app.utils.ids import UUIDString, new_id, uuid_field
 
 if TYPE_CHECKING: from app.models import Action, Message
 
@@ -13,9 +14,10 @@ class DeadLineBase(SQLModel):
         id_action (Optional[str]): Foreign key referencing the action this deadline belongs to
         year (Optional[int]): The year associated with this deadline
     """
-    deadline_date: Optional[datetime] = Field(nullable=False)
-    id_action : Optional[str] = Field(default=None, foreign_key="action.id_action")
-    year : Optional[int] = Field(default=None)
+    deadline_date: Optional[datetime] = Field(nullable=False, index=True)
+    id_action : Optional[str] = Field(default=None, foreign_key="action.id_action", sa_type=UUIDString)
+    year : Optional[int] = Field(default=None, index=True)
+    ids_must_be_uuids = field_validator("id_action")(uuid_field)
   
 class DeadLine(DeadLineBase, table=True):
     """Database model for deadlines associated with actions.
@@ -28,7 +30,7 @@ class DeadLine(DeadLineBase, table=True):
         deadline_messages (list[Message]): List of messages related to this deadline
     """
     __tablename__ = "deadline"
-    id_deadline : Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, unique=True)
+    id_deadline : Optional[str] = Field(default_factory=new_id, sa_type=UUIDString, primary_key=True, unique=True)
     
     action : Optional["Action"] = Relationship(back_populates="deadlines")
     deadline_messages : list["Message"] = Relationship(back_populates="deadline")
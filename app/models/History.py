@@ -1,7 +1,8 @@
-import datetime
 from typing import TYPE_CHECKING, Optional
-import uuid
 from sqlmodel import Field, Relationship, SQLModel
+from pydantic import field_validator
+from app.utils.ids import UUIDString, new_id, uuid_field
+from app.utils.timestamps import created_at_kwargs, updated_at_kwargs
 
 if TYPE_CHECKING:
   from app.models import Report, Variable
@@ -16,11 +17,12 @@ class HistoryBase(SQLModel):
         created_at (int): UTC timestamp of when this record was created
         updated_at (int): UTC timestamp of when this record was last updated
     """
-    id_report : Optional[str] = Field(default=None, foreign_key="report.id_report")
-    id_variable : Optional[str] = Field(default=None, foreign_key="variable.id_variable")
+    id_report : Optional[str] = Field(default=None, foreign_key="report.id_report", sa_type=UUIDString)
+    id_variable : Optional[str] = Field(default=None, foreign_key="variable.id_variable", sa_type=UUIDString)
     value : Optional[str] = Field(default=None)
-    created_at : int = Field(nullable=True, default_factory=lambda: int(datetime.datetime.now(datetime.timezone.utc).timestamp()))
-    updated_at : int = Field(nullable=True, default_factory=lambda: int(datetime.datetime.now(datetime.timezone.utc).timestamp()), sa_column_kwargs={"onupdate": int(datetime.datetime.now(datetime.timezone.utc).timestamp())})
+    created_at : Optional[int] = Field(default=None, nullable=True, sa_column_kwargs=created_at_kwargs())
+    updated_at : Optional[int] = Field(default=None, nullable=True, sa_column_kwargs=updated_at_kwargs())
+    ids_must_be_uuids = field_validator("id_report", "id_variable")(uuid_field)
 
 class History(HistoryBase, table=True):
     """Database model for tracking historical values of variables in reports.
@@ -33,7 +35,12 @@ class History(HistoryBase, table=True):
         variable (Optional[Variable]): Relationship to the variable being tracked
     """
     __tablename__ = "history"
-    id_history : Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, unique=True)
+    # On PostgreSQL the table is range-partitioned by created_at, so the key
+    # must include it; rows are still identified by id_history alone.
+    # Timestamps come from the database and are read back with RETURNING.
+    __mapper_args__ = {"primary_key": ["id_history"], "eager_defaults": True}
+    id_history : Optional[str] = Field(default_factory=new_id, sa_type=UUIDString, primary_key=True)
+    created_at : Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs=created_at_kwargs())
     
     report : Optional["Report"] = Relationship(back_populates="history_list")
     variable : Optional["Variable"] = Relationship(back_populates="history_list")
\ No newline at end of file
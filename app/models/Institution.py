@@ -1,8 +1,9 @@
 
 from typing import TYPE_CHECKING, Optional
 from pydantic import field_validator
-import uuid
+from sqlalchemy import Index, func
 from sqlmodel import Field, Relationship, SQLModel
+from app.utils.ids import UUIDString, new_id
 
 if TYPE_CHECKING:
   from app.models import InstitutionType, UserInstitution, Ppda
@@ -29,12 +30,16 @@ class Institution(InstitutionBase, table=True):
   """
   __tablename__ = "institution"
   
-  id_institution: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
+  id_institution: Optional[str] = Field(default_factory=new_id, sa_type=UUIDString, primary_key=True)
   
   institution_type : Optional["InstitutionType"] = Relationship(back_populates="institution")
   user_institution_institution : list["UserInstitution"] = Relationship(back_populates="institution_user_institution")
   ppda_list : list["Ppda"] = Relationship(back_populates="institution")
   
+# Autocomplete: lower(institution_name) LIKE 'prefix%' as an index range scan on PostgreSQL
+Index("ix_institution_name_prefix", func.lower(Institution.__table__.c.institution_name).label("institution_name_lower"),
+      postgresql_ops={"institution_name_lower": "text_pattern_ops"})
+
 class InstitutionCreate(InstitutionBase):
   """
   Model for creating new institutions with validation.
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Optional
-import uuid
 from sqlmodel import Field, Relationship, SQLModel
+from pydantic import field_validator
+from app.utils.ids import UUIDString, new_id, uuid_field
 
 if TYPE_CHECKING:
   from app.models import Action, Variable
@@ -12,8 +13,9 @@ class KpiBase(SQLModel):
         id_action (Optional[str]): Foreign key referencing the action this KPI belongs to
         description (Optional[str]): Detailed description of what this KPI measures
     """
-    id_action: Optional[str] = Field(default=None, foreign_key="action.id_action")
+    id_action: Optional[str] = Field(default=None, foreign_key="action.id_action", sa_type=UUIDString)
     description : Optional[str] = Field(default=None)
+    ids_must_be_uuids = field_validator("id_action")(uuid_field)
 
 class Kpi(KpiBase, table=True):
     """Database model for Key Performance Indicators (KPIs).
@@ -26,7 +28,7 @@ class Kpi(KpiBase, table=True):
         variables (list[Variable]): List of variables used to calculate this KPI
     """
     __tablename__ = "kpi"
-    id_kpi: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, unique=True)
+    id_kpi: Optional[str] = Field(default_factory=new_id, sa_type=UUIDString, primary_key=True, unique=True)
     
     action : Optional["Action"] = Relationship(back_populates="kpi_list")
     variables : list["Variable"] = Relationship(back_populates="kpi")
\ No newline at end of file
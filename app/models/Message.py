@@ -1,6 +1,7 @@
-import uuid
 from typing import TYPE_CHECKING, Optional
 from sqlmodel import Field, Relationship, SQLModel
+from pydantic import field_validator
+from app.utils.ids import UUIDString, new_id, uuid_field
 
 if TYPE_CHECKING: from app.models import PriorityType, DeadLine
 
@@ -13,10 +14,11 @@ class MessageBase(SQLModel):
         value (Optional[str]): The content of the message
         time_before (Optional[int]): Time in advance to send the message before the deadline
     """
-    id_deadline : Optional[str] = Field(default=None, foreign_key="deadline.id_deadline")
+    id_deadline : Optional[str] = Field(default=None, foreign_key="deadline.id_deadline", sa_type=UUIDString)
     id_priority_type : Optional[int] = Field(default=None, foreign_key="priority_type.id_priority_type")
     value: Optional[str] = Field(default=None)
     time_before : Optional[int] = Field(default=None)
+    ids_must_be_uuids = field_validator("id_deadline")(uuid_field)
   
 class Message(MessageBase, table=True):
     """Database model for messages related to deadlines.
@@ -29,7 +31,7 @@ class Message(MessageBase, table=True):
         deadline (Optional[DeadLine]): Relationship to the associated deadline
     """
     __tablename__ = "message"
-    id_message: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, unique=True)
+    id_message: Optional[str] = Field(default_factory=new_id, sa_type=UUIDString, primary_key=True, unique=True)
     
     priority_type : Optional["PriorityType"] = Relationship(back_populates="messages")
     deadline : Optional["DeadLine"] = Relationship(back_populates="deadline_messages")
\ No newline at end of file
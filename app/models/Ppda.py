@@ -1,10 +1,11 @@
 from typing import TYPE_CHECKING, Optional
-import uuid
+from pydantic import field_validator, model_validator
 from sqlmodel import Field, Relationship, SQLModel
-from datetime import datetime, timezone
 from app.models.PpdaStatus import PpdaStatus
-from sqlalchemy import Column
+from sqlalchemy import DDL, Column, Index, event, func, text
 from sqlalchemy import Enum as SQLEnum
+from app.utils.ids import UUIDString, new_id, uuid_field
+from app.utils.timestamps import created_at_kwargs, updated_at_kwargs
 
 if TYPE_CHECKING: from app.models import Action, Institution
 
@@ -15,28 +16,53 @@ class PpdaBase(SQLModel):
     Attributes:
         id_institution (Optional[str]): Foreign key referencing the institution this PPDA belongs to
     """
-    id_institution: Optional[str] = Field(default=None, foreign_key="institution.id_institution")
+    id_institution: Optional[str] = Field(default=None, foreign_key="institution.id_institution", sa_type=UUIDString)
     
     name: str = Field(..., description="Name of the PPDA")
     description: Optional[str] = Field(None, description="Detailed description")
-    region: Optional[str] = Field(None, description="Region where it applies")
-    municipality: Optional[str] = Field(None, description="Municipality where it applies")
+    region: Optional[str] = Field(None, index=True, description="Region where it applies")
+    municipality: Optional[str] = Field(None, index=True, description="Municipality where it applies")
     geographic_scope: Optional[str] = Field(None, description="Geographic scope")
-    start_date: Optional[int] = Field(None, description="Start date [unix timestamp]")
-    end_date: Optional[int] = Field(None, description="End date [unix timestamp]")
-    status: Optional[str] = Field(None, description="Current PPDA status in it's life cycle")
-    created_at : int = Field(
+    start_date: Optional[int] = Field(None, index=True, description="Start date [unix timestamp]")
+    end_date: Optional[int] = Field(None, index=True, description="End date [unix timestamp]")
+    status: Optional[str] = Field(None, index=True, description="Current PPDA status in it's life cycle")
+    min_lon: Optional[float] = Field(None, ge=-180, le=180, description="Bounding box west longitude [WGS84 degrees]")
+    min_lat: Optional[float] = Field(None, ge=-90, le=90, description="Bounding box south latitude [WGS84 degrees]")
+    max_lon: Optional[float] = Field(None, ge=-180, le=180, description="Bounding box east longitude [WGS84 degrees]")
+    max_lat: Optional[float] = Field(None, ge=-90, le=90, description="Bounding box north latitude [WGS84 degrees]")
+    created_at : Optional[int] = Field(
+        default=None,
         nullable=True,
-        default_factory=lambda: int(datetime.now(timezone.utc).timestamp()),
+        sa_column_kwargs=created_at_kwargs(),
         description="Record creation timestamp"
     )
-    updated_at : int = Field(
+    updated_at : Optional[int] = Field(
+        default=None,
         nullable=True,
-        default_factory=lambda: int(datetime.now(timezone.utc).timestamp()),
-        sa_column_kwargs={"onupdate": int(datetime.now(timezone.utc).timestamp())},
+        sa_column_kwargs=updated_at_kwargs(),
         description="Record last‐update timestamp"
     )
 
+    ids_must_be_uuids = field_validator("id_institution")(uuid_field)
+
+    @model_validator(mode="after")
+    def bbox_must_be_complete(self):
+        """
+        Validate the bounding box: all four coordinates or none, with
+        min <= max on both axes.
+
+        Raises:
+            ValueError: If the box is partial or inverted.
+        """
+        values = [self.min_lon, self.min_lat, self.max_lon, self.max_lat]
+        if all(value is None for value in values):
+            return self
+        if any(value is None for value in values):
+            raise ValueError("min_lon, min_lat, max_lon and max_lat must be given together")
+        if self.min_lon > self.max_lon or self.min_lat > self.max_lat:
+            raise ValueError("Bounding box minimums cannot exceed its maximums")
+        return self
+
 
 class Ppda(PpdaBase, table=True):
     """Database model for PPDA (Plan de Prevención y Descontaminación Atmosférica).
@@ -49,11 +75,58 @@ class Ppda(PpdaBase, table=True):
         institution (Optional[Institution]): Relationship to the institution responsible for this PPDA
     """
     __tablename__ = "ppda"
-    id_ppda: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, unique=True)
+    __mapper_args__ = {"eager_defaults": True}
+    id_ppda: Optional[str] = Field(default_factory=new_id, sa_type=UUIDString, primary_key=True, unique=True)
     
     actions : list["Action"] = Relationship(back_populates="ppda")
     institution : Optional["Institution"] = Relationship(back_populates="ppda_list")
 
+# Bounding box columns, in the order of a GeoJSON bbox; all NULL when unknown
+BBOX_COLUMNS = ("min_lon", "min_lat", "max_lon", "max_lat")
+SQLITE_RTREE = "ppda_rtree"
+
+
+def postgres_box(min_lon, min_lat, max_lon, max_lat):
+  return func.box(func.point(min_lon, min_lat), func.point(max_lon, max_lat))
+
+
+# Spatial index for /ppda/at and /ppda/within. PostgreSQL: GiST on the box.
+Index(
+  "ix_ppda_bbox",
+  postgres_box(*(Ppda.__table__.c[column] for column in BBOX_COLUMNS)),
+  postgresql_using="gist",
+).ddl_if(dialect="postgresql")
+
+# SQLite: an R*Tree virtual table kept in sync by triggers, keyed by the ppda
+# rowid, when the module is compiled in (the API falls back to an R-tree in
+# memory otherwise).
+SQLITE_RTREE_DDL = [
+  f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_RTREE} USING rtree(id, min_lon, max_lon, min_lat, max_lat)",
+  f"CREATE TRIGGER IF NOT EXISTS {SQLITE_RTREE}_insert AFTER INSERT ON ppda WHEN NEW.min_lon IS NOT NULL BEGIN "
+  f"INSERT INTO {SQLITE_RTREE} VALUES (NEW.rowid, NEW.min_lon, NEW.max_lon, NEW.min_lat, NEW.max_lat); END",
+  f"CREATE TRIGGER IF NOT EXISTS {SQLITE_RTREE}_update AFTER UPDATE OF min_lon, min_lat, max_lon, max_lat ON ppda BEGIN "
+  f"DELETE FROM {SQLITE_RTREE} WHERE id = OLD.rowid; "
+  f"INSERT INTO {SQLITE_RTREE} SELECT NEW.rowid, NEW.min_lon, NEW.max_lon, NEW.min_lat, NEW.max_lat "
+  f"WHERE NEW.min_lon IS NOT NULL; END",
+  f"CREATE TRIGGER IF NOT EXISTS {SQLITE_RTREE}_delete AFTER DELETE ON ppda BEGIN "
+  f"DELETE FROM {SQLITE_RTREE} WHERE id = OLD.rowid; END",
+]
+
+
+@event.listens_for(Ppda.__table__, "after_create")
+def _create_sqlite_rtree(target, connection, **kw):
+  if connection.dialect.name != "sqlite":
+    return
+  if connection.execute(text("SELECT sqlite_compileoption_used('ENABLE_RTREE')")).scalar():
+    for statement in SQLITE_RTREE_DDL:
+      connection.execute(text(statement))
+
+
+event.listen(
+  Ppda.__table__, "before_drop",
+  DDL(f"DROP TABLE IF EXISTS {SQLITE_RTREE}").execute_if(dialect="sqlite"),
+)
+
 class PpdaCreate(PpdaBase):
     """Model for creating a new PPDA (Plan de Prevención y Descontaminación Atmosférica).
     
@@ -1,26 +1,27 @@
 
-import datetime
 from typing import TYPE_CHECKING, Optional
 from pydantic import field_validator
-import uuid
 from sqlmodel import Field, Relationship, SQLModel
+from app.utils.ids import UUIDString
+from app.utils.timestamps import created_at_kwargs, updated_at_kwargs
 
 if TYPE_CHECKING:
     from app.models import User
 
 class RefreshTokenBase(SQLModel):
-    id_user: str = Field(default=None, foreign_key="user.id_user")
+    id_user: str = Field(default=None, foreign_key="user.id_user", sa_type=UUIDString)
     token_hash: str = Field(nullable=False)
-    created_at: int = Field(nullable=True, default_factory=lambda: int(datetime.datetime.now(datetime.timezone.utc).timestamp()))
-    updated_at: int = Field(nullable=True, default_factory=lambda: int(datetime.datetime.now(datetime.timezone.utc).timestamp()), sa_column_kwargs={"onupdate": int(datetime.datetime.now(datetime.timezone.utc).timestamp())})
+    created_at: Optional[int] = Field(default=None, nullable=True, sa_column_kwargs=created_at_kwargs())
+    updated_at: Optional[int] = Field(default=None, nullable=True, sa_column_kwargs=updated_at_kwargs())
     expires_at: int = Field(nullable=False)
     used: bool = Field(default=False)
     revoked: bool = Field(default=False)
 
 class RefreshToken(RefreshTokenBase, table=True):
     __tablename__ = "refresh_token"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id_token: Optional[str] = Field(nullable=False, primary_key=True, unique=True)
+    id_token: Optional[str] = Field(nullable=False, sa_type=UUIDString, primary_key=True, unique=True)
     
     user : Optional["User"] = Relationship(back_populates="refresh_token")
 
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Optional
-import uuid
 from sqlmodel import Field, Relationship, SQLModel
+from pydantic import field_validator
+from app.utils.ids import UUIDString, new_id, uuid_field
 
 if TYPE_CHECKING:
   from app.models import Action, History
@@ -11,7 +12,8 @@ class ReportBase(SQLModel):
     Attributes:
         id_action (Optional[str]): Foreign key referencing the action this report belongs to (required field)
     """
-    id_action : Optional[str] = Field(nullable=False, foreign_key="action.id_action")
+    id_action : Optional[str] = Field(nullable=False, foreign_key="action.id_action", sa_type=UUIDString)
+    ids_must_be_uuids = field_validator("id_action")(uuid_field)
 
 class Report(ReportBase, table=True):
     """Database model for reports associated with actions.
@@ -25,7 +27,7 @@ class Report(ReportBase, table=True):
     """
     __tablename__ = "report"
     
-    id_report : Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, unique=True)
+    id_report : Optional[str] = Field(default_factory=new_id, sa_type=UUIDString, primary_key=True, unique=True)
     
     report_action : Optional["Action"] = Relationship(back_populates="report")
     history_list : list["History"] = Relationship(back_populates="report")
@@ -0,0 +1,22 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+SearchKind = Literal["ppda", "institution"]
+
+class SearchResult(BaseModel):
+    kind: SearchKind = Field(json_schema_extra={"example": "ppda"})
+    id: str = Field(json_schema_extra={"example": "0192f4a1-6b3e-7c2d-9a41-5e8f0b7c3d21"})
+    title: str | None = Field(default=None, json_schema_extra={"example": "PPDA Santiago"})
+    rank: float = Field(description="Relevance; higher first")
+
+class SearchPage(BaseModel):
+    total: int = Field(description="Number of matches across all pages")
+    limit: int
+    offset: int
+    results: list[SearchResult]
+
+class Suggestion(BaseModel):
+    id: str = Field(json_schema_extra={"example": "0192f4a1-6b3e-7c2d-9a41-5e8f0b7c3d21"})
+    label: str | None = Field(default=None, json_schema_extra={"example": "mmartinez"})
+    detail: str | None = Field(default=None, json_schema_extra={"example": "mmartinez@mma.gob.cl"})
@@ -1,8 +1,9 @@
-import datetime
 from typing import TYPE_CHECKING, Optional
-import uuid
+from sqlalchemy import Index, func
 from sqlmodel import Relationship, SQLModel, Field
 from pydantic import EmailStr
+from app.utils.ids import UUIDString, new_id
+from app.utils.timestamps import created_at_kwargs, updated_at_kwargs
 
 if TYPE_CHECKING:
   from app.models import UserInstitution, RefreshToken, Action
@@ -19,8 +20,8 @@ class UserBase(SQLModel):
   """
   username: Optional[str] = Field(nullable=True, default=None)
   email: Optional[str] = Field(nullable=False, default=None)
-  created_at : int = Field(nullable=True, default_factory=lambda: int(datetime.datetime.now(datetime.timezone.utc).timestamp()))
-  updated_at : int = Field(nullable=True, default_factory=lambda: int(datetime.datetime.now(datetime.timezone.utc).timestamp()), sa_column_kwargs={"onupdate": int(datetime.datetime.now(datetime.timezone.utc).timestamp())})
+  created_at : Optional[int] = Field(default=None, nullable=True, sa_column_kwargs=created_at_kwargs())
+  updated_at : Optional[int] = Field(default=None, nullable=True, sa_column_kwargs=updated_at_kwargs())
   is_admin: bool = Field(default=False)
 
 class User(UserBase, table=True):
@@ -34,14 +35,21 @@ class User(UserBase, table=True):
       actions (List[Action]): Relationship to actions.
   """
   __tablename__ = "user"
+  __mapper_args__ = {"eager_defaults": True}
   
-  id_user: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, unique=True)
+  id_user: Optional[str] = Field(default_factory=new_id, sa_type=UUIDString, primary_key=True, unique=True)
   password : Optional[str] = Field(nullable=False)
   
   user_institution_user : list["UserInstitution"] = Relationship(back_populates="user")
   refresh_token: list["RefreshToken"] = Relationship(back_populates="user")
   actions : list["Action"] = Relationship(back_populates="user")
   
+# Autocomplete: lower(column) LIKE 'prefix%' as an index range scan on PostgreSQL
+Index("ix_user_username_prefix", func.lower(User.__table__.c.username).label("username_lower"),
+      postgresql_ops={"username_lower": "text_pattern_ops"})
+Index("ix_user_email_prefix", func.lower(User.__table__.c.email).label("email_lower"),
+      postgresql_ops={"email_lower": "text_pattern_ops"})
+
 class UserCreate(UserBase):
   """
   Model for user creation with required fields.
@@ -3,6 +3,8 @@ from sqlmodel import Field, Relationship, SQLModel
 from app.models.Role import Role
 from sqlalchemy import Column
 from sqlalchemy.types import Enum as SAEnum
+from pydantic import field_validator
+from app.utils.ids import UUIDString, uuid_field
 
 if TYPE_CHECKING: from app.models import User, Institution, UserRol
 
@@ -19,8 +21,8 @@ class UserInstitutionBase(SQLModel):
       id_user_rol (Optional[int]): Foreign key to UserRol, defines user's role in institution
       is_active (bool): Flag indicating if the association is active
   """
-  id_user : Optional[str] = Field(default=None, foreign_key="user.id_user", primary_key=True)
-  id_institution : Optional[str] = Field(default=None, foreign_key="institution.id_institution", primary_key=True)
+  id_user : Optional[str] = Field(default=None, foreign_key="user.id_user", sa_type=UUIDString, primary_key=True)
+  id_institution : Optional[str] = Field(default=None, foreign_key="institution.id_institution", sa_type=UUIDString, primary_key=True)
   role: Role = Field(
     sa_column=Column(
       SAEnum(Role, name="role_enum", native_enum=True),
@@ -77,6 +79,7 @@ class UserInstitutionCreate(UserInstitutionBase):
   id_user : Optional[str]
   id_institution : Optional[str]
   role : Role
+  ids_must_be_uuids = field_validator("id_user", "id_institution")(uuid_field)
 
 class UserInstitutionUpdate(UserInstitutionBase):
   """
@@ -91,4 +94,5 @@ class UserInstitutionUpdate(UserInstitutionBase):
   id_user : Optional[str]
   id_institution : Optional[str]
   role : Optional[Role]
-  is_active : Optional[bool] = None
\ No newline at end of file
+  is_active : Optional[bool] = None
+  ids_must_be_uuids = field_validator("id_user", "id_institution")(uuid_field)
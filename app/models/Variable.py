@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Optional
-import uuid
 from sqlmodel import Field, Relationship, SQLModel
+from pydantic import field_validator
+from app.utils.ids import UUIDString, new_id, uuid_field
 
 if TYPE_CHECKING: 
   from app.models import Kpi, History
@@ -13,9 +14,10 @@ class VariableBase(SQLModel):
         formula (Optional[str]): Mathematical or logical formula used to calculate the variable
         verification_medium (Optional[str]): Method or source used to verify the variable's value
     """
-    id_kpi : Optional[str] = Field(default=None, foreign_key="kpi.id_kpi")
+    id_kpi : Optional[str] = Field(default=None, foreign_key="kpi.id_kpi", sa_type=UUIDString)
     formula: Optional[str] = Field(default=None)
     verification_medium : Optional[str] = Field(default=None)
+    ids_must_be_uuids = field_validator("id_kpi")(uuid_field)
 
 class Variable(VariableBase, table=True):
     """Database model for variables associated with KPIs.
@@ -28,7 +30,7 @@ class Variable(VariableBase, table=True):
         history_list (list[History]): List of historical records for this variable
     """
     __tablename__ = "variable"
-    id_variable: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, unique=True)
+    id_variable: Optional[str] = Field(default_factory=new_id, sa_type=UUIDString, primary_key=True, unique=True)
     
     kpi : Optional["Kpi"] = Relationship(back_populates="variables")
     history_list : list["History"] = Relationship(back_populates="variable")
\ No newline at end of file
@@ -3,15 +3,17 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.controllers import ActionController, PpdaController
-from app.db import get_session
+from app.db import SessionRoute, get_session
 from app.models import Role, User
 from app.models.Action import Action, ActionCreate, ActionUpdate, ActionPublic
 from app.utils.auth import get_admin_user, get_current_user
 from app.utils.rbac import verify_institution_role
+from app.utils.responses import field_selection, rows_response
 
 router = APIRouter(
   prefix="/action",
   tags=["action"],
+  route_class=SessionRoute,
   responses={
     status.HTTP_404_NOT_FOUND: {"description": "Action not found"},
     status.HTTP_400_BAD_REQUEST: {"description": "Invalid request data"},
@@ -19,6 +21,8 @@ router = APIRouter(
   }
 )
 
+action_fields = field_selection(Action)
+
 @router.get(
   "/",
   response_model=list[Action],
@@ -31,7 +35,7 @@ router = APIRouter(
   """,
   response_description="List of actions"
 )
-async def get_action(session = Depends(get_session), user : Annotated[User, Depends(get_admin_user)] = None): 
+async def get_action(session = Depends(get_session), user : Annotated[User, Depends(get_admin_user)] = None, columns = Depends(action_fields)):
   """
   Retrieves a complete list of all actions in the system.
 
@@ -39,7 +43,7 @@ async def get_action(session = Depends(get_session), user : Annotated[User, Depe
     List[Action]: All registered actions with their IDs and descriptions
   """
   
-  return await ActionController.get_all(session)
+  return rows_response(await ActionController.get_all(session, columns), Action, columns=columns)
 
 @router.get(
   "/public", 
@@ -2,13 +2,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.controllers import ActionTypeController
-from app.db import get_session
+from app.db import SessionRoute, get_session
 from app.models.ActionType import ActionTypeCreate, ActionType, ActionTypeUpdate
 from app.utils.auth import get_admin_user
 
 router = APIRouter(
   prefix="/action-type",
   tags=["action-type"],
+  route_class=SessionRoute,
   dependencies=[Depends(get_admin_user)],
   responses={
     status.HTTP_404_NOT_FOUND: {"description": "Action type not found"},
@@ -2,7 +2,7 @@
 from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.db import get_session
+from app.db import SessionRoute, get_session
 
 from app.models.User import UserLogin
 from app.models.Auth import AuthTokenResponse
@@ -14,6 +14,7 @@ from app.utils.auth import get_refresh_username
 router = APIRouter(
     prefix="/auth",
     tags=["auth"],
+    route_class=SessionRoute,
     responses={
         status.HTTP_404_NOT_FOUND: {"description": "Not found"},
         status.HTTP_401_UNAUTHORIZED: {"description": "Incorrect username or password"},
@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Depends, status, HTTPException
 from typing import List
-from app.db import get_session
+from app.db import SessionRoute, get_session
 from app.models.DeadLine import DeadLine, DeadLineBase
 from app.controllers import DeadLineController
 from app.utils.auth import verify_access_token
+from app.utils.filters import list_query
+
+deadline_query = list_query(DeadLine, filters=("year",), ranges=("deadline_date",), sort=("deadline_date", "year"))
 
 router = APIRouter(
     prefix="/deadline",
     tags=["deadline"],
+    route_class=SessionRoute,
     dependencies=[Depends(verify_access_token)],
     responses={
         status.HTTP_404_NOT_FOUND: {"description": "Deadline not found"},
@@ -22,15 +26,16 @@ router = APIRouter(
     summary="List all deadlines",
     response_description="List of all deadlines"
 )
-async def get_deadlines(session=Depends(get_session)):
+async def get_deadlines(session=Depends(get_session), query=Depends(deadline_query)):
     """
     Retrieve a list of all deadlines in the system.
     Args:
         session: Database session dependency.
+        query: Filters and sort order, e.g. ?year=2025&deadline_date_from=2025-06-01&sort=deadline_date
     Returns:
         List of DeadLine objects.
     """
-    return await DeadLineController.get_all(session)
+    return await DeadLineController.get_all(session, query)
 
 @router.get(
     "/action/{id_action}",
@@ -1,13 +1,22 @@
-from fastapi import APIRouter, Depends, status, HTTPException
-from typing import List
-from app.db import get_session
+from fastapi import APIRouter, Depends, Query, status, HTTPException
+from typing import List, Optional
+from app.db import SessionRoute, get_session
 from app.models.History import History, HistoryBase
 from app.controllers import HistoryController
 from app.utils.auth import verify_access_token
+from app.utils import rate_limit
+from app.utils.responses import JSON, LIST_RESPONSES, field_selection, response_format, rows_response
+
+# Ventana de tiempo opcional: en PostgreSQL solo se leen las particiones mensuales que abarca
+FromDate = Query(None, description="Only records created at or after this unix timestamp")
+ToDate = Query(None, description="Only records created before this unix timestamp")
+# Columnas pedidas con ?fields=; el SELECT solo lee esas columnas
+history_fields = field_selection(History)
 
 router = APIRouter(
     prefix="/history",
     tags=["history"],
+    route_class=SessionRoute,
     dependencies=[Depends(verify_access_token)],
     responses={
         status.HTTP_404_NOT_FOUND: {"description": "History record not found"},
@@ -16,16 +25,20 @@ router = APIRouter(
     }
 )
 
-@router.get("/", response_model=List[History], summary="List all history records")
-async def get_all_history(session=Depends(get_session)):
+@router.get("/", response_model=List[History], responses=LIST_RESPONSES, summary="List all history records")
+@rate_limit.cost(rate_limit.COST_EXPORT)
+async def get_all_history(from_date: Optional[int] = FromDate, to_date: Optional[int] = ToDate, session=Depends(get_session), media_type: str = Depends(response_format), columns=Depends(history_fields)):
     """
     Retrieve all history records in the system.
     Args:
+        from_date, to_date: Optional created_at window (unix timestamps).
         session: Database session dependency.
+        media_type: Format from the Accept header (JSON, MessagePack or Arrow).
+        columns: Columns requested with ?fields= (all when omitted).
     Returns:
         List of History objects.
     """
-    return await HistoryController.get_all(session)
+    return rows_response(await HistoryController.get_all(session, from_date, to_date, stream_json=media_type == JSON, columns=columns), History, media_type, columns=columns)
 
 @router.get("/{id}", response_model=History, summary="Get history by ID")
 async def get_history_by_id(id: str, session=Depends(get_session)):
@@ -76,63 +89,78 @@ async def delete_history(id: str, session=Depends(get_session)):
     """
     return await HistoryController.delete_history(id, session)
 
-@router.get("/variable/{id_variable}", response_model=List[History], summary="Get history by variable")
-async def get_history_by_variable(id_variable: str, session=Depends(get_session)):
+@router.get("/variable/{id_variable}", response_model=List[History], responses=LIST_RESPONSES, summary="Get history by variable")
+async def get_history_by_variable(id_variable: str, from_date: Optional[int] = FromDate, to_date: Optional[int] = ToDate, session=Depends(get_session), media_type: str = Depends(response_format), columns=Depends(history_fields)):
     """
     Retrieve all history records for a given variable.
     Args:
         id_variable (str): UUID of the variable.
+        from_date, to_date: Optional created_at window (unix timestamps).
         session: Database session dependency.
+        media_type: Format from the Accept header (JSON, MessagePack or Arrow).
+        columns: Columns requested with ?fields= (all when omitted).
     Returns:
         List of History objects for the variable.
     """
-    return await HistoryController.get_by_variable(id_variable, session)
+    return rows_response(await HistoryController.get_by_variable(id_variable, session, from_date, to_date, stream_json=media_type == JSON, columns=columns), History, media_type, columns=columns)
 
-@router.get("/report/{id_report}", response_model=List[History], summary="Get history by report")
-async def get_history_by_report(id_report: str, session=Depends(get_session)):
+@router.get("/report/{id_report}", response_model=List[History], responses=LIST_RESPONSES, summary="Get history by report")
+async def get_history_by_report(id_report: str, from_date: Optional[int] = FromDate, to_date: Optional[int] = ToDate, session=Depends(get_session), media_type: str = Depends(response_format), columns=Depends(history_fields)):
     """
     Retrieve all history records for a given report.
     Args:
         id_report (str): UUID of the report.
+        from_date, to_date: Optional created_at window (unix timestamps).
         session: Database session dependency.
+        media_type: Format from the Accept header (JSON, MessagePack or Arrow).
+        columns: Columns requested with ?fields= (all when omitted).
     Returns:
         List of History objects for the report.
     """
-    return await HistoryController.get_by_report(id_report, session)
+    return rows_response(await HistoryController.get_by_report(id_report, session, from_date, to_date, stream_json=media_type == JSON, columns=columns), History, media_type, columns=columns)
 
-@router.get("/var-report/{id_variable}/{id_report}", response_model=List[History], summary="Get history by variable and report")
-async def get_history_by_var_and_report(id_variable: str, id_report: str, session=Depends(get_session)):
+@router.get("/var-report/{id_variable}/{id_report}", response_model=List[History], responses=LIST_RESPONSES, summary="Get history by variable and report")
+async def get_history_by_var_and_report(id_variable: str, id_report: str, from_date: Optional[int] = FromDate, to_date: Optional[int] = ToDate, session=Depends(get_session), media_type: str = Depends(response_format), columns=Depends(history_fields)):
     """
     Retrieve all history records for a specific variable and report combination.
     Args:
         id_variable (str): UUID of the variable.
         id_report (str): UUID of the report.
+        from_date, to_date: Optional created_at window (unix timestamps).
         session: Database session dependency.
+        media_type: Format from the Accept header (JSON, MessagePack or Arrow).
+        columns: Columns requested with ?fields= (all when omitted).
     Returns:
         List of History objects for the variable and report.
     """
-    return await HistoryController.get_by_var_and_report(id_variable, id_report, session)
+    return rows_response(await HistoryController.get_by_var_and_report(id_variable, id_report, session, from_date, to_date, stream_json=media_type == JSON, columns=columns), History, media_type, columns=columns)
 
-@router.get("/kpi/{id_kpi}", response_model=List[History], summary="Get history by KPI")
-async def get_history_by_kpi(id_kpi: str, session=Depends(get_session)):
+@router.get("/kpi/{id_kpi}", response_model=List[History], responses=LIST_RESPONSES, summary="Get history by KPI")
+async def get_history_by_kpi(id_kpi: str, from_date: Optional[int] = FromDate, to_date: Optional[int] = ToDate, session=Depends(get_session), media_type: str = Depends(response_format), columns=Depends(history_fields)):
     """
     Retrieve all history records for a given KPI.
     Args:
         id_kpi (str): UUID of the KPI.
+        from_date, to_date: Optional created_at window (unix timestamps).
         session: Database session dependency.
+        media_type: Format from the Accept header (JSON, MessagePack or Arrow).
+        columns: Columns requested with ?fields= (all when omitted).
     Returns:
         List of History objects for the KPI.
     """
-    return await HistoryController.get_by_kpi(id_kpi, session)
+    return rows_response(await HistoryController.get_by_kpi(id_kpi, session, from_date, to_date, stream_json=media_type == JSON, columns=columns), History, media_type, columns=columns)
 
-@router.get("/action/{id_action}", response_model=List[History], summary="Get history by Action")
-async def get_history_by_action(id_action: str, session=Depends(get_session)):
+@router.get("/action/{id_action}", response_model=List[History], responses=LIST_RESPONSES, summary="Get history by Action")
+async def get_history_by_action(id_action: str, from_date: Optional[int] = FromDate, to_date: Optional[int] = ToDate, session=Depends(get_session), media_type: str = Depends(response_format), columns=Depends(history_fields)):
     """
     Retrieve all history records for a given Action.
     Args:
         id_action (str): UUID of the Action.
+        from_date, to_date: Optional created_at window (unix timestamps).
         session: Database session dependency.
+        media_type: Format from the Accept header (JSON, MessagePack or Arrow).
+        columns: Columns requested with ?fields= (all when omitted).
     Returns:
         List of History objects for the Action.
     """
-    return await HistoryController.get_by_action(id_action, session)
+    return rows_response(await HistoryController.get_by_action(id_action, session, from_date, to_date, stream_json=media_type == JSON, columns=columns), History, media_type, columns=columns)
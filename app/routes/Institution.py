@@ -2,17 +2,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.controllers import InstitutionController, InstitutionTypeController
-from app.db import get_session
+from app.db import SessionRoute, get_session
 from app.models.Institution import Institution, InstitutionCreate, InstitutionUpdate
 from app.utils.auth import get_admin_user
+from app.utils.responses import field_selection, rows_response
 
 router = APIRouter(
   prefix="/institution",
   tags=["institution"],
+  route_class=SessionRoute,
   dependencies=[Depends(get_admin_user)],
   responses={status.HTTP_404_NOT_FOUND: {"description": "Not found"}}
 )
 
+institution_fields = field_selection(Institution)
+
 @router.get("/", 
             response_model=list[Institution],
             summary="List all institutions",
@@ -23,15 +27,15 @@ router = APIRouter(
             """,
             response_description="A list of all institutions"
             )
-async def get_institutions(session = Depends(get_session)):
+async def get_institutions(session = Depends(get_session), columns = Depends(institution_fields)):
   """
   Get all institutions endpoint.
   
   Returns every institution registered in the system regardless of type.
   The list includes basic institution information and their type references.
   """
-  institutions = await InstitutionController.get_all(session)
-  return institutions
+  institutions = await InstitutionController.get_all(session, columns)
+  return rows_response(institutions, Institution, columns=columns)
 
 @router.get("/{id}", 
             response_model=Institution,
@@ -158,11 +162,5 @@ async def update_institution(id: str, institution: InstitutionUpdate, session =
   - Updated fields
   - New modification timestamp
   """
-  current_institution = await InstitutionController.get_by_id(id, session)
-  if not current_institution:
-    raise HTTPException(
-      status_code=status.HTTP_404_NOT_FOUND, 
-      detail = "Institution not found"
-      )
   new_institution = await InstitutionController.update_institution(id, institution, session)
   return new_institution
\ No newline at end of file
@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Depends, status, HTTPException
 from typing import List
-from app.db import get_session
+from app.db import SessionRoute, get_session
 from app.models.Kpi import Kpi, KpiBase
 from app.controllers import KpiController
 from app.utils.auth import verify_access_token
+from app.utils.responses import JSON, LIST_RESPONSES, field_selection, response_format, rows_response
+
+kpi_fields = field_selection(Kpi)
 
 router = APIRouter(
     prefix="/kpi",
     tags=["kpi"],
+    route_class=SessionRoute,
     dependencies=[Depends(verify_access_token)],
     responses={
         status.HTTP_404_NOT_FOUND: {"description": "KPI not found"},
@@ -16,16 +20,18 @@ router = APIRouter(
     }
 )
 
-@router.get("/", response_model=List[Kpi], summary="List all KPIs")
-async def get_all_kpis(session=Depends(get_session)):
+@router.get("/", response_model=List[Kpi], responses=LIST_RESPONSES, summary="List all KPIs")
+async def get_all_kpis(session=Depends(get_session), media_type: str = Depends(response_format), columns=Depends(kpi_fields)):
     """
     Retrieve all KPI records in the system.
     Args:
         session: Database session dependency.
+        media_type: Format from the Accept header (JSON, MessagePack or Arrow).
+        columns: Columns requested with ?fields= (all when omitted).
     Returns:
         List of KPI objects.
     """
-    return await KpiController.get_all_kpis(session)
+    return rows_response(await KpiController.get_all_kpis(session, stream_json=media_type == JSON, columns=columns), Kpi, media_type, columns=columns)
 
 @router.get("/{id}", response_model=Kpi, summary="Get KPI by ID")
 async def get_kpi_by_id(id: str, session=Depends(get_session)):
@@ -76,14 +82,16 @@ async def delete_kpi(id: str, session=Depends(get_session)):
     """
     return await KpiController.delete_kpi(id, session)
 
-@router.get("/action/{id_action}", response_model=List[Kpi], summary="Get KPIs by Action")
-async def get_kpis_by_action(id_action: str, session=Depends(get_session)):
+@router.get("/action/{id_action}", response_model=List[Kpi], responses=LIST_RESPONSES, summary="Get KPIs by Action")
+async def get_kpis_by_action(id_action: str, session=Depends(get_session), media_type: str = Depends(response_format), columns=Depends(kpi_fields)):
     """
     Retrieve all KPI records for a given action.
     Args:
         id_action (str): UUID of the action.
         session: Database session dependency.
+        media_type: Format from the Accept header (JSON, MessagePack or Arrow).
+        columns: Columns requested with ?fields= (all when omitted).
     Returns:
         List of KPI objects for the action.
     """
-    return await KpiController.get_kpis_by_action(id_action, session)
+    return rows_response(await KpiController.get_kpis_by_action(id_action, session, stream_json=media_type == JSON, columns=columns), Kpi, media_type, columns=columns)
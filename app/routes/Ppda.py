@@ -1,19 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import Annotated
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from typing import List
 
-from app.db import get_session
+from app.db import SessionRoute, get_session
 from app.models import Ppda, PpdaCreate, PpdaUpdate, User, Role
 from app.controllers import InstitutionController, PpdaController
-from app.utils.auth import get_admin_user, get_current_user
-from app.utils.rbac import verify_institution_role
+from app.utils.auth import get_admin_user, get_current_user, verify_access_token
+from app.utils.filters import list_query
+from app.utils.rbac import authorize_resource, verify_institution_role
+from app.utils.responses import field_selection, rows_response
+from app.utils.spatial import parse_bbox
 
 limiter = Limiter(key_func=get_remote_address)
+viewable_ppda = authorize_resource(Ppda, Role.VIEWER, "Ppda not found")
+ppda_fields = field_selection(Ppda)
+ppda_query = list_query(
+  Ppda,
+  filters=("status", "region", "municipality"),
+  ranges=("start_date", "end_date"),
+  sort=("start_date", "end_date"),
+)
+
 router = APIRouter(
   prefix="/ppda",
   tags=["ppda"],
+  route_class=SessionRoute,
   responses={
     status.HTTP_404_NOT_FOUND: {"description": "Ppda not found"},
     status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Rate limit exceeded"},
@@ -33,15 +46,148 @@ router = APIRouter(
             """,
             response_description="List of all ppda"
             )
-async def get_ppda(session = Depends(get_session)):
+async def get_ppda(session = Depends(get_session), columns = Depends(ppda_fields), query = Depends(ppda_query)):
   """
   Get all ppda.
+
+  Only the columns listed in ``?fields=`` are read and returned, e.g.
+  ``?fields=id_ppda,name,status`` for list views. Filters and sorting run
+  in the database, e.g. ``?status=vigente&region=Metropolitana&sort=-start_date``.
   
   Returns:
       List[Ppda]: A list of all registered ppda.
   """
-  ppda = await PpdaController.get_all(session)
-  return ppda
+  ppda = await PpdaController.get_all(session, columns, query)
+  return rows_response(ppda, Ppda, columns=columns)
+
+# Declared before /{id} so "at" and "within" are not taken as ids
+@router.get("/at",
+            response_model=List[Ppda],
+            dependencies=[Depends(get_admin_user)],
+            summary="List the ppda that apply at a location",
+            description="""Retrieves the ppda whose bounding box contains the given point.
+            
+            Args:
+                lat (float): Latitude [WGS84 degrees].
+                lon (float): Longitude [WGS84 degrees].
+            
+            Returns:
+                List of Ppda objects
+            """,
+            response_description="Ppda covering the location"
+            )
+async def get_ppda_at(
+  lat: Annotated[float, Query(ge=-90, le=90)],
+  lon: Annotated[float, Query(ge=-180, le=180)],
+  session = Depends(get_session),
+  columns = Depends(ppda_fields),
+):
+  """
+  Get the ppda that apply at a location.
+
+  Returns:
+      List[Ppda]: Ppda whose bounding box contains (lat, lon).
+  """
+  return rows_response(await PpdaController.get_at(lat, lon, session, columns), Ppda, columns=columns)
+
+@router.get("/within",
+            response_model=List[Ppda],
+            dependencies=[Depends(get_admin_user)],
+            summary="List the ppda in an area",
+            description="""Retrieves the ppda whose bounding box intersects the given one.
+            
+            Args:
+                bbox (str): min_lon,min_lat,max_lon,max_lat [WGS84 degrees].
+            
+            Returns:
+                List of Ppda objects
+            """,
+            response_description="Ppda overlapping the area"
+            )
+async def get_ppda_within(
+  bbox: Annotated[str, Query(description="min_lon,min_lat,max_lon,max_lat", examples=["-71.0,-33.7,-70.4,-33.3"])],
+  session = Depends(get_session),
+  columns = Depends(ppda_fields),
+):
+  """
+  Get the ppda in an area, e.g. the map viewport.
+
+  Returns:
+      List[Ppda]: Ppda whose bounding box intersects ``bbox``.
+  """
+  return rows_response(await PpdaController.get_within(parse_bbox(bbox), session, columns), Ppda, columns=columns)
+
+@router.get("/mine",
+            response_model=List[Ppda],
+            summary="List my ppda",
+            description="""Retrieves a page of the ppda of the institutions the caller belongs to.
+            
+            Args:
+                role (Role): Only institutions where the caller has at least this role.
+                limit (int): Maximum number of ppda.
+                offset (int): Number of ppda to skip.
+            
+            Returns:
+                List of Ppda objects
+            """,
+            response_description="The caller's ppda"
+            )
+async def get_my_ppda(
+  payload: Annotated[dict, Depends(verify_access_token)],
+  role: Annotated[Role, Query(description="1 = viewer, 2 = editor")] = Role.VIEWER,
+  limit: Annotated[int, Query(ge=1, le=200)] = 50,
+  offset: Annotated[int, Query(ge=0)] = 0,
+  session = Depends(get_session),
+  columns = Depends(ppda_fields),
+  query = Depends(ppda_query),
+):
+  """
+  Get my ppda, e.g. ``?role=2`` for the ones I can edit.
+
+  The memberships are joined in the same query, instead of listing them
+  and then fetching each institution's ppda.
+
+  Returns:
+      List[Ppda]: The page of ppda, ordered by ``sort`` and then by id.
+  """
+  ppda = await PpdaController.get_mine(payload.get("sub"), session, role, columns, query, limit, offset)
+  return rows_response(ppda, Ppda, columns=columns)
+
+@router.get("/institution/{id_institution}",
+            response_model=List[Ppda],
+            summary="List the ppda of an institution",
+            description="""Retrieves a page of the ppda of an institution the caller belongs to.
+            
+            Args:
+                id_institution (str): The UUID of the institution.
+                limit (int): Maximum number of ppda.
+                offset (int): Number of ppda to skip.
+            
+            Returns:
+                List of Ppda objects
+            """,
+            response_description="The institution's ppda"
+            )
+async def get_ppda_by_institution(
+  id_institution: str,
+  payload: Annotated[dict, Depends(verify_access_token)],
+  limit: Annotated[int, Query(ge=1, le=200)] = 50,
+  offset: Annotated[int, Query(ge=0)] = 0,
+  session = Depends(get_session),
+  columns = Depends(ppda_fields),
+  query = Depends(ppda_query),
+):
+  """
+  Get the ppda of an institution.
+
+  Returns:
+      List[Ppda]: The page of ppda, ordered by ``sort`` and then by id.
+
+  Raises:
+      HTTPException: 403 if the caller is neither an admin nor a member.
+  """
+  ppda = await PpdaController.get_by_institution(id_institution, payload.get("sub"), session, columns, query, limit, offset)
+  return rows_response(ppda, Ppda, columns=columns)
 
 @router.get("/{id}",
             response_model=Ppda,
@@ -56,11 +202,7 @@ async def get_ppda(session = Depends(get_session)):
             """,
             response_description="The requested ppda object"
             )
-async def get_ppda_by_id(
-  id: str,
-  user : Annotated[User, Depends(get_current_user)],
-  session = Depends(get_session)
-):
+async def get_ppda_by_id(ppda: Annotated[Ppda, Depends(viewable_ppda)]):
   """Retrieves a single ppda by its ID.
     Args:
         id (str): The UUID of the ppda to retrieve.
@@ -68,23 +210,8 @@ async def get_ppda_by_id(
     Returns:
         Ppda: The requested ppda object.
   """
-  ppda = await PpdaController.get_by_id(id, session)
-  
-  if not ppda:
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ppda not found")
-
-  verify_institution_role(
-    institution_ids=[ppda.id_institution],
-    required_role=Role.VIEWER,
-    current_user=user,
-    session=session
-  )
-
   return ppda
 
-# TODO: Get all MY ppda's
-# TODO: Get all ppda's by institution
-
 @router.post("/",
              response_model=Ppda,
              summary="Create a new ppda",
@@ -175,9 +302,7 @@ async def update_ppda(
     session=session
   )
   
-  ppda_db.id_institution = ppda.id_institution
-
-  ppda = await PpdaController.update_ppda(ppda_db, session)
+  ppda = await PpdaController.update_ppda(id, ppda, session)
   return ppda
 
 @router.delete("/{id}",
@@ -206,7 +331,4 @@ async def delete_ppda(id: str, session = Depends(get_session)):
     Raises:
         HTTPException: 404 if ppda not found
   """
-  ppda = await PpdaController.get_by_id(id, session)
-  if not ppda:
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ppda not found")
   return await PpdaController.delete_ppda(id, session)
\ No newline at end of file
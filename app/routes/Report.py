@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, status, HTTPException
 from typing import List
-from app.db import get_session
+from app.db import SessionRoute, get_session
 from app.models.Report import Report, ReportBase
 from app.controllers import ReportController
 from app.utils.auth import verify_access_token
+from app.utils.responses import JSON, LIST_RESPONSES, response_format, rows_response
 
 router = APIRouter(
     prefix="/report",
     tags=["report"],
+    route_class=SessionRoute,
     dependencies=[Depends(verify_access_token)],
     responses={
         status.HTTP_404_NOT_FOUND: {"description": "Report not found"},
@@ -19,32 +21,34 @@ router = APIRouter(
 @router.get(
     "/",
     response_model=List[Report],
+    responses=LIST_RESPONSES,
     summary="List all reports",
     description="""Retrieves a list of all registered reports in the system.\n\nReturns:\n    List of Report objects.""",
     response_description="List of all reports"
 )
-async def get_reports(session=Depends(get_session)):
+async def get_reports(session=Depends(get_session), media_type: str = Depends(response_format)):
     """
     Get all reports.
     Returns a list of all reports in the system.
     """
-    return await ReportController.get_all(session)
+    return rows_response(await ReportController.get_all(session, stream_json=media_type == JSON), Report, media_type)
 
 @router.get(
     "/action/{id_action}",
     response_model=List[Report],
+    responses=LIST_RESPONSES,
     summary="Get reports by action ID",
     description="""Retrieves all reports associated with a specific action ID.\n\nArgs:\n    id_action (str): The action ID to filter reports.\n\nReturns:\n    List of Report objects.""",
     response_description="List of reports filtered by action ID"
 )
-async def get_reports_by_action(id_action: str, session=Depends(get_session)):
+async def get_reports_by_action(id_action: str, session=Depends(get_session), media_type: str = Depends(response_format)):
     """
     Get all reports by action ID.
     Args:
         id_action (str): The action ID to filter reports.
     Returns a list of reports associated with the given action.
     """
-    return await ReportController.get_by_action(id_action, session)
+    return rows_response(await ReportController.get_by_action(id_action, session, stream_json=media_type == JSON), Report, media_type)
 
 @router.get(
     "/{id}",
@@ -0,0 +1,41 @@
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, Query, status
+
+from app.controllers import SearchController
+from app.db import SessionRoute, get_session
+from app.models.Search import SearchKind, SearchPage
+from app.utils import rate_limit
+from app.utils.auth import verify_access_token
+
+router = APIRouter(
+  prefix="/search",
+  tags=["search"],
+  route_class=SessionRoute,
+  dependencies=[Depends(verify_access_token)],
+  responses={status.HTTP_400_BAD_REQUEST: {"description": "Invalid request data"}}
+)
+
+@router.get("/",
+            response_model=SearchPage,
+            summary="Search ppda and institutions",
+            description="""Full-text search over PPDA names, descriptions and municipalities and
+            over institution names. Accents and case are ignored and Spanish word forms match
+            ("planes" finds "plan"). Results are ranked by relevance and paginated.
+            """,
+            response_description="A page of ranked results"
+            )
+@rate_limit.cost(rate_limit.COST_LIST)
+async def search(
+  q: Annotated[str, Query(min_length=1, max_length=200, description="Words to look for")],
+  kind: Annotated[Optional[List[SearchKind]], Query(description="Only these kinds of results")] = None,
+  limit: Annotated[int, Query(ge=1, le=100)] = 20,
+  offset: Annotated[int, Query(ge=0)] = 0,
+  session = Depends(get_session),
+):
+  """
+  Search endpoint.
+
+  Returns the ``limit`` best matches after ``offset`` and the total number
+  of matches.
+  """
+  return await SearchController.search(q, session, kind, limit, offset)
@@ -5,7 +5,7 @@ from typing import List
 
 from typing import Annotated
 
-from app.db import get_session
+from app.db import SessionRoute, get_session
 from app.models.User import User, UserCreate
 from app.controllers import UserController
 from app.utils.auth import get_current_user, get_admin_user
@@ -14,6 +14,7 @@ limiter = Limiter(key_func=get_remote_address)
 router = APIRouter(
   prefix="/user",
   tags=["user"],
+  route_class=SessionRoute,
   responses={
     status.HTTP_404_NOT_FOUND: {"description": "User not found"},
     status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Rate limit exceeded"},
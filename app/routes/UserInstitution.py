@@ -1,18 +1,22 @@
-from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from typing import Annotated, List, Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-from app.db import get_session
+from app.db import SessionRoute, get_session
 from app.controllers import UserInstitutionController
 from app.models import User
+from app.models.Search import Suggestion
 from app.models.UserInstitution import UserInstitution, UserInstitutionPublic, UserInstitutionCreate, UserInstitutionUpdate
+from app.utils import rate_limit
 from app.utils.auth import get_current_user, get_admin_user
+from app.utils.autocomplete import MAX_SUGGESTIONS
 
 limiter = Limiter(key_func=get_remote_address)
 router = APIRouter(
   prefix="/user-institution",
   tags=["user-institution"],
+  route_class=SessionRoute,
   dependencies=[Depends(get_admin_user)],
   responses={
     status.HTTP_404_NOT_FOUND: {"description": "User or institution not found"},
@@ -96,6 +100,37 @@ async def get_user_institutions_me(current_user : Annotated[User, Depends(get_cu
   """
   return await UserInstitutionController.get_by_user(current_user.id_user, session)
 
+@router.get("/autocomplete/{source}",
+            response_model=List[Suggestion],
+            summary="Suggest users or institutions by prefix",
+            description="""
+            Type-ahead for the assignment UI: users whose username or email, or
+            institutions whose name, start with ``q`` (case-insensitive).
+
+            Args:
+                source (str): "users" or "institutions".
+                q (str): Prefix typed so far.
+                limit (int): Maximum number of suggestions.
+
+            Returns:
+                List of Suggestion objects ordered by the matched value
+            """
+            )
+@rate_limit.cost(rate_limit.COST_GET)
+async def autocomplete(
+  source: Literal["users", "institutions"],
+  q: Annotated[str, Query(min_length=1, max_length=100)],
+  limit: Annotated[int, Query(ge=1, le=MAX_SUGGESTIONS)] = 10,
+  session = Depends(get_session),
+):
+  """
+  Suggest users or institutions by prefix.
+
+  Returns:
+      List[Suggestion]: Up to ``limit`` matches
+  """
+  return await UserInstitutionController.autocomplete(source, q, limit, session)
+
 @router.get("/institution/{id_institution}",
             response_model=List[UserInstitutionPublic],
             summary="List all user-institution relationships for an institution",
@@ -226,10 +261,6 @@ async def update_user_institution(user_institution: UserInstitutionUpdate, curre
   Returns:
       UserInstitutionPublic: The updated user-institution relationship.
   """
-    
-  user_institution_db = await UserInstitutionController.get_by_ids(user_institution.id_user, user_institution.id_institution, session)
-  if not user_institution_db:
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User or institution not found")
 
   if not current_user.is_admin and current_user.id_user != user_institution.id_user:
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
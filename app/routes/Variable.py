@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.controllers import VariableController, KpiController
-from app.db import get_session
+from app.db import SessionRoute, get_session
 from app.models.Variable import Variable, VariableBase
 from app.utils.auth import get_admin_user
 
 router = APIRouter(
   prefix="/variable",
   tags=["variable"],
+  route_class=SessionRoute,
   dependencies=[Depends(get_admin_user)],
   responses={status.HTTP_404_NOT_FOUND: {"description": "Not found"}}
 )
@@ -0,0 +1,230 @@
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import sqlmodel as sql
+
+from app.models import Action, History, Kpi, Report, Variable
+from app.utils.ids import new_id
+
+# Directory holding archived history; archival and archive reads are off when unset.
+# Layout: <dir>/ppda=<id_ppda>/year=<YYYY>/part-<uuid>.arrow
+archive_dir = os.getenv("HISTORY_ARCHIVE_DIR")
+
+# History columns plus the ids needed to filter archived rows without joins
+HISTORY_COLUMNS = ["id_history", "id_report", "id_variable", "value", "created_at", "updated_at"]
+ARCHIVE_COLUMNS = HISTORY_COLUMNS + ["id_action", "id_kpi", "id_ppda"]
+NO_PPDA = "none"
+
+
+def _pyarrow():
+    """Imports pyarrow on first use, so processes that never touch the archive don't load it."""
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.ipc
+    except ImportError as e:
+        raise RuntimeError("History archival requires pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def _schema(pa):
+    return pa.schema([
+        (column, pa.int64() if column in ("created_at", "updated_at") else pa.string())
+        for column in ARCHIVE_COLUMNS
+    ])
+
+
+def _year(timestamp: int | None) -> int:
+    return datetime.fromtimestamp(timestamp or 0, timezone.utc).year
+
+
+def _write_part(pa, directory: Path, id_ppda: str, year: int, rows: list[dict]) -> Path:
+    folder = directory / f"ppda={id_ppda}" / f"year={year}"
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"part-{new_id()}.arrow"
+    table = pa.Table.from_pylist(rows, schema=_schema(pa))
+    options = pa.ipc.IpcWriteOptions(compression="zstd")
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return path
+
+
+def archive_history(session: sql.Session, before: int, directory: str | None = None, batch_size: int = 50000) -> int:
+    """
+    Moves history rows created before ``before`` into compressed Arrow IPC
+    files and deletes them from the database.
+
+    Rows are written per PPDA and year, in batches, and a batch is deleted
+    only after its files are on disk. If the process stops in between, the
+    rows exist in both places and reads keep the database copy.
+
+    Args:
+        session (Session): Database session for operations.
+        before (int): Unix timestamp; older rows are archived.
+        directory (str | None): Archive root, defaults to HISTORY_ARCHIVE_DIR.
+        batch_size (int): Rows moved per transaction.
+
+    Returns:
+        int: Number of rows archived.
+    """
+    pa = _pyarrow()
+    root = Path(directory or archive_dir or "")
+    if not str(root):
+        raise RuntimeError("HISTORY_ARCHIVE_DIR is not configured")
+
+    statement = (
+        sql.select(
+            *(getattr(History, column) for column in HISTORY_COLUMNS),
+            Report.id_action,
+            Variable.id_kpi,
+            Action.id_ppda,
+        )
+        .select_from(History)
+        .outerjoin(Report, Report.id_report == History.id_report)
+        .outerjoin(Action, Action.id_action == Report.id_action)
+        .outerjoin(Variable, Variable.id_variable == History.id_variable)
+        .where(History.created_at < before)
+        .order_by(History.created_at)
+        .limit(batch_size)
+    )
+    archived = 0
+    while True:
+        rows = [dict(row._mapping) for row in session.exec(statement).all()]
+        if not rows:
+            return archived
+        groups: dict[tuple[str, int], list[dict]] = {}
+        for row in rows:
+            key = (row["id_ppda"] or NO_PPDA, _year(row["created_at"]))
+            groups.setdefault(key, []).append(row)
+        for (id_ppda, year), group in groups.items():
+            _write_part(pa, root, id_ppda, year, group)
+        # The created_at bound lets PostgreSQL prune the monthly partitions
+        # instead of probing each one for the ids
+        session.exec(sql.delete(History).where(
+            History.created_at <= rows[-1]["created_at"],
+            History.id_history.in_([row["id_history"] for row in rows]),
+        ))
+        session.commit()
+        archived += len(rows)
+
+
+def archive_folders(session: sql.Session, filters: dict[str, str] | None) -> list[str] | None:
+    """
+    PPDA folders that can hold the archived rows matching ``filters``.
+
+    The PPDA is resolved from the filtered report, action, KPI or variable
+    (a report and the variables measured in it belong to the same PPDA);
+    rows archived without one are in the ``ppda=none`` folder.
+
+    Returns:
+        list[str] | None: Folder ids, or None when every folder has to be read.
+    """
+    if not filters:
+        return None
+    if "id_report" in filters:
+        statement = sql.select(Action.id_ppda).select_from(Report).\
+            join(Action, Action.id_action == Report.id_action).\
+            where(Report.id_report == filters["id_report"])
+    elif "id_action" in filters:
+        statement = sql.select(Action.id_ppda).where(Action.id_action == filters["id_action"])
+    elif "id_kpi" in filters:
+        statement = sql.select(Action.id_ppda).select_from(Kpi).\
+            join(Action, Action.id_action == Kpi.id_action).\
+            where(Kpi.id_kpi == filters["id_kpi"])
+    elif "id_variable" in filters:
+        statement = sql.select(Action.id_ppda).select_from(Variable).\
+            join(Kpi, Kpi.id_kpi == Variable.id_kpi).\
+            join(Action, Action.id_action == Kpi.id_action).\
+            where(Variable.id_variable == filters["id_variable"])
+    else:
+        return None
+    id_ppda = session.exec(statement).first()
+    return [id_ppda, NO_PPDA] if id_ppda else [NO_PPDA]
+
+
+def _archive_files(root: Path, folders: list[str] | None, first_year: int | None, last_year: int | None) -> list[str]:
+    """Files of the selected PPDA folders whose year overlaps the window."""
+    ppda_folders = root.glob("ppda=*") if folders is None else (root / f"ppda={folder}" for folder in folders)
+    files = []
+    for ppda_folder in ppda_folders:
+        for folder in ppda_folder.glob("year=*"):
+            year = int(folder.name.split("=", 1)[1])
+            if (first_year is not None and year < first_year) or (last_year is not None and year > last_year):
+                continue
+            files.extend(str(path) for path in folder.glob("*.arrow"))
+    return files
+
+
+def read_archive(
+    filters: dict[str, str] | None = None,
+    from_date: int | None = None,
+    to_date: int | None = None,
+    directory: str | None = None,
+    folders: list[str] | None = None,
+) -> list[dict]:
+    """
+    Reads archived history rows matching ``filters`` (column equality) and
+    created_at in [from_date, to_date).
+
+    Only the ``folders`` PPDA folders (all when None) and the year folders
+    overlapping the window are opened. The predicates and the column
+    projection are pushed into a ``pyarrow.dataset`` scan, so only the
+    matching rows are materialized.
+
+    Returns:
+        list[dict]: Matching rows with the History columns.
+    """
+    root = Path(directory or archive_dir or "")
+    if not str(root) or not root.is_dir():
+        return []
+    pa = _pyarrow()
+
+    first_year = _year(from_date) if from_date is not None else None
+    last_year = _year(to_date - 1) if to_date is not None else None
+    files = _archive_files(root, folders, first_year, last_year)
+    if not files:
+        return []
+
+    field = pa.dataset.field
+    conditions = [field(column) == value for column, value in (filters or {}).items()]
+    if from_date is not None:
+        conditions.append(field("created_at") >= from_date)
+    if to_date is not None:
+        conditions.append(field("created_at") < to_date)
+    predicate = None
+    for condition in conditions:
+        predicate = condition if predicate is None else predicate & condition
+
+    dataset = pa.dataset.dataset(files, schema=_schema(pa), format="ipc")
+    return dataset.to_table(columns=HISTORY_COLUMNS, filter=predicate).to_pylist()
+
+
+def archive_enabled() -> bool:
+    """Whether history reads include the archive (HISTORY_ARCHIVE_DIR is set)."""
+    return bool(archive_dir)
+
+
+def with_archive(
+    rows: list,
+    session: sql.Session,
+    filters: dict[str, str] | None = None,
+    from_date: int | None = None,
+    to_date: int | None = None,
+) -> list:
+    """
+    Appends archived rows to ``rows`` from the database when archival is
+    enabled, skipping ids already present.
+
+    Returns:
+        list: Database rows followed by archived History objects.
+    """
+    if not archive_enabled():
+        return rows
+    seen = {row.id_history for row in rows}
+    merged = list(rows)
+    for row in read_archive(filters, from_date, to_date, folders=archive_folders(session, filters)):
+        if row["id_history"] not in seen:
+            seen.add(row["id_history"])
+            merged.append(History(**row))
+    return merged
@@ -0,0 +1,162 @@
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import NamedTuple
+
+import sqlmodel as sql
+from sqlalchemy import String, func, literal_column
+
+from app.models import Institution, User
+from app.utils.table_versions import table_version
+
+# Rows fetched per prefix; a request may ask for fewer
+MAX_SUGGESTIONS = 50
+# Prefixes kept per engine and source
+cache_size = int(os.getenv("AUTOCOMPLETE_CACHE_SIZE", "1024"))
+# Seconds a prefix is served from the cache; bounds how stale suggestions get
+# after writes made by other workers or outside the API
+cache_ttl = float(os.getenv("AUTOCOMPLETE_CACHE_TTL", "30"))
+
+
+class PrefixSource(NamedTuple):
+    """A table offered for type-ahead: the columns matched by prefix and those returned."""
+
+    model: type
+    id_column: str
+    label_column: str
+    detail_column: str | None
+    key_columns: tuple[str, ...]
+
+
+AUTOCOMPLETE_SOURCES = {
+    "users": PrefixSource(User, "id_user", "username", "email", ("username", "email")),
+    "institutions": PrefixSource(Institution, "id_institution", "institution_name", None, ("institution_name",)),
+}
+
+
+class PrefixMatch(NamedTuple):
+    key: str
+    id: str
+    label: str | None
+    detail: str | None
+
+
+def normalize(prefix: str) -> str:
+    return prefix.strip().lower()
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def prefix_statement(source: PrefixSource, column: str, prefix: str):
+    """
+    ``lower(column) LIKE 'prefix%'`` ordered by the same expression.
+
+    On PostgreSQL the ``text_pattern_ops`` index on ``lower(column)`` answers
+    it as a range scan that stops after ``MAX_SUGGESTIONS`` rows.
+    """
+    table = source.model.__table__.columns
+    key = func.lower(table[column])
+    detail = table[source.detail_column] if source.detail_column else literal_column("NULL")
+    return (
+        sql.select(key.label("key"), table[source.id_column].cast(String), table[source.label_column], detail)
+        .where(key.like(_escape_like(prefix) + "%", escape="\\"))
+        .order_by(key)
+        .limit(MAX_SUGGESTIONS)
+    )
+
+
+def _matching(entries: list[PrefixMatch], prefix: str) -> list[PrefixMatch]:
+    """Entries of a sorted array whose key starts with ``prefix``, found by bisection."""
+    start = bisect_left(entries, (prefix,))
+    end = start
+    while end < len(entries) and entries[end].key.startswith(prefix):
+        end += 1
+    return entries[start:end]
+
+
+class PrefixCache:
+    """
+    Suggestions of recently typed prefixes for one table.
+
+    Each entry is a sorted array of up to ``MAX_SUGGESTIONS`` suggestions
+    per key column. When no column reached that limit the entry holds every
+    match, so longer prefixes ("ma" -> "mar" -> "mari") are answered from it
+    by bisection without a query. Least recently used prefixes are evicted
+    and the whole cache is dropped after a write to the table by this
+    process. Writes by other workers or outside the API are not seen, so
+    entries also expire ``cache_ttl`` seconds after they were read.
+    """
+
+    def __init__(self, version: tuple[int, ...]):
+        self.version = version
+        self.entries: OrderedDict[str, tuple[list[PrefixMatch], bool, float]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, prefix: str) -> list[PrefixMatch] | None:
+        now = time.monotonic()
+        with self.lock:
+            for length in range(len(prefix), -1, -1):
+                cached = self.entries.get(prefix[:length])
+                if cached is None:
+                    continue
+                entries, complete, expires_at = cached
+                if expires_at <= now:
+                    del self.entries[prefix[:length]]
+                    continue
+                if length == len(prefix):
+                    self.entries.move_to_end(prefix)
+                    return entries
+                if complete:
+                    return _matching(entries, prefix)
+            return None
+
+    def put(self, prefix: str, entries: list[PrefixMatch], complete: bool) -> None:
+        with self.lock:
+            self.entries[prefix] = (entries, complete, time.monotonic() + cache_ttl)
+            self.entries.move_to_end(prefix)
+            while len(self.entries) > cache_size:
+                self.entries.popitem(last=False)
+
+
+_lock = threading.Lock()
+_caches: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _cache(engine, name: str, source: PrefixSource) -> PrefixCache:
+    version = table_version(source.model.__tablename__)
+    with _lock:
+        caches = _caches.setdefault(engine, {})
+        cache = caches.get(name)
+        if cache is None or cache.version != version:
+            cache = caches[name] = PrefixCache(version)
+        return cache
+
+
+def suggest(session: sql.Session, name: str, prefix: str, limit: int) -> list[PrefixMatch]:
+    """
+    Up to ``limit`` rows of ``AUTOCOMPLETE_SOURCES[name]`` whose key columns
+    start with ``prefix`` (case-insensitive), ordered by the matched value.
+
+    Rows matching on several columns (a user's username and email) appear once.
+    """
+    source = AUTOCOMPLETE_SOURCES[name]
+    prefix = normalize(prefix)
+    cache = _cache(session.get_bind(), name, source)
+    entries = cache.get(prefix)
+    if entries is None:
+        results = [session.exec(prefix_statement(source, column, prefix)).all() for column in source.key_columns]
+        entries = sorted(PrefixMatch(*row) for rows in results for row in rows)
+        cache.put(prefix, entries, complete=all(len(rows) < MAX_SUGGESTIONS for rows in results))
+    suggestions, seen = [], set()
+    for entry in entries:
+        if entry.id not in seen:
+            seen.add(entry.id)
+            suggestions.append(entry)
+            if len(suggestions) == limit:
+                break
+    return suggestions
@@ -0,0 +1,31 @@
+import os
+
+import jwt
+from dotenv import load_dotenv
+from fastapi import Request
+from jwt.exceptions import InvalidTokenError
+from slowapi.util import get_remote_address
+
+load_dotenv()
+
+secret_key = os.getenv("SECRET_KEY")
+algorithm = os.getenv("ALGORITHM")
+
+
+def client_key(request: Request) -> str:
+    """
+    Identifies the caller: the JWT ``sub`` for requests with a valid access
+    token, the client address otherwise (refresh tokens included).
+
+    Used as the rate limit key and to pin a client's reads to the primary
+    after it writes.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            payload = jwt.decode(token, secret_key, algorithms=[algorithm])
+        except InvalidTokenError:
+            payload = {}
+        if payload.get("sub") and payload.get("token_type") == "access":
+            return f"user:{payload['sub']}"
+    return get_remote_address(request)
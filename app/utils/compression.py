@@ -0,0 +1,230 @@
+import importlib
+import os
+import zlib
+from collections import OrderedDict
+
+from starlette.datastructures import Headers, MutableHeaders
+
+# Responses smaller than this (bytes) are sent as they are
+minimum_size = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+# Compressed bodies kept per (path, ETag, encoding)
+CACHE_SIZE = 64
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/msgpack",
+    "application/vnd.apache.arrow.stream",
+    "application/javascript",
+    "text/",
+)
+
+
+class _Gzip:
+    name = "gzip"
+
+    def __init__(self):
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _Brotli:
+    name = "br"
+
+    def __init__(self):
+        self._compressor = importlib.import_module("brotli").Compressor(quality=4)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _Zstd:
+    name = "zstd"
+
+    def __init__(self):
+        zstandard = importlib.import_module("zstandard")
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(level=3).compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(self._flush_block)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _installed(module: str) -> bool:
+    try:
+        importlib.import_module(module)
+    except ImportError:
+        return False
+    return True
+
+
+# Preferred first; brotli and zstd are in requirements.txt, but an install
+# without them still serves gzip
+ENCODERS = {
+    encoder.name: encoder
+    for encoder, module in ((_Brotli, "brotli"), (_Zstd, "zstandard"), (_Gzip, "zlib"))
+    if _installed(module)
+}
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """
+    Picks the content coding for an ``Accept-Encoding`` header among the
+    available encoders, by ``q`` value and then by server preference.
+
+    Returns:
+        str | None: ``br``, ``zstd`` or ``gzip``; None for identity.
+    """
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        name, _, value = params.strip().partition("=")
+        if name == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        weights[coding.strip().lower()] = q
+    best, best_q = None, 0.0
+    for coding in ENCODERS:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compresses a whole body with ``encoding``."""
+    encoder = ENCODERS[encoding]()
+    return encoder.compress(body) + encoder.finish()
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Strong ETag of the ``encoding`` variant of a body: ``"abc"`` -> ``"abc-gzip"``."""
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _identity_etags(if_none_match: str, encoding: str) -> str:
+    """Maps the variant ETags of an ``If-None-Match`` header back to the identity ones."""
+    suffix = f'-{encoding}"'
+    return ", ".join(
+        f'{tag[:-len(suffix)]}"' if tag.endswith(suffix) else tag
+        for tag in (item.strip() for item in if_none_match.split(","))
+    )
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware that compresses responses with the best coding the
+    client accepts (brotli, zstd or gzip).
+
+    - Bodies under ``minimum_size`` bytes, non-compressible media types and
+      responses that already carry a ``Content-Encoding`` pass through.
+    - Streaming responses are compressed chunk by chunk and flushed after
+      each one, so the client keeps receiving data as it is produced.
+    - Bodies with a strong ``ETag`` are compressed once and served from a
+      small cache afterwards. The compressed variant gets its own ETag
+      (``encoded_etag``), mapped back in ``If-None-Match`` so the route
+      still sees the identity one.
+    """
+
+    def __init__(self, app, minimum_size: int = minimum_size, cache_size: int = CACHE_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache_size = cache_size
+        self.cache: OrderedDict[tuple[str, str, str], bytes] = OrderedDict()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        request_headers = MutableHeaders(scope=scope)
+        if "if-none-match" in request_headers:
+            request_headers["If-None-Match"] = _identity_etags(request_headers["if-none-match"], encoding)
+
+        start = None
+        encoder = None
+
+        async def send_compressed(message):
+            nonlocal start, encoder
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if start is not None:
+                headers = MutableHeaders(raw=start["headers"])
+                body = message.get("body", b"")
+                streaming = message.get("more_body", False)
+                media_type = headers.get("content-type", "")
+                if (
+                    "content-encoding" in headers
+                    or start["status"] in (204, 304)
+                    or not media_type.startswith(COMPRESSIBLE_TYPES)
+                    or (not streaming and len(body) < self.minimum_size)
+                ):
+                    await send(start)
+                    start = None
+                    await send(message)
+                    return
+
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = encoded_etag(etag, encoding)
+                if streaming:
+                    del headers["Content-Length"]
+                    encoder = ENCODERS[encoding]()
+                    await send(start)
+                    start = None
+                    await send({"type": "http.response.body", "body": encoder.compress(body), "more_body": True})
+                    return
+
+                body = self._compress_whole(scope["path"], etag, body, encoding)
+                headers["Content-Length"] = str(len(body))
+                await send(start)
+                start = None
+                await send({"type": "http.response.body", "body": body, "more_body": False})
+                return
+
+            if encoder is None:
+                await send(message)
+                return
+            chunk = encoder.compress(message.get("body", b""))
+            if message.get("more_body", False):
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            else:
+                await send({"type": "http.response.body", "body": chunk + encoder.finish(), "more_body": False})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _compress_whole(self, path: str, etag: str | None, body: bytes, encoding: str) -> bytes:
+        if not etag or etag.startswith("W/"):
+            return compress(body, encoding)
+        key = (path, etag, encoding)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        compressed = self.cache[key] = compress(body, encoding)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return compressed
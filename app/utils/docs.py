@@ -4,4 +4,8 @@ tags_metadata = [
         "name": "auth",
         "description": "Authentication and token management."
     },
+    {
+        "name": "search",
+        "description": "Full-text search over ppda and institutions."
+    },
 ]
\ No newline at end of file
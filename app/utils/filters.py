@@ -0,0 +1,124 @@
+import inspect
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from fastapi import HTTPException, Query, status
+
+SORT_DESCENDING = "-"
+
+
+class ListQuery(NamedTuple):
+    """WHERE and ORDER BY clauses parsed from a list route's query string."""
+
+    where: list
+    order_by: list
+
+    def apply(self, statement):
+        """Adds the clauses to ``statement``; values are bound as parameters."""
+        if self.where:
+            statement = statement.where(*self.where)
+        if self.order_by:
+            statement = statement.order_by(*self.order_by)
+        return statement
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def _convert(column, value: str):
+    """Converts a query string value to the column's Python type."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type in (int, float):
+            return python_type(value)
+    except ValueError:
+        raise _bad_request(f"Invalid value for {column.key}: {value}")
+    return value
+
+
+def _order_by(columns, sort: str) -> list:
+    order_by = []
+    for name in filter(None, (item.strip() for item in sort.split(","))):
+        key = name.removeprefix(SORT_DESCENDING)
+        if key not in columns:
+            raise _bad_request(f"Cannot sort by {key}")
+        order_by.append(columns[key].desc() if name.startswith(SORT_DESCENDING) else columns[key].asc())
+    return order_by
+
+
+def list_query(model, filters: tuple[str, ...] = (), ranges: tuple[str, ...] = (), sort: tuple[str, ...] = ()):
+    """
+    Dependency factory for filtering and sorting a list route in SQL.
+
+    Only the whitelisted (indexed) columns of ``model``'s table are accepted:
+
+    - ``filters``: ``?status=vigente``; repeat the parameter to match any
+      of several values (``?status=vigente&status=en_elaboracion``).
+    - ``ranges``: ``?start_date_from=...&start_date_to=...``, a
+      ``[from, to)`` window as in the history routes.
+    - ``sort``: ``?sort=-start_date,end_date``, ``-`` for descending.
+
+    Each column becomes a documented query parameter. The dependency
+    returns a ``ListQuery`` for the controller to apply to its SELECT.
+
+    Raises:
+        HTTPException: 400 for values of the wrong type or unknown sort keys.
+    """
+    table_columns = model.__table__.columns
+    sortable = {key: table_columns[key] for key in sort}
+    parameters = [
+        inspect.Parameter(
+            key,
+            inspect.Parameter.KEYWORD_ONLY,
+            default=Query(None, description=f"Only rows whose {key} is one of these values"),
+            annotation=Optional[list[str]],
+        )
+        for key in filters
+    ]
+    for key in ranges:
+        parameters += [
+            inspect.Parameter(
+                f"{key}_from",
+                inspect.Parameter.KEYWORD_ONLY,
+                default=Query(None, description=f"Only rows with {key} at or after this value"),
+                annotation=Optional[str],
+            ),
+            inspect.Parameter(
+                f"{key}_to",
+                inspect.Parameter.KEYWORD_ONLY,
+                default=Query(None, description=f"Only rows with {key} before this value"),
+                annotation=Optional[str],
+            ),
+        ]
+    if sort:
+        parameters.append(inspect.Parameter(
+            "sort",
+            inspect.Parameter.KEYWORD_ONLY,
+            default=Query(None, description=f"Comma-separated sort keys out of {', '.join(sort)}; prefix - for descending"),
+            annotation=Optional[str],
+        ))
+
+    def dependency(**params) -> ListQuery:
+        where = []
+        for key in filters:
+            values = params.get(key)
+            if values:
+                column = table_columns[key]
+                converted = [_convert(column, value) for value in values]
+                where.append(column == converted[0] if len(converted) == 1 else column.in_(converted))
+        for key in ranges:
+            column = table_columns[key]
+            if params.get(f"{key}_from") is not None:
+                where.append(column >= _convert(column, params[f"{key}_from"]))
+            if params.get(f"{key}_to") is not None:
+                where.append(column < _convert(column, params[f"{key}_to"]))
+        return ListQuery(where, _order_by(sortable, params["sort"]) if params.get("sort") else [])
+
+    dependency.__signature__ = inspect.Signature(parameters, return_annotation=ListQuery)
+    return dependency
@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+import uuid
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import TypeDecorator
+from sqlmodel.sql.sqltypes import AutoString
+
+# Bound in place of ids that are not valid UUIDs in comparisons, so lookups
+# on Postgres simply find nothing instead of failing with a cast error.
+NIL_UUID = uuid.UUID(int=0)
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generates a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits hold the Unix time in milliseconds and the next 12 bits
+    a counter seeded at random each millisecond, so ids generated by one
+    process are strictly increasing and new rows are appended at the end of
+    B-tree indexes instead of being scattered across them.
+
+    Returns:
+        uuid.UUID: A new UUIDv7.
+    """
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        timestamp, counter = _last_ms, _counter
+    tail = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+    value = (
+        (timestamp & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | tail
+    )
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """Default factory for primary keys: a UUIDv7 in its canonical string form."""
+    return str(uuid7())
+
+
+def uuid_field(value):
+    """
+    Validator for the id fields of request models: None or a UUID.
+
+    Use as ``field_validator("id_ppda", ...)(uuid_field)``; a malformed id
+    then answers 422 instead of reaching an INSERT or UPDATE.
+    """
+    if value is None:
+        return value
+    try:
+        uuid.UUID(str(value))
+    except ValueError:
+        raise ValueError("must be a UUID")
+    return value
+
+
+class UUIDString(TypeDecorator):
+    """
+    Id column stored as a native ``uuid`` on PostgreSQL and as text elsewhere.
+
+    Models keep handling ids as strings: values are converted to ``uuid.UUID``
+    when bound on PostgreSQL and back to ``str`` when loaded. A malformed id
+    written to the column is an error; compared with it (``WHERE id = ...``)
+    it matches nothing, see ``UUIDComparison``.
+    """
+
+    impl = AutoString
+    cache_ok = True
+
+    @property
+    def python_type(self):
+        return str
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(AutoString())
+
+    def coerce_compared_value(self, op, value):
+        return UUIDComparison()
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name != "postgresql" or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(str(value))
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else str(value)
+
+
+class UUIDComparison(UUIDString):
+    """Type of the values compared with a ``UUIDString`` column: malformed ids become ``NIL_UUID``."""
+
+    cache_ok = True
+
+    def coerce_compared_value(self, op, value):
+        return self
+
+    def process_bind_param(self, value, dialect):
+        try:
+            return super().process_bind_param(value, dialect)
+        except ValueError:
+            return NIL_UUID
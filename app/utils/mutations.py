@@ -0,0 +1,100 @@
+import sqlmodel as sql
+from fastapi import HTTPException, status
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+
+def dialect_insert(model, session: Session):
+    """
+    INSERT construct for the session's dialect, exposing ``on_conflict_do_nothing``
+    and ``on_conflict_do_update``.
+
+    Args:
+        model: Table model to insert into.
+        session (Session): Database session whose bind decides the dialect.
+
+    Returns:
+        Insert: PostgreSQL or SQLite flavoured INSERT statement.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise RuntimeError(f"INSERT ... ON CONFLICT is not supported for {dialect}")
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """
+    Tells whether an IntegrityError was raised by a foreign key constraint.
+
+    Args:
+        error (IntegrityError): Error raised by the database driver.
+
+    Returns:
+        bool: True for foreign key violations on PostgreSQL or SQLite.
+    """
+    if getattr(error.orig, "pgcode", None) == "23503":
+        return True
+    return "foreign key" in str(error.orig).lower()
+
+
+def update_returning(model, whereclause, values: dict, session: Session, not_found_detail: str):
+    """
+    Updates the rows matching ``whereclause`` and returns the first one in a
+    single ``UPDATE ... RETURNING`` statement, then commits.
+
+    With no values to set it degrades to a plain SELECT, so callers still get
+    the current row and the same 404 behaviour.
+
+    Args:
+        model: Table model to update.
+        whereclause: Filter identifying the row, usually a primary key comparison.
+        values (dict): Column values to set.
+        session (Session): Database session for operations.
+        not_found_detail (str): Detail of the 404 raised when no row matches.
+
+    Returns:
+        The updated row as an instance of ``model``.
+
+    Raises:
+        HTTPException: 404 if no row matches ``whereclause``.
+    """
+    if values:
+        statement = sql.update(model).where(whereclause).values(values).returning(model)
+        row = session.exec(statement).scalars().first()
+    else:
+        row = session.exec(sql.select(model).where(whereclause)).first()
+    if row is None:
+        session.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found_detail)
+    session.commit()
+    return row
+
+
+def delete_returning(model, whereclause, session: Session, not_found_detail: str):
+    """
+    Deletes the rows matching ``whereclause`` in a single
+    ``DELETE ... RETURNING`` statement, then commits.
+
+    Args:
+        model: Table model to delete from.
+        whereclause: Filter identifying the row, usually a primary key comparison.
+        session (Session): Database session for operations.
+        not_found_detail (str): Detail of the 404 raised when no row matches.
+
+    Returns:
+        The primary key of the deleted row.
+
+    Raises:
+        HTTPException: 404 if no row matches ``whereclause``.
+    """
+    primary_key = sql.inspect(model).primary_key
+    statement = sql.delete(model).where(whereclause).returning(*primary_key)
+    row = session.exec(statement).first()
+    if row is None:
+        session.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found_detail)
+    session.commit()
+    return row[0] if len(row) == 1 else tuple(row)
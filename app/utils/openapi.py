@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+from functools import lru_cache
+
+from fastapi import FastAPI, Request
+from fastapi.dependencies.utils import get_flat_dependant
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+from starlette.responses import Response
+
+from app.utils.compression import ENCODERS, compress, encoded_etag, negotiate_encoding
+
+# Generated at build time by `python -m app.cli build-openapi`
+openapi_file = os.getenv("OPENAPI_FILE", os.path.join(os.path.dirname(os.path.dirname(__file__)), "openapi.json"))
+FINGERPRINT_KEY = "x-route-fingerprint"
+
+
+def _params_signature(route: APIRoute) -> list:
+    """Path, query, header and cookie parameters of the route and all its dependencies."""
+    dependant = get_flat_dependant(route.dependant, skip_repeats=True)
+    return [
+        (
+            location,
+            param.alias,
+            repr(param.field_info.annotation),
+            param.field_info.is_required(),
+            repr(param.field_info.default),
+            param.field_info.description,
+            repr(param.field_info.metadata),
+        )
+        for location, params in (
+            ("path", dependant.path_params),
+            ("query", dependant.query_params),
+            ("header", dependant.header_params),
+            ("cookie", dependant.cookie_params),
+        )
+        for param in params
+    ]
+
+
+@lru_cache(maxsize=None)
+def _model_schema(model, mode: str) -> str | None:
+    # Many routes share a model; each schema is built once per process
+    if model is None:
+        return None
+    return json.dumps(TypeAdapter(model).json_schema(mode=mode), sort_keys=True)
+
+
+def route_fingerprint(app: FastAPI) -> str:
+    """
+    Hash of the documented routes: path, methods, endpoint, summary,
+    description, parameters, the JSON schemas of the body and response
+    models and extra responses. A saved schema with another fingerprint is stale.
+    """
+    signature = [
+        (
+            route.path,
+            sorted(route.methods),
+            f"{route.endpoint.__module__}.{route.endpoint.__qualname__}",
+            route.summary,
+            route.description,
+            [str(tag) for tag in route.tags],
+            _params_signature(route),
+            _model_schema(route.response_model, "serialization"),
+            repr(route.responses),
+            _model_schema(route.body_field.type_, "validation") if route.body_field else None,
+        )
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.include_in_schema
+    ]
+    signature.append((app.title, app.version, app.openapi_tags))
+    return hashlib.sha256(json.dumps(signature, default=str).encode()).hexdigest()
+
+
+def render_openapi(app: FastAPI) -> bytes:
+    """Generates the OpenAPI document with the route fingerprint, as compact JSON."""
+    app.openapi_schema = None
+    schema = dict(app.openapi(), **{FINGERPRINT_KEY: route_fingerprint(app)})
+    app.openapi_schema = schema
+    return json.dumps(schema, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def write_openapi(app: FastAPI, path: str | None = None) -> str:
+    """Writes the OpenAPI document to ``path`` (default OPENAPI_FILE) and returns the path."""
+    path = path or openapi_file
+    with open(path, "wb") as output:
+        output.write(render_openapi(app))
+    return path
+
+
+class OpenAPIDocument:
+    """
+    OpenAPI document kept as ready-to-send bytes, precompressed once with
+    every available encoding, with a strong ETag per encoding.
+    """
+
+    def __init__(self, body: bytes):
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.body = body
+        self.etag = f'"{digest}"'
+        self.variants = {
+            encoding: (compress(body, encoding), encoded_etag(self.etag, encoding))
+            for encoding in ENCODERS
+        }
+
+    def response(self, request: Request) -> Response:
+        headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        client_tags = {tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")}
+        encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+        if encoding is None:
+            body, headers["ETag"] = self.body, self.etag
+        else:
+            (body, headers["ETag"]), headers["Content-Encoding"] = self.variants[encoding], encoding
+        if client_tags & ({self.etag} | {etag for _, etag in self.variants.values()}):
+            headers.pop("Content-Encoding", None)
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+
+def load_openapi(app: FastAPI, path: str | None = None) -> OpenAPIDocument:
+    """
+    Loads the document written at build time, or renders it if the file is
+    missing or its routes, parameters or models changed since.
+    """
+    path = path or openapi_file
+    try:
+        with open(path, "rb") as source:
+            body = source.read()
+        schema = json.loads(body)
+    except (OSError, ValueError):
+        schema = None
+    if schema is None or schema.get(FINGERPRINT_KEY) != route_fingerprint(app):
+        body = render_openapi(app)
+    else:
+        app.openapi_schema = schema
+    return OpenAPIDocument(body)
+
+
+def install_openapi(app: FastAPI) -> None:
+    """
+    Serves ``app.openapi_url`` from the precomputed document instead of
+    FastAPI's handler, which builds the schema on the first request and
+    serializes it again on every one. The document is loaded on first use.
+    """
+    url = app.openapi_url
+    app.router.routes[:] = [route for route in app.router.routes if getattr(route, "path", None) != url]
+    document: list[OpenAPIDocument] = []
+
+    async def openapi(request: Request) -> Response:
+        if not document:
+            document.append(load_openapi(app))
+        return document[0].response(request)
+
+    app.add_route(url, openapi, include_in_schema=False)
@@ -0,0 +1,162 @@
+import os
+import re
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+HISTORY_TABLE = "history"
+HISTORY_DEFAULT_PARTITION = "history_default"
+# Monthly partitions created ahead of the current month
+months_ahead = int(os.getenv("HISTORY_PARTITIONS_AHEAD", "3"))
+# pg_advisory_xact_lock key serializing partition maintenance
+PARTITIONS_LOCK = 0x68697374  # "hist"
+
+_partition_name = re.compile(r"^history_y(\d{4})m(\d{2})$")
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant (UTC) of the month containing ``moment``."""
+    moment = moment.astimezone(timezone.utc) if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(moment: datetime, months: int) -> datetime:
+    """Same day and time ``months`` later; only used with month starts."""
+    index = moment.year * 12 + moment.month - 1 + months
+    return moment.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(start: datetime) -> str:
+    return f"history_y{start.year}m{start.month:02d}"
+
+
+def is_partitioned(connection) -> bool:
+    """Whether ``history`` is a partitioned table (PostgreSQL after the partitioning migration)."""
+    if connection.dialect.name != "postgresql":
+        return False
+    return connection.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))"),
+        {"table": HISTORY_TABLE},
+    ).scalar()
+
+
+def existing_partitions(connection) -> set[str] | None:
+    """
+    Names of the partitions attached to ``history``, read with one query.
+
+    Returns:
+        set[str] | None: Partition names, or None if ``history`` is not partitioned.
+    """
+    if connection.dialect.name != "postgresql":
+        return None
+    partitioned, names = connection.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)), "
+            "ARRAY(SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table))"
+        ),
+        {"table": HISTORY_TABLE},
+    ).one()
+    return set(names) if partitioned else None
+
+
+def create_history_partition(connection, start: datetime) -> bool:
+    """
+    Creates the monthly partition starting at ``start``.
+
+    Rows of that month that landed in the default partition are moved into
+    the new one before it is attached, as PostgreSQL requires.
+
+    Args:
+        connection: Connection inside a transaction.
+        start (datetime): First instant of the month.
+
+    Returns:
+        bool: False if the partition already existed.
+    """
+    name = partition_name(start)
+    exists = connection.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}).scalar()
+    if exists:
+        return False
+    bounds = {
+        "lower": int(start.timestamp()),
+        "upper": int(add_months(start, 1).timestamp()),
+    }
+    connection.execute(text(f'CREATE TABLE IF NOT EXISTS "{name}" (LIKE {HISTORY_TABLE} INCLUDING DEFAULTS)'))
+    connection.execute(
+        text(
+            f"WITH moved AS ("
+            f"DELETE FROM {HISTORY_DEFAULT_PARTITION} "
+            f"WHERE created_at >= :lower AND created_at < :upper RETURNING *"
+            f') INSERT INTO "{name}" SELECT * FROM moved'
+        ),
+        bounds,
+    )
+    connection.execute(
+        text(
+            f'ALTER TABLE {HISTORY_TABLE} ATTACH PARTITION "{name}" '
+            f"FOR VALUES FROM ({bounds['lower']}) TO ({bounds['upper']})"
+        )
+    )
+    return True
+
+
+def ensure_history_partitions(connection, since: datetime | None = None, ahead: int | None = None) -> list[str]:
+    """
+    Makes sure monthly partitions exist from ``since`` (default: this month)
+    up to ``ahead`` months in the future.
+
+    Does nothing when ``history`` is not partitioned, e.g. on SQLite. Run by
+    the partitioning migration and by ``python -m app.cli
+    ensure-history-partitions``, scheduled monthly; not at startup. When
+    partitions are missing it takes a transaction-level advisory lock first,
+    so concurrent runs create each partition once.
+
+    Returns:
+        list[str]: Names of the partitions created.
+    """
+    existing = existing_partitions(connection)
+    if existing is None:
+        return []
+    now = month_start(datetime.now(timezone.utc))
+    first = month_start(since) if since else now
+    last = add_months(now, months_ahead if ahead is None else ahead)
+    months = []
+    while first <= last:
+        months.append(first)
+        first = add_months(first, 1)
+    if all(partition_name(start) in existing for start in months):
+        return []
+    connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITIONS_LOCK})
+    created = []
+    for start in months:
+        if partition_name(start) not in existing and create_history_partition(connection, start):
+            created.append(partition_name(start))
+    return created
+
+
+def detach_history_partitions(connection, before: datetime) -> list[str]:
+    """
+    Detaches the monthly partitions that end on or before ``before``.
+
+    Detached partitions become ordinary tables that can be archived or
+    dropped without touching the live table.
+
+    Returns:
+        list[str]: Names of the partitions detached.
+    """
+    names = existing_partitions(connection)
+    if names is None:
+        return []
+    limit = month_start(before)
+    detached = []
+    for name in sorted(names):
+        match = _partition_name.match(name)
+        if not match:
+            continue
+        start = datetime(int(match[1]), int(match[2]), 1, tzinfo=timezone.utc)
+        if add_months(start, 1) <= limit:
+            connection.execute(text(f'ALTER TABLE {HISTORY_TABLE} DETACH PARTITION "{name}"'))
+            detached.append(name)
+    return detached
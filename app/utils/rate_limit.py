@@ -0,0 +1,209 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from math import floor
+from typing import get_origin
+
+from dotenv import load_dotenv
+from fastapi import Request
+from limits.storage import SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
+from slowapi import Limiter
+from starlette.routing import Match
+
+from app.utils.clients import client_key
+
+load_dotenv()
+
+# "memory://" keeps the counters inside each worker. Use "sqlite:///<path>"
+# (a file on /dev/shm works as shared memory) or "redis://host:port" so that
+# every uvicorn worker draws from the same counters.
+storage_uri = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+strategy = os.getenv("RATE_LIMIT_STRATEGY", "sliding-window-counter")
+
+# How many hits a request consumes from the caller's budget, roughly
+# proportional to the database work behind the route.
+COST_GET = 1
+COST_LIST = 5
+COST_EXPORT = 50
+
+
+def cost(weight: int):
+    """
+    Sets the rate limit cost of a route, overriding the inferred one.
+
+    Must be applied below the ``@router.<method>`` decorator so that the
+    router registers the marked function.
+    """
+    def decorator(endpoint):
+        endpoint.rate_limit_cost = weight
+        return endpoint
+    return decorator
+
+
+def route_cost(route) -> int:
+    """
+    Cost of a single route: the explicit ``@cost`` weight if present,
+    ``COST_LIST`` for routes answering with a list and ``COST_GET`` otherwise.
+    """
+    weight = getattr(getattr(route, "endpoint", None), "rate_limit_cost", None)
+    if weight is not None:
+        return weight
+    if get_origin(getattr(route, "response_model", None)) is list:
+        return COST_LIST
+    return COST_GET
+
+
+def request_cost(request: Request) -> int:
+    """Cost of the route that will handle ``request``."""
+    for route in request.app.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route_cost(route)
+    return COST_GET
+
+
+class WeightedLimiter(Limiter):
+    """
+    Limiter with one budget per client shared by every route.
+
+    The limits are slowapi application limits (a single "global" scope,
+    keyed by ``client_key``) instead of default limits, which slowapi
+    counts per endpoint; each request charges its route cost.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("key_func", client_key)
+        super().__init__(*args, **kwargs)
+        for limit_group in self._application_limits:
+            limit_group.cost = request_cost
+
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """
+    Rate limit storage backed by a SQLite file.
+
+    Every worker opening the same file shares the counters, and they survive
+    restarts. Each hit runs inside a ``BEGIN IMMEDIATE`` transaction, so reading
+    the sliding window and incrementing it is atomic across processes.
+
+    URI format follows SQLAlchemy: ``sqlite:///relative.db``,
+    ``sqlite:////absolute/path.db`` or ``sqlite://`` for a private in-memory
+    database.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str | None = None, wrap_exceptions: bool = False, **options):
+        path = (uri or "sqlite://").split("://", 1)[1][1:] or ":memory:"
+        self.connection = sqlite3.connect(
+            path,
+            timeout=float(options.get("timeout", 5)),
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self.lock = threading.Lock()
+        with self.lock:
+            if path != ":memory:":
+                self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit ("
+                "key TEXT PRIMARY KEY, "
+                "count INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_rate_limit_expires_at ON rate_limit (expires_at)"
+            )
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return sqlite3.Error
+
+    @contextmanager
+    def _transaction(self):
+        """Runs the wrapped statements as one write transaction across processes."""
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def _incr(self, connection, key: str, expiry: float, elastic_expiry: bool, amount: int, now: float) -> int:
+        connection.execute("DELETE FROM rate_limit WHERE expires_at <= ?", (now,))
+        connection.execute(
+            "INSERT INTO rate_limit (key, count, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET count = count + excluded.count, "
+            "expires_at = CASE WHEN ? THEN excluded.expires_at ELSE expires_at END",
+            (key, amount, now + expiry, elastic_expiry),
+        )
+        return connection.execute("SELECT count FROM rate_limit WHERE key = ?", (key,)).fetchone()[0]
+
+    def _get(self, connection, key: str, now: float) -> int:
+        row = connection.execute(
+            "SELECT count FROM rate_limit WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def incr(self, key: str, expiry: int, elastic_expiry: bool = False, amount: int = 1) -> int:
+        with self._transaction() as connection:
+            return self._incr(connection, key, expiry, elastic_expiry, amount, time.time())
+
+    def get(self, key: str) -> int:
+        with self.lock:
+            return self._get(self.connection, key, time.time())
+
+    def get_expiry(self, key: str) -> float:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT expires_at FROM rate_limit WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else time.time()
+
+    def check(self) -> bool:
+        try:
+            with self.lock:
+                self.connection.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> int | None:
+        with self._transaction() as connection:
+            return connection.execute("DELETE FROM rate_limit").rowcount
+
+    def clear(self, key: str) -> None:
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM rate_limit WHERE key = ?", (key,))
+
+    def _sliding_window(self, connection, key: str, expiry: int, now: float) -> tuple[int, float, int, float, str]:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count = self._get(connection, previous_key, now)
+        current_count = self._get(connection, current_key, now)
+        previous_ttl = 0.0 if previous_count == 0 else (1 - (((now - expiry) / expiry) % 1)) * expiry
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl, current_key
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        with self._transaction() as connection:
+            previous_count, previous_ttl, current_count, _, current_key = self._sliding_window(
+                connection, key, expiry, now
+            )
+            weighted_count = previous_count * previous_ttl / expiry + current_count
+            if floor(weighted_count) + amount > limit:
+                return False
+            self._incr(connection, current_key, 2 * expiry, False, amount, now)
+            return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        with self.lock:
+            return self._sliding_window(self.connection, key, expiry, time.time())[:4]
@@ -1,11 +1,11 @@
 from typing import List, Annotated
 from fastapi import Depends, HTTPException, status
 
-from app.utils.auth import get_current_user
+from app.utils.auth import get_current_user, verify_access_token
 from app.models.User import User
 from app.models import UserInstitution, Role
 
-from sqlmodel import Session, select
+from sqlmodel import Session, and_, select
 from app.db import get_session
 
 
@@ -44,3 +44,69 @@ def verify_institution_role(
             )
     
     return True
+
+
+def authorize_resource(model, required_role: Role, not_found_detail: str):
+    """
+    Builds a dependency that authenticates the caller and authorizes access to
+    the ``model`` row addressed by the ``id`` path parameter.
+
+    The user, the resource and the caller's role in the resource's institution
+    are loaded with a single joined statement, instead of one query for
+    ``get_current_user``, one for the resource and one for
+    ``verify_institution_role``.
+
+    Args:
+        model: Table model with an ``id_institution`` column.
+        required_role (Role): Minimum role needed in the resource's institution.
+        not_found_detail (str): Error detail when the resource does not exist.
+
+    Returns:
+        Callable: FastAPI dependency returning the authorized resource.
+    """
+    primary_key = next(iter(model.__table__.primary_key.columns))
+
+    async def dependency(
+        id: str,
+        payload: Annotated[dict, Depends(verify_access_token)],
+        session: Session = Depends(get_session)
+    ):
+        credentials_exception = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials"
+        )
+        username = payload.get("sub")
+        if username is None:
+            raise credentials_exception
+
+        row = session.exec(
+            select(User, model, UserInstitution.role)
+            .select_from(User)
+            .outerjoin(model, primary_key == id)
+            .outerjoin(UserInstitution, and_(
+                UserInstitution.id_user == User.id_user,
+                UserInstitution.id_institution == model.id_institution
+            ))
+            .where(User.username == username)
+        ).first()
+
+        if row is None:
+            raise credentials_exception
+        user, resource, role = row
+        if resource is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found_detail)
+        if user.is_admin:
+            return resource
+        if role is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="User in not member of all required institutions"
+            )
+        if role < required_role:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"User can't execute this action for institution: {resource.id_institution}"
+            )
+        return resource
+
+    return dependency
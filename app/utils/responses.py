@@ -0,0 +1,253 @@
+import importlib
+from functools import cache
+from typing import Iterable, Iterator
+
+import sqlmodel as sql
+from fastapi import HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from sqlalchemy import Column, Text, func, literal_column
+from sqlalchemy.engine import Row
+
+# Rows fetched per round trip when streaming JSON built by PostgreSQL
+JSON_STREAM_BATCH = 2000
+
+# Formats list endpoints can answer with, chosen from the Accept header
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+LIST_FORMATS = (JSON, MSGPACK, ARROW_STREAM)
+
+# Extra 200 content types for the OpenAPI document of list routes
+LIST_RESPONSES = {
+    status.HTTP_200_OK: {
+        "content": {
+            MSGPACK: {"schema": {"type": "string", "format": "binary"}},
+            ARROW_STREAM: {"schema": {"type": "string", "format": "binary"}},
+        },
+    },
+}
+
+
+def table_select(model, columns: list[Column] | None = None):
+    """
+    SELECT of the columns of ``model``'s table, or only ``columns`` when given
+    (see ``field_selection``).
+
+    Rows come back as tuples instead of ORM objects, which skips identity
+    map bookkeeping for large read-only listings. Rows still expose the
+    columns as attributes (``row.id_history``).
+    """
+    return sql.select(*(columns or model.__table__.columns))
+
+
+def field_selection(model):
+    """
+    Dependency factory for the ``fields`` query parameter of list routes
+    (sparse fieldsets): ``?fields=id_ppda,name,status``.
+
+    The dependency returns the requested columns of ``model``'s table, in
+    the given order, to be passed to ``table_select`` so the SELECT itself
+    is narrowed, and to ``rows_response`` so only those keys are sent.
+    Without the parameter it returns None (every column).
+
+    Raises:
+        HTTPException: 400 if a name is not a column of the model.
+    """
+    table_columns = model.__table__.columns
+    allowed = [column.key for column in table_columns if column.key in model.model_fields]
+
+    def dependency(
+        fields: str | None = Query(None, description=f"Comma-separated columns to return, out of: {', '.join(allowed)}"),
+    ) -> list[Column] | None:
+        if not fields:
+            return None
+        names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+        unknown = [name for name in names if name not in allowed]
+        if unknown or not names:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown) or fields}",
+            )
+        return [table_columns[name] for name in names]
+
+    return dependency
+
+
+def response_format(request: Request) -> str:
+    """
+    Dependency that picks the list format from the ``Accept`` header:
+    ``application/json`` (default), ``application/msgpack`` or
+    ``application/vnd.apache.arrow.stream``.
+
+    Media types are ranked by their ``q`` value; wildcards and unknown types
+    fall back to JSON, as FastAPI does for the other routes.
+    """
+    best, best_q = JSON, 0.0
+    for item in request.headers.get("accept", "").split(","):
+        media_type, _, params = item.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type.strip().lower() in LIST_FORMATS and q > best_q:
+            best, best_q = media_type.strip().lower(), q
+    return best
+
+
+@cache
+def _row_keys(model) -> tuple[str, ...] | None:
+    """Column keys of ``model``'s table if they are exactly its fields, else None."""
+    keys = tuple(column.key for column in model.__table__.columns)
+    return keys if set(keys) == set(model.model_fields) else None
+
+
+def _records(rows: Iterable, model, columns: list[Column] | None = None) -> list[dict]:
+    if columns is not None:
+        keys = [column.key for column in columns]
+        return [{key: getattr(row, key) for key in keys} for row in rows]
+    keys = _row_keys(model)
+    if keys is None:
+        return [model.model_validate(row).model_dump(mode="json") for row in rows]
+    return [
+        row._asdict() if isinstance(row, Row) else {key: getattr(row, key) for key in keys}
+        for row in rows
+    ]
+
+
+def _optional_module(name: str, media_type: str):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail=f"{media_type} is not available on this server",
+        )
+
+
+def _arrow_type(pa, column):
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return None
+    if python_type is bool:
+        return pa.bool_()
+    if python_type is int:
+        return pa.int64()
+    if python_type is float:
+        return pa.float64()
+    if python_type is str:
+        return pa.string()
+    return None  # inferred from the values
+
+
+def _arrow_stream(rows: list, model, columns: list[Column] | None = None) -> bytes:
+    """
+    Arrow IPC stream built column by column: the result tuples are
+    transposed once and each column becomes a typed array, so integer
+    series are sent as packed int64 buffers readers can use without copies.
+    """
+    pa = _optional_module("pyarrow", ARROW_STREAM)
+    ipc = _optional_module("pyarrow.ipc", ARROW_STREAM)
+    columns = list(columns or model.__table__.columns)
+    keys = tuple(column.key for column in columns)
+    # Rows may be mixed: result tuples followed by archived History objects
+    rows = [
+        row if isinstance(row, Row) and row._fields == keys else tuple(getattr(row, key) for key in keys)
+        for row in rows
+    ]
+    values = list(zip(*rows)) if rows else [()] * len(columns)
+    table = pa.Table.from_arrays(
+        [pa.array(column_values, type=_arrow_type(pa, column)) for column, column_values in zip(columns, values)],
+        names=[column.key for column in columns],
+    )
+    sink = pa.BufferOutputStream()
+    with ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def rows_response(
+    rows: Iterable,
+    model,
+    media_type: str = JSON,
+    status_code: int = status.HTTP_200_OK,
+    columns: list[Column] | None = None,
+) -> Response:
+    """
+    Serializes a list endpoint's rows without validating each one against
+    the response model.
+
+    Only safe when the response model is the table model itself: every
+    column is a field and there is nothing to compute or hide. Otherwise the
+    rows go through the model as FastAPI would do.
+
+    A response already built by the controller (``json_rows_response``) is
+    returned as is.
+
+    Args:
+        rows (Iterable): Result tuples from ``table_select`` or model instances.
+        model: Table model declared as the route's ``response_model`` items.
+        media_type (str): Format chosen by ``response_format``.
+        status_code (int): Response status.
+        columns (list[Column] | None): Sparse fieldset from ``field_selection``;
+            only these keys are sent.
+
+    Returns:
+        Response: The serialized list.
+
+    Raises:
+        HTTPException: 406 if the format needs a package that is not installed.
+    """
+    if isinstance(rows, Response):
+        return rows
+    headers = {"Vary": "Accept"}
+    if media_type == ARROW_STREAM:
+        body = _arrow_stream(list(rows), model, columns)
+        return Response(body, status_code=status_code, media_type=ARROW_STREAM, headers=headers)
+    if media_type == MSGPACK:
+        msgpack = _optional_module("msgpack", MSGPACK)
+        body = msgpack.packb(_records(rows, model, columns))
+        return Response(body, status_code=status_code, media_type=MSGPACK, headers=headers)
+    return ORJSONResponse(_records(rows, model, columns), status_code=status_code, headers=headers)
+
+
+def sql_json_available(session: sql.Session, statement) -> bool:
+    """Whether ``statement`` runs on PostgreSQL, which can build the JSON itself."""
+    return session.get_bind(clause=statement).dialect.name == "postgresql"
+
+
+def json_rows_statement(statement):
+    """``SELECT row_to_json(rows)::text FROM (<statement>) AS rows``: one JSON object per row."""
+    rows = statement.subquery("rows")
+    return sql.select(func.row_to_json(literal_column(rows.name)).cast(Text)).select_from(rows)
+
+
+def _stream_json(bind, statement) -> Iterator[bytes]:
+    # Uses its own connection: the request session is released before the
+    # response body is sent.
+    with bind.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=JSON_STREAM_BATCH).execute(statement)
+        separator = b"["
+        for batch in result.scalars().partitions():
+            yield separator + ",".join(batch).encode()
+            separator = b","
+        yield b"]" if separator == b"," else b"[]"
+
+
+def json_rows_response(session: sql.Session, statement) -> StreamingResponse:
+    """
+    Streams the rows of ``statement`` as a JSON array built by PostgreSQL.
+
+    Each row is converted with ``row_to_json`` and read in batches through a
+    server-side cursor, so no ORM objects or Python dicts are created and
+    memory stays flat however long the list is. The keys are the column
+    names, as in ``rows_response``.
+    """
+    bind = session.get_bind(clause=statement)
+    return StreamingResponse(
+        _stream_json(bind, json_rows_statement(statement)), media_type="application/json", headers={"Vary": "Accept"}
+    )
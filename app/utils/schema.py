@@ -0,0 +1,122 @@
+import glob
+import logging
+import os
+import re
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import SQLModel
+
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "migrations")
+# What to do at startup when the database is not at the Alembic head: fail | warn | off
+schema_check = os.getenv("SCHEMA_CHECK", "fail")
+
+_revision_line = re.compile(r"^(revision|down_revision)\b[^=\n]*=(.*)$", re.MULTILINE)
+_revision_id = re.compile(r"['\"](\w+)['\"]")
+
+
+def _script_directory():
+    # Imported here so alembic is only loaded when the schema is checked
+    from alembic.script import ScriptDirectory
+    return ScriptDirectory(MIGRATIONS_DIR)
+
+
+def head_revisions() -> set[str]:
+    """
+    Alembic head revisions of the migrations shipped with the code.
+
+    Reads the ``revision``/``down_revision`` lines of the migration files
+    instead of loading alembic and executing every migration module, which
+    would add tens of milliseconds to each worker's startup.
+
+    Returns:
+        set[str]: Revisions that no other migration revises.
+    """
+    revisions, revised = set(), set()
+    for path in glob.glob(os.path.join(MIGRATIONS_DIR, "versions", "*.py")):
+        with open(path, encoding="utf-8") as source:
+            fields = dict(_revision_line.findall(source.read()))
+        if "revision" in fields:
+            revisions.update(_revision_id.findall(fields["revision"])[:1])
+            revised.update(_revision_id.findall(fields.get("down_revision", "")))
+    return revisions - revised
+
+
+def current_revisions(connection) -> set[str]:
+    """
+    Revisions recorded in ``alembic_version``, read with a single query.
+
+    Returns:
+        set[str]: Current revisions; empty if the table does not exist.
+    """
+    try:
+        return set(connection.execute(text("SELECT version_num FROM alembic_version")).scalars())
+    except DBAPIError:
+        connection.rollback()
+        return set()
+
+
+def check_schema(engine, mode: str | None = None) -> bool:
+    """
+    Compares the database's ``alembic_version`` with the migrations' head.
+
+    Args:
+        engine: Engine of the primary database.
+        mode (str | None): ``fail`` raises, ``warn`` logs and ``off`` skips
+            the check. Defaults to SCHEMA_CHECK.
+
+    Returns:
+        bool: True if the schema is current or the check is off.
+
+    Raises:
+        RuntimeError: In ``fail`` mode, if the schema is not at the head.
+    """
+    mode = mode or schema_check
+    if mode == "off":
+        return True
+    with engine.connect() as connection:
+        current = current_revisions(connection)
+    head = head_revisions()
+    if current == head:
+        return True
+    message = (
+        f"Database schema is at {sorted(current) or 'no revision'}, expected {sorted(head)}. "
+        "Run `alembic upgrade head` (or `python -m app.cli create-schema` on an empty database)."
+    )
+    if mode == "warn":
+        logger.warning(message)
+        return False
+    raise RuntimeError(message)
+
+
+def create_schema(engine) -> None:
+    """
+    Creates the schema of an empty database at the Alembic head.
+
+    On PostgreSQL this runs every migration (``alembic upgrade head``): the
+    partitioned history table, triggers and expression indexes only exist
+    there, and creating the tables from the models would stamp a database
+    that lacks them. SQLite, whose migrations add nothing beyond the
+    models, gets the tables from the models and the head stamped.
+
+    Meant for empty databases; existing ones are upgraded with Alembic.
+    """
+    if engine.dialect.name != "sqlite":
+        from alembic import command
+        from alembic.config import Config
+
+        config = Config()
+        config.set_main_option("script_location", MIGRATIONS_DIR)
+        with engine.begin() as connection:
+            config.attributes["connection"] = connection
+            command.upgrade(config, "heads")
+        return
+
+    from alembic.migration import MigrationContext
+
+    SQLModel.metadata.create_all(engine, checkfirst=True)
+    with engine.begin() as connection:
+        MigrationContext.configure(connection).stamp(_script_directory(), "heads")
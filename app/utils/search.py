@@ -0,0 +1,196 @@
+import math
+import re
+import threading
+import unicodedata
+import weakref
+from typing import NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.utils.table_versions import table_version
+
+# Text search configuration created by the full-text search migration:
+# Spanish stemming on unaccented words.
+SEARCH_CONFIG = "es_unaccent"
+
+
+class SearchSource(NamedTuple):
+    """A searchable table: its id and title columns and the columns whose text is indexed."""
+
+    table: str
+    id_column: str
+    title_column: str
+    text_columns: tuple[str, ...]
+
+
+SEARCH_SOURCES = {
+    "ppda": SearchSource("ppda", "id_ppda", "name", ("name", "description", "municipality")),
+    "institution": SearchSource("institution", "id_institution", "institution_name", ("institution_name",)),
+}
+
+
+def document_sql(source: SearchSource) -> str:
+    """
+    ``to_tsvector`` expression of a source, as indexed by the GIN indexes of
+    the full-text search migration.
+
+    Queries must use this exact expression for PostgreSQL to use the index;
+    changing a source's columns needs a migration that rebuilds its index.
+    """
+    document = " || ' ' || ".join(f"coalesce({column}, '')" for column in source.text_columns)
+    return f"to_tsvector('{SEARCH_CONFIG}', {document})"
+
+
+def _hits_sql(kinds: list[str]) -> str:
+    """UNION ALL of the matching rows of each source in ``kinds``, with their rank."""
+    selects = []
+    for kind in kinds:
+        source = SEARCH_SOURCES[kind]
+        document = document_sql(source)
+        selects.append(
+            f"SELECT '{kind}' AS kind, CAST({source.id_column} AS TEXT) AS id, "
+            f"{source.title_column} AS title, ts_rank_cd({document}, query) AS rank "
+            f"FROM {source.table}, websearch_to_tsquery('{SEARCH_CONFIG}', :q) AS query "
+            f"WHERE {document} @@ query"
+        )
+    return " UNION ALL ".join(selects)
+
+
+def search_statement(kinds: list[str]):
+    """
+    PostgreSQL search over ``kinds``: ``websearch_to_tsquery`` against the
+    indexed documents, ranked with ``ts_rank_cd`` and paginated, with the
+    total number of hits on every row.
+
+    Bound parameters: ``q``, ``limit`` and ``offset``.
+    """
+    return text(
+        f"SELECT kind, id, title, rank, count(*) OVER () AS total FROM ({_hits_sql(kinds)}) AS hits "
+        "ORDER BY rank DESC, title LIMIT :limit OFFSET :offset"
+    )
+
+
+def count_statement(kinds: list[str]):
+    """
+    Number of PostgreSQL search hits over ``kinds``, for pages past the last
+    hit (which carry no ``total``). Bound parameter: ``q``.
+    """
+    return text(f"SELECT count(*) FROM ({_hits_sql(kinds)}) AS hits")
+
+
+_word = re.compile(r"\w+")
+# Words the Spanish configuration drops as well
+STOPWORDS = frozenset(
+    "a al con de del e el en la las lo los o para por se sin su sus u un una y".split()
+)
+
+
+def tokenize(value: str | None) -> list[str]:
+    """
+    Lowercased, unaccented words of ``value`` without stopwords, with a
+    trailing plural ``s``/``es`` removed so that "planes" matches "plan".
+    """
+    if not value:
+        return []
+    value = "".join(
+        char for char in unicodedata.normalize("NFKD", value.lower()) if not unicodedata.combining(char)
+    )
+    tokens = []
+    for word in _word.findall(value):
+        if word in STOPWORDS:
+            continue
+        if len(word) > 4 and word.endswith("es"):
+            word = word[:-2]
+        elif len(word) > 3 and word.endswith("s"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+class SearchHit(NamedTuple):
+    kind: str
+    id: str
+    title: str | None
+    rank: float
+
+
+class InvertedIndex:
+    """
+    In-process inverted index used where PostgreSQL full-text search is not
+    available (SQLite).
+
+    Maps each token to the documents containing it, so a query only visits
+    the postings of its own words. All words must match, as with
+    ``websearch_to_tsquery``, and hits are ranked with BM25.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self.postings: dict[str, dict[tuple[str, str], int]] = {}
+        self.documents: dict[tuple[str, str], tuple[str | None, int]] = {}
+
+    def add(self, kind: str, id: str, title: str | None, *values: str | None) -> None:
+        tokens = [token for value in values for token in tokenize(value)]
+        key = (kind, id)
+        self.documents[key] = (title, len(tokens))
+        for token in tokens:
+            counts = self.postings.setdefault(token, {})
+            counts[key] = counts.get(key, 0) + 1
+
+    def search(self, query: str, kinds: list[str], limit: int, offset: int) -> tuple[int, list[SearchHit]]:
+        """
+        Returns:
+            tuple[int, list[SearchHit]]: Total number of hits and the requested page.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or not self.documents:
+            return 0, []
+        postings = sorted((self.postings.get(token, {}) for token in tokens), key=len)
+        keys = [key for key in postings[0] if key[0] in kinds and all(key in other for other in postings[1:])]
+        average_length = sum(length for _, length in self.documents.values()) / len(self.documents) or 1
+        hits = []
+        for key in keys:
+            title, length = self.documents[key]
+            score = 0.0
+            for counts in postings:
+                idf = math.log(1 + (len(self.documents) - len(counts) + 0.5) / (len(counts) + 0.5))
+                frequency = counts[key]
+                score += idf * frequency * (self.K1 + 1) / (
+                    frequency + self.K1 * (1 - self.B + self.B * length / average_length)
+                )
+            hits.append(SearchHit(key[0], key[1], title, round(score, 6)))
+        hits.sort(key=lambda hit: (-hit.rank, hit.title or ""))
+        return len(hits), hits[offset:offset + limit]
+
+
+_lock = threading.Lock()
+# Index per engine, rebuilt after any write to a searchable table
+_indexes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_searchable_tables = tuple(source.table for source in SEARCH_SOURCES.values())
+
+
+def build_index(connection) -> InvertedIndex:
+    index = InvertedIndex()
+    for kind, source in SEARCH_SOURCES.items():
+        columns = ", ".join(dict.fromkeys((source.id_column, source.title_column) + source.text_columns))
+        for row in connection.execute(text(f"SELECT {columns} FROM {source.table}")).mappings():
+            index.add(kind, str(row[source.id_column]), row[source.title_column],
+                      *(row[column] for column in source.text_columns))
+    return index
+
+
+def get_index(session: Session) -> InvertedIndex:
+    """The inverted index of the session's database, built on first use and after writes."""
+    engine = session.get_bind()
+    version = table_version(*_searchable_tables)
+    with _lock:
+        built_at, index = _indexes.get(engine, (None, None))
+    if built_at == version:
+        return index
+    index = build_index(session.connection())
+    with _lock:
+        _indexes[engine] = (version, index)
+    return index
@@ -0,0 +1,181 @@
+import math
+import threading
+import weakref
+from typing import NamedTuple
+
+import sqlmodel as sql
+from fastapi import HTTPException, status
+from sqlalchemy import column, literal_column, table, text
+
+from app.models import Ppda
+from app.models.Ppda import BBOX_COLUMNS, SQLITE_RTREE, postgres_box
+from app.utils.table_versions import table_version
+
+# Entries per node of the in-process R-tree
+NODE_CAPACITY = 16
+
+
+class BBox(NamedTuple):
+    min_lon: float
+    min_lat: float
+    max_lon: float
+    max_lat: float
+
+    def intersects(self, other: "BBox") -> bool:
+        return (
+            self.min_lon <= other.max_lon and other.min_lon <= self.max_lon
+            and self.min_lat <= other.max_lat and other.min_lat <= self.max_lat
+        )
+
+    def union(self, other: "BBox") -> "BBox":
+        return BBox(
+            min(self.min_lon, other.min_lon), min(self.min_lat, other.min_lat),
+            max(self.max_lon, other.max_lon), max(self.max_lat, other.max_lat),
+        )
+
+
+def point_bbox(lat: float, lon: float) -> BBox:
+    return BBox(lon, lat, lon, lat)
+
+
+def parse_bbox(value: str) -> BBox:
+    """
+    Parses ``min_lon,min_lat,max_lon,max_lat`` (the GeoJSON/OGC order).
+
+    Raises:
+        HTTPException: 400 if it is not four numbers in range with min <= max.
+    """
+    try:
+        bbox = BBox(*(float(part) for part in value.split(",")))
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="bbox must be min_lon,min_lat,max_lon,max_lat",
+        )
+    if not (
+        -180 <= bbox.min_lon <= bbox.max_lon <= 180
+        and -90 <= bbox.min_lat <= bbox.max_lat <= 90
+    ):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="bbox is out of range")
+    return bbox
+
+
+class RTree:
+    """
+    Read-only R-tree packed with Sort-Tile-Recursive.
+
+    Used where the database has no spatial index (SQLite built without the
+    R*Tree module). Building it is O(n log n); a query only descends into
+    nodes whose box intersects the searched one, so it visits O(log n)
+    nodes plus the matches.
+    """
+
+    def __init__(self, items: list[tuple[BBox, str]]):
+        level = list(items)
+        while len(level) > NODE_CAPACITY:
+            level = [(self._bounds(node), node) for node in self._pack(level)]
+        self.root = (self._bounds(level), level) if level else None
+
+    @staticmethod
+    def _bounds(entries) -> BBox:
+        bbox = entries[0][0]
+        for entry_bbox, _ in entries[1:]:
+            bbox = bbox.union(entry_bbox)
+        return bbox
+
+    @staticmethod
+    def _pack(entries) -> list[list]:
+        def center(entry, axis):
+            bbox = entry[0]
+            return (bbox[axis] + bbox[axis + 2]) / 2
+
+        node_count = math.ceil(len(entries) / NODE_CAPACITY)
+        slab_size = NODE_CAPACITY * math.ceil(math.sqrt(node_count))
+        entries = sorted(entries, key=lambda entry: center(entry, 0))
+        nodes = []
+        for start in range(0, len(entries), slab_size):
+            slab = sorted(entries[start:start + slab_size], key=lambda entry: center(entry, 1))
+            nodes += [slab[index:index + NODE_CAPACITY] for index in range(0, len(slab), NODE_CAPACITY)]
+        return nodes
+
+    def search(self, bbox: BBox) -> list[str]:
+        """Keys of the items whose box intersects ``bbox``."""
+        if self.root is None:
+            return []
+        found, stack = [], [self.root]
+        while stack:
+            node_bbox, children = stack.pop()
+            if not node_bbox.intersects(bbox):
+                continue
+            if isinstance(children, list):
+                stack.extend(children)
+            else:
+                found.append(children)
+        return found
+
+
+def _bbox_columns():
+    return [Ppda.__table__.c[column] for column in BBOX_COLUMNS]
+
+
+def _intersects_clause(bbox: BBox):
+    """Exact test on the PPDA columns; rows without a box never match."""
+    min_lon, min_lat, max_lon, max_lat = _bbox_columns()
+    return sql.and_(
+        min_lon <= bbox.max_lon, max_lon >= bbox.min_lon,
+        min_lat <= bbox.max_lat, max_lat >= bbox.min_lat,
+    )
+
+
+def _has_sqlite_rtree(connection) -> bool:
+    return connection.execute(
+        text("SELECT EXISTS (SELECT 1 FROM sqlite_master WHERE name = :name)"), {"name": SQLITE_RTREE}
+    ).scalar()
+
+
+_rtree = table(SQLITE_RTREE, column("id"), *(column(name) for name in BBOX_COLUMNS))
+
+_lock = threading.Lock()
+_trees: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _tree(session: sql.Session) -> RTree:
+    """In-process R-tree of the PPDA boxes, rebuilt after writes to ppda."""
+    engine = session.get_bind()
+    version = table_version("ppda")
+    with _lock:
+        built_at, tree = _trees.get(engine, (None, None))
+    if built_at == version:
+        return tree
+    rows = session.exec(sql.select(Ppda.__table__.c.id_ppda, *_bbox_columns()).where(
+        *(column.is_not(None) for column in _bbox_columns())
+    )).all()
+    tree = RTree([(BBox(*row[1:]), row[0]) for row in rows])
+    with _lock:
+        _trees[engine] = (version, tree)
+    return tree
+
+
+def intersecting(statement, session: sql.Session, bbox: BBox):
+    """
+    Restricts a SELECT on ppda to the rows whose bounding box intersects
+    ``bbox`` (a point for "which plans apply here"), through the spatial
+    index of the database:
+
+    - PostgreSQL: GiST index on ``box(point(min_lon, min_lat), point(max_lon, max_lat))``.
+    - SQLite with R*Tree: the ``ppda_rtree`` virtual table.
+    - Otherwise: an in-process R-tree of the boxes.
+    """
+    connection = session.connection()
+    if connection.dialect.name == "postgresql":
+        return statement.where(
+            postgres_box(*_bbox_columns()).op("&&")(postgres_box(*bbox))
+        )
+    if connection.dialect.name == "sqlite" and _has_sqlite_rtree(connection):
+        candidates = sql.select(_rtree.c.id).where(
+            _rtree.c.min_lon <= bbox.max_lon, _rtree.c.max_lon >= bbox.min_lon,
+            _rtree.c.min_lat <= bbox.max_lat, _rtree.c.max_lat >= bbox.min_lat,
+        )
+        # R*Tree coordinates are 32-bit floats rounded outwards: re-check exactly
+        return statement.where(literal_column("ppda.rowid").in_(candidates), _intersects_clause(bbox))
+    return statement.where(Ppda.__table__.c.id_ppda.in_(_tree(session).search(bbox)), _intersects_clause(bbox))
@@ -0,0 +1,101 @@
+import json
+import os
+import subprocess
+import sys
+from typing import NamedTuple
+
+# Run in a fresh interpreter, so nothing is already imported or warmed up
+_FIRST_RESPONSE = """
+import asyncio, json, sys, time
+start = time.perf_counter()
+module = __import__(sys.argv[1], fromlist=["app"])
+imported = time.perf_counter()
+path = sys.argv[2]
+scope = {
+    "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+    "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+    "query_string": b"", "root_path": "", "headers": [(b"host", b"localhost")],
+    "client": ("127.0.0.1", 0), "server": ("localhost", 80),
+}
+messages = []
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+async def send(message):
+    messages.append(message)
+asyncio.run(module.app(scope, receive, send))
+done = time.perf_counter()
+print(json.dumps({"import": imported - start, "first_response": done - imported, "status": messages[0]["status"]}))
+"""
+
+
+class ImportTime(NamedTuple):
+    """One line of ``python -X importtime``; times in microseconds."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """
+    Parses the stderr of ``python -X importtime``.
+
+    Lines look like ``import time:   self |  cumulative | <indent>module``;
+    the indentation of the module name gives its nesting depth.
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header line
+        module = name.strip()
+        rows.append(ImportTime(module, int(self_us), int(cumulative_us), (len(name) - len(name.lstrip()) - 1) // 2))
+    return rows
+
+
+def _run(args: list[str], env: dict | None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+        check=True,
+    )
+
+
+def import_profile(module: str = "app.main", env: dict | None = None) -> list[ImportTime]:
+    """Imports ``module`` in a new interpreter and returns the cost of every module it loaded."""
+    return parse_importtime(_run(["-X", "importtime", "-c", f"import {module}"], env).stderr)
+
+
+def first_response(module: str = "app.main", path: str = "/", env: dict | None = None) -> dict:
+    """
+    Measures, in a new interpreter, the time to import ``module`` and to
+    answer its first request to ``path`` (called directly on the ASGI app).
+
+    Returns:
+        dict: ``import`` and ``first_response`` in seconds, and the response ``status``.
+    """
+    output = _run(["-c", _FIRST_RESPONSE, module, path], env).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def report(module: str = "app.main", path: str = "/", top: int = 15, env: dict | None = None) -> str:
+    """Text report with the slowest imports, the app's own modules and the time to first response."""
+    rows = import_profile(module, env)
+    timing = first_response(module, path, env)
+    own = [row for row in rows if row.module.split(".")[0] == module.split(".")[0]]
+
+    lines = [f"Slowest imports (cumulative) for {module}:"]
+    for row in sorted(rows, key=lambda row: row.cumulative_us, reverse=True)[:top]:
+        lines.append(f"  {row.cumulative_us / 1000:9.1f} ms  {row.self_us / 1000:8.1f} ms self  {row.module}")
+    lines.append(f"Application modules (self time, {sum(row.self_us for row in own) / 1000:.1f} ms total):")
+    for row in sorted(own, key=lambda row: row.self_us, reverse=True)[:top]:
+        lines.append(f"  {row.self_us / 1000:9.1f} ms  {row.module}")
+    lines.append(
+        f"Import: {timing['import'] * 1000:.1f} ms; first response to GET {path}: "
+        f"{timing['first_response'] * 1000:.1f} ms (status {timing['status']})"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,55 @@
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Bumped when a Session commits writes to a table; in-process caches built
+# from a table store the version they were built at and rebuild when it changes.
+_lock = threading.Lock()
+_versions: dict[str, int] = {}
+# Session.info key of the tables written in the current transaction
+WRITTEN_TABLES = "written_tables"
+
+
+def table_version(*tables: str) -> tuple[int, ...]:
+    """Current write counters of ``tables``."""
+    return tuple(_versions.get(table, 0) for table in tables)
+
+
+def bump(table: str) -> None:
+    with _lock:
+        _versions[table] = _versions.get(table, 0) + 1
+
+
+def _written(session) -> set:
+    return session.info.setdefault(WRITTEN_TABLES, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    _written(session).update(
+        getattr(getattr(instance, "__table__", None), "name", None)
+        for instance in (*session.new, *session.dirty, *session.deleted)
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_bulk_write(orm_execute_state):
+    # INSERT/UPDATE/DELETE statements (update_returning, delete_returning) bypass the flush
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if getattr(table, "name", None):
+            _written(orm_execute_state.session).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    # Bumping only now keeps a cache rebuilt between flush and commit from
+    # being stamped with the new version while it still holds the old data
+    for table in session.info.pop(WRITTEN_TABLES, set()) - {None}:
+        bump(table)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    session.info.pop(WRITTEN_TABLES, None)
@@ -0,0 +1,38 @@
+from sqlalchemy import Integer
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class epoch_now(FunctionElement):
+    """
+    Current Unix time in whole seconds, evaluated by the database.
+
+    Used as ``server_default`` for ``created_at``/``updated_at`` and as the
+    ``onupdate`` value of ``updated_at``, so timestamps are set in the same
+    statement that writes the row and read back through RETURNING.
+    """
+
+    type = Integer()
+    inherit_cache = True
+    name = "epoch_now"
+
+
+@compiles(epoch_now)
+def _epoch_now_sqlite(element, compiler, **kw):
+    return "CAST(strftime('%s', 'now') AS INTEGER)"
+
+
+@compiles(epoch_now, "postgresql")
+def _epoch_now_postgresql(element, compiler, **kw):
+    # now() is the transaction start, so every row written together shares it
+    return "CAST(EXTRACT(EPOCH FROM now()) AS INTEGER)"
+
+
+def created_at_kwargs() -> dict:
+    """Column arguments for a database-generated ``created_at``."""
+    return {"server_default": epoch_now()}
+
+
+def updated_at_kwargs() -> dict:
+    """Column arguments for an ``updated_at`` refreshed by the database on every UPDATE."""
+    return {"server_default": epoch_now(), "onupdate": epoch_now()}
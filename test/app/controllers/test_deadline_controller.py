@@ -6,6 +6,12 @@ from fastapi import HTTPException, status
 from datetime import datetime
 import uuid
 
+ACTION_1 = "6b0180d2-6c26-5a0b-9dfd-c9219126ef31"
+UPDATED_ACTION = "3df8f95c-d3b8-5dde-8cd3-e7e646b34da6"
+UPDATED = "c72ac2bd-2acb-51dd-9ecb-0e6c96015d1b"
+A1 = "cba2c63c-47bb-5cac-9e33-f110116eb2e4"
+A2 = "4fb10823-80eb-5576-b84a-8f8de3cfef5f"
+
 # Configuración de base de datos en memoria
 DATABASE_URL = "sqlite:///:memory:"
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
@@ -26,26 +32,26 @@ def sample_deadline(id_action=None, year=2025, deadline_date=None):
 
 @pytest.mark.asyncio
 async def test_create_and_get_deadline(session):
-    data = sample_deadline("action-1")
+    data = sample_deadline(ACTION_1)
     deadline = await DeadLineController.create_deadline(data, session)
-    assert deadline.id_action == "action-1"
+    assert deadline.id_action == ACTION_1
     fetched = await DeadLineController.get_by_id(deadline.id_deadline, session)
     assert fetched.id_deadline == deadline.id_deadline
-    assert fetched.id_action == "action-1"
+    assert fetched.id_action == ACTION_1
 
 @pytest.mark.asyncio
 async def test_update_deadline(session):
-    data = sample_deadline("action-1")
+    data = sample_deadline(ACTION_1)
     deadline = await DeadLineController.create_deadline(data, session)
-    update_data = DeadLineBase(id_action="updated-action", year=2026, deadline_date=datetime(2026, 1, 1, 0, 0, 0))
+    update_data = DeadLineBase(id_action=UPDATED_ACTION, year=2026, deadline_date=datetime(2026, 1, 1, 0, 0, 0))
     updated = await DeadLineController.update_deadline(deadline.id_deadline, update_data, session)
-    assert updated.id_action == "updated-action"
+    assert updated.id_action == UPDATED_ACTION
     assert updated.year == 2026
     assert str(updated.deadline_date).startswith("2026-01-01")
 
 @pytest.mark.asyncio
 async def test_delete_deadline(session):
-    data = sample_deadline("action-1")
+    data = sample_deadline(ACTION_1)
     deadline = await DeadLineController.create_deadline(data, session)
     resp = await DeadLineController.delete_deadline(deadline.id_deadline, session)
     assert resp["detail"] == "Deadline deleted"
@@ -60,7 +66,7 @@ async def test_get_deadline_not_found(session):
 
 @pytest.mark.asyncio
 async def test_update_deadline_not_found(session):
-    update_data = DeadLineBase(id_action="updated", year=2027, deadline_date=datetime(2027, 1, 1, 0, 0, 0))
+    update_data = DeadLineBase(id_action=UPDATED, year=2027, deadline_date=datetime(2027, 1, 1, 0, 0, 0))
     with pytest.raises(HTTPException) as excinfo:
         await DeadLineController.update_deadline("non-existent-id", update_data, session)
     assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
@@ -73,8 +79,8 @@ async def test_delete_deadline_not_found(session):
 
 @pytest.mark.asyncio
 async def test_get_all_deadlines(session):
-    d1 = await DeadLineController.create_deadline(sample_deadline("a1"), session)
-    d2 = await DeadLineController.create_deadline(sample_deadline("a2"), session)
+    d1 = await DeadLineController.create_deadline(sample_deadline(A1), session)
+    d2 = await DeadLineController.create_deadline(sample_deadline(A2), session)
     deadlines = await DeadLineController.get_all(session)
     ids = [d.id_deadline for d in deadlines]
     assert d1.id_deadline in ids and d2.id_deadline in ids
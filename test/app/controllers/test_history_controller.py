@@ -6,6 +6,18 @@ from fastapi import HTTPException, status
 from datetime import datetime
 import uuid
 
+REP_1 = "321d21f8-ba8a-55a6-8feb-119e668f72e0"
+VAR_1 = "f370962a-558d-5a9f-a7f0-60c6d592d524"
+VAR_X = "b382e856-2cd2-5ced-af18-b8fdf7f34b5f"
+VAR_W = "995158f4-936c-52fc-b01a-65e8f359ef3e"
+VAR_AB = "c62854a2-ddce-5776-a662-2cc937523adf"
+REP_Y = "74b2346c-fa30-5d1c-8fe2-235913b06b21"
+REP_XY = "123cf037-688e-5fff-86b9-16dca2b62694"
+UPDATED_VAR = "b9947e0e-27db-5c56-9b1a-69eaedc49557"
+UPDATED_REP = "5ad9f6cb-0c8f-508a-8203-50697849e9db"
+VAR_2 = "b4ff2694-e0d7-5866-9083-e7680bc391eb"
+REP_2 = "0fd235ed-97d2-502b-8feb-da5a1c19aee5"
+
 # Configuración de base de datos en memoria
 DATABASE_URL = "sqlite:///:memory:"
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
@@ -26,27 +38,27 @@ def sample_history(id_variable=None, id_report=None, created_at=None):
 
 @pytest.mark.asyncio
 async def test_create_and_get_history(session):
-    data = sample_history("var-1", "rep-1")
+    data = sample_history(VAR_1, REP_1)
     history = await HistoryController.create_history(data, session)
-    assert history.id_variable == "var-1"
+    assert history.id_variable == VAR_1
     fetched = await HistoryController.get_by_id(history.id_history, session)
     assert fetched.id_history == history.id_history
-    assert fetched.id_variable == "var-1"
-    assert fetched.id_report == "rep-1"
+    assert fetched.id_variable == VAR_1
+    assert fetched.id_report == REP_1
 
 @pytest.mark.asyncio
 async def test_update_history(session):
-    data = sample_history("var-1", "rep-1")
+    data = sample_history(VAR_1, REP_1)
     history = await HistoryController.create_history(data, session)
-    update_data = sample_history("updated-var", "updated-rep", int(datetime(2026, 1, 1, 0, 0, 0).timestamp()))
+    update_data = sample_history(UPDATED_VAR, UPDATED_REP, int(datetime(2026, 1, 1, 0, 0, 0).timestamp()))
     updated = await HistoryController.update_history(history.id_history, update_data, session)
-    assert updated.id_variable == "updated-var"
-    assert updated.id_report == "updated-rep"
+    assert updated.id_variable == UPDATED_VAR
+    assert updated.id_report == UPDATED_REP
     assert updated.created_at == int(datetime(2026, 1, 1, 0, 0, 0).timestamp())
 
 @pytest.mark.asyncio
 async def test_delete_history(session):
-    data = sample_history("var-1", "rep-1")
+    data = sample_history(VAR_1, REP_1)
     history = await HistoryController.create_history(data, session)
     deleted = await HistoryController.delete_history(history.id_history, session)
     assert deleted["detail"] == "History deleted"
@@ -63,7 +75,7 @@ async def test_get_history_not_found(session):
 
 @pytest.mark.asyncio
 async def test_update_history_not_found(session):
-    update_data = sample_history("var-1", "rep-1")
+    update_data = sample_history(VAR_1, REP_1)
     with pytest.raises(HTTPException) as exc:
         await HistoryController.update_history("non-existent-id", update_data, session)
     assert exc.value.status_code == status.HTTP_404_NOT_FOUND
@@ -76,8 +88,8 @@ async def test_delete_history_not_found(session):
 
 @pytest.mark.asyncio
 async def test_get_all_histories(session):
-    data1 = sample_history("var-1", "rep-1")
-    data2 = sample_history("var-2", "rep-2")
+    data1 = sample_history(VAR_1, REP_1)
+    data2 = sample_history(VAR_2, REP_2)
     await HistoryController.create_history(data1, session)
     await HistoryController.create_history(data2, session)
     all_histories = await HistoryController.get_all(session)
@@ -85,22 +97,36 @@ async def test_get_all_histories(session):
 
 @pytest.mark.asyncio
 async def test_get_by_variable(session):
-    data = sample_history("var-X", "rep-1")
+    data = sample_history(VAR_X, REP_1)
     await HistoryController.create_history(data, session)
-    results = await HistoryController.get_by_variable("var-X", session)
-    assert all(h.id_variable == "var-X" for h in results)
+    results = await HistoryController.get_by_variable(VAR_X, session)
+    assert all(h.id_variable == VAR_X for h in results)
 
 @pytest.mark.asyncio
 async def test_get_by_report(session):
-    data = sample_history("var-1", "rep-Y")
+    data = sample_history(VAR_1, REP_Y)
     await HistoryController.create_history(data, session)
-    results = await HistoryController.get_by_report("rep-Y", session)
-    assert all(h.id_report == "rep-Y" for h in results)
+    results = await HistoryController.get_by_report(REP_Y, session)
+    assert all(h.id_report == REP_Y for h in results)
 
 @pytest.mark.asyncio
 async def test_get_by_var_and_report(session):
-    data = sample_history("var-AB", "rep-XY")
+    data = sample_history(VAR_AB, REP_XY)
     await HistoryController.create_history(data, session)
-    results = await HistoryController.get_by_var_and_report("var-AB", "rep-XY", session)
-    assert all(h.id_variable == "var-AB" and h.id_report == "rep-XY" for h in results)
+    results = await HistoryController.get_by_var_and_report(VAR_AB, REP_XY, session)
+    assert all(h.id_variable == VAR_AB and h.id_report == REP_XY for h in results)
+
 
+@pytest.mark.asyncio
+async def test_get_by_variable_within_window(session):
+    january = int(datetime(2025, 1, 15).timestamp())
+    february = int(datetime(2025, 2, 15).timestamp())
+    await HistoryController.create_history(sample_history(VAR_W, REP_1, created_at=january), session)
+    await HistoryController.create_history(sample_history(VAR_W, REP_1, created_at=february), session)
+    results = await HistoryController.get_by_variable(
+        VAR_W, session,
+        from_date=int(datetime(2025, 2, 1).timestamp()),
+        to_date=int(datetime(2025, 3, 1).timestamp())
+    )
+    assert [h.created_at for h in results] == [february]
+    assert len(await HistoryController.get_all(session, to_date=february)) == 1
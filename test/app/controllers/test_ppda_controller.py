@@ -2,12 +2,16 @@ import pytest
 from sqlmodel import SQLModel, Session, create_engine
 from fastapi import HTTPException, status
 from app.controllers.PpdaController import (
-    get_all, get_by_id, create_ppda, update_ppda, delete_ppda
+    get_all, get_by_id, get_at, create_ppda, update_ppda, delete_ppda, get_mine, get_by_institution
 )
-from app.models.Ppda import PpdaCreate, Ppda
+from app.models import Role, User, UserInstitution
+from app.models.Ppda import PpdaCreate, PpdaUpdate, Ppda
 from app.models.Institution import Institution
 import uuid
 
+INST_1 = "c6871dda-6cde-5661-a13b-11f0f5f6cd5d"
+INST_2 = "4cd6e86a-5f68-5a0a-86dd-1f3d36eeb894"
+
 DATABASE_URL = "sqlite:///:memory:"
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 
@@ -21,7 +25,7 @@ def session_fixture():
 @pytest.fixture
 def sample_institution(session):
     institution = Institution(
-        id_institution="inst-1",
+        id_institution=INST_1,
         name="Institución Test"
     )
     session.add(institution)
@@ -65,16 +69,24 @@ async def test_get_by_id_not_found(session):
 @pytest.mark.asyncio
 async def test_update_ppda_success(session, sample_institution):
     ppda = await create_ppda(PpdaCreate(id_institution=sample_institution.id_institution, name="Test ppda"), session)
-    ppda.id_institution = sample_institution.id_institution
-    updated = await update_ppda(ppda, session)
+    updated = await update_ppda(ppda.id_ppda, PpdaUpdate(id_institution=sample_institution.id_institution), session)
     assert updated.id_ppda == ppda.id_ppda
     assert updated.id_institution == sample_institution.id_institution
 
+@pytest.mark.asyncio
+async def test_update_ppda_sets_bbox(session, sample_institution):
+    ppda = await create_ppda(PpdaCreate(id_institution=sample_institution.id_institution, name="Test ppda"), session)
+    assert await get_at(-33.45, -70.66, session) == []
+    box = PpdaUpdate(id_institution=sample_institution.id_institution, min_lon=-71.0, min_lat=-34.0, max_lon=-70.0, max_lat=-33.0)
+    updated = await update_ppda(ppda.id_ppda, box, session)
+    assert updated.name == "Test ppda"
+    assert (updated.min_lon, updated.max_lat) == (-71.0, -33.0)
+    assert [row.id_ppda for row in await get_at(-33.45, -70.66, session)] == [ppda.id_ppda]
+
 @pytest.mark.asyncio
 async def test_update_ppda_not_found(session):
-    fake_ppda = Ppda(id_ppda="non-existent", id_institution="inst-1")
     with pytest.raises(HTTPException) as exc_info:
-        await update_ppda(fake_ppda, session)
+        await update_ppda("non-existent", PpdaUpdate(id_institution=INST_1), session)
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
     assert "Ppda not found" in exc_info.value.detail
 
@@ -92,3 +104,35 @@ async def test_delete_ppda_not_found(session):
         await delete_ppda(str(uuid.uuid4()), session)
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
     assert "Ppda not found" in exc_info.value.detail
+
+
+@pytest.fixture
+def memberships(session):
+    session.add(Institution(id_institution=INST_2, name="Otra institución"))
+    session.add_all([
+        User(id_user="u-1", username="member", email="member@test.cl", password="x"),
+        User(id_user="u-2", username="admin", email="admin@test.cl", password="x", is_admin=True),
+        User(id_user="u-3", username="outsider", email="outsider@test.cl", password="x"),
+    ])
+    session.add_all([
+        UserInstitution(id_user="u-1", id_institution=INST_1, role=Role.EDITOR),
+        UserInstitution(id_user="u-1", id_institution=INST_2, role=Role.VIEWER),
+    ])
+    session.add_all([Ppda(id_ppda=f"p-{index}", id_institution=(INST_1, INST_2)[index % 2], name=f"PPDA {index}") for index in range(5)])
+    session.commit()
+
+@pytest.mark.asyncio
+async def test_get_mine_joins_memberships(session, sample_institution, memberships):
+    assert [ppda.id_ppda for ppda in await get_mine("member", session)] == ["p-0", "p-1", "p-2", "p-3", "p-4"]
+    assert [ppda.id_ppda for ppda in await get_mine("member", session, Role.EDITOR)] == ["p-0", "p-2", "p-4"]
+    assert [ppda.id_ppda for ppda in await get_mine("member", session, limit=2, offset=2)] == ["p-2", "p-3"]
+    assert await get_mine("outsider", session) == []
+
+@pytest.mark.asyncio
+async def test_get_by_institution_requires_membership(session, sample_institution, memberships):
+    assert [ppda.id_ppda for ppda in await get_by_institution(INST_2, "member", session)] == ["p-1", "p-3"]
+    assert [ppda.id_ppda for ppda in await get_by_institution(INST_2, "admin", session)] == ["p-1", "p-3"]
+    assert await get_by_institution(INST_2, "member", session, offset=10) == []
+    with pytest.raises(HTTPException) as exc:
+        await get_by_institution(INST_2, "outsider", session)
+    assert exc.value.status_code == status.HTTP_403_FORBIDDEN
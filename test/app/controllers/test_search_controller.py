@@ -0,0 +1,58 @@
+import pytest
+from sqlmodel import SQLModel, Session, create_engine
+from app.controllers.SearchController import search
+from app.controllers.PpdaController import delete_ppda
+from app.models.Institution import Institution
+from app.models.Ppda import Ppda
+
+DATABASE_URL = "sqlite:///:memory:"
+engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Ppda(id_ppda="p-1", name="PPDA Santiago", description="Plan de descontaminación de la Región Metropolitana", municipality="Santiago"))
+        session.add(Ppda(id_ppda="p-2", name="PPDA Temuco", description="Planes para la calefacción a leña", municipality="Temuco"))
+        session.add(Institution(id_institution="i-1", institution_name="Ministerio del Medio Ambiente"))
+        session.commit()
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+@pytest.mark.asyncio
+async def test_search_ranks_and_ignores_accents(session):
+    page = await search("santiago descontaminacion", session)
+    assert page.total == 1
+    assert [(result.kind, result.id) for result in page.results] == [("ppda", "p-1")]
+
+    page = await search("Plan", session)
+    assert {result.id for result in page.results} == {"p-1", "p-2"}
+
+    page = await search("ambiente", session)
+    assert page.results[0].kind == "institution" and page.results[0].title == "Ministerio del Medio Ambiente"
+
+@pytest.mark.asyncio
+async def test_search_filters_kind_and_paginates(session):
+    assert (await search("ppda", session, kinds=["institution"])).total == 0
+    page = await search("ppda", session, limit=1, offset=1)
+    assert page.total == 2 and len(page.results) == 1
+
+@pytest.mark.asyncio
+async def test_search_sees_writes(session):
+    assert (await search("valdivia", session)).total == 0
+    session.add(Ppda(id_ppda="p-3", name="PPDA Valdivia"))
+    session.commit()
+    assert (await search("valdivia", session)).total == 1
+
+    await delete_ppda("p-3", session)
+    assert (await search("valdivia", session)).total == 0
+
+@pytest.mark.asyncio
+async def test_postgres_total_past_the_last_page(mocker):
+    session = mocker.Mock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute.side_effect = [mocker.Mock(all=lambda: []), mocker.Mock(scalar=lambda: 7)]
+
+    page = await search("santiago", session, offset=40)
+    assert page.total == 7 and page.results == []
+    assert "count(*) FROM" in str(session.execute.call_args.args[0])
@@ -0,0 +1,146 @@
+import pytest
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session, create_engine
+from fastapi import HTTPException, status
+from app.controllers.UserInstitutionController import (
+    get_by_ids, get_by_institution, create, update, delete, autocomplete
+)
+from app.models import Institution, Role, User, UserInstitutionCreate, UserInstitutionUpdate
+
+USER_1 = "1adbb0cc-47c4-5159-995c-3a6296ebe78b"
+INST_1 = "2e68a02c-eb02-5c42-9d43-26ddfb53230d"
+GHOST = "dd648236-9363-5c7c-9640-340b24daac0d"
+
+DATABASE_URL = "sqlite:///:memory:"
+engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Institution(id_institution=INST_1, institution_name="SEREMI"))
+        session.add(User(id_user=USER_1, username="user", email="u@example.com", password="x"))
+        session.commit()
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+@pytest.fixture
+def statements():
+    executed = []
+    listener = lambda *args: executed.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    yield executed
+    event.remove(engine, "before_cursor_execute", listener)
+
+@pytest.fixture
+def membership():
+    return UserInstitutionCreate(id_user=USER_1, id_institution=INST_1, role=Role.EDITOR)
+
+@pytest.mark.asyncio
+async def test_create_in_one_statement(session, membership, statements):
+    created = await create(membership, session)
+    assert created.role == Role.EDITOR
+    assert created.is_active
+    assert len(statements) == 1
+
+@pytest.mark.asyncio
+async def test_create_duplicate(session, membership):
+    await create(membership, session)
+    with pytest.raises(HTTPException) as exc:
+        await create(membership, session)
+    assert exc.value.status_code == status.HTTP_409_CONFLICT
+
+@pytest.mark.asyncio
+async def test_create_missing_user(session):
+    with pytest.raises(HTTPException) as exc:
+        await create(UserInstitutionCreate(id_user=GHOST, id_institution=INST_1, role=Role.VIEWER), session)
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.asyncio
+async def test_get_by_ids(session, membership, statements):
+    await create(membership, session)
+    statements.clear()
+    found = await get_by_ids(USER_1, INST_1, session)
+    assert found.role == Role.EDITOR
+    assert len(statements) == 1
+
+@pytest.mark.asyncio
+async def test_get_by_ids_without_relationship(session):
+    assert await get_by_ids(USER_1, INST_1, session) is None
+    with pytest.raises(HTTPException) as exc:
+        await get_by_ids(USER_1, "missing", session)
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.asyncio
+async def test_get_by_institution(session, membership):
+    await create(membership, session)
+    members = await get_by_institution(INST_1, session)
+    assert [member.role for member in members] == [Role.EDITOR]
+
+@pytest.mark.asyncio
+async def test_update_returns_row(session, membership):
+    await create(membership, session)
+    updated = await update(
+        UserInstitutionUpdate(id_user=USER_1, id_institution=INST_1, role=Role.VIEWER, is_active=False),
+        session
+    )
+    assert updated.role == Role.VIEWER
+    assert updated.is_active is False
+
+@pytest.mark.asyncio
+async def test_update_not_found(session):
+    with pytest.raises(HTTPException) as exc:
+        await update(UserInstitutionUpdate(id_user=USER_1, id_institution=INST_1, role=Role.VIEWER), session)
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.asyncio
+async def test_delete(session, membership):
+    await create(membership, session)
+    result = await delete(USER_1, INST_1, session)
+    assert result["message"] == "User-institution relationship deleted successfully"
+    with pytest.raises(HTTPException) as exc:
+        await delete(USER_1, INST_1, session)
+    assert exc.value.detail == "User-institution relationship not found"
+
+@pytest.mark.asyncio
+async def test_autocomplete_matches_prefix_of_username_or_email(session):
+    session.add(User(id_user="user-2", username="Mariela", email="mariela@mma.gob.cl", password="x"))
+    session.add(User(id_user="user-3", username="pedro", email="marco@mma.gob.cl", password="x"))
+    session.add(User(id_user="user-4", username="mar_io", email="mario@mma.gob.cl", password="x"))
+    session.commit()
+
+    suggestions = await autocomplete("users", "MAR", 10, session)
+    # Mariela matches twice (username and email) but is listed once
+    assert [suggestion.id for suggestion in suggestions] == ["user-4", "user-3", "user-2"]
+    assert suggestions[1].label == "pedro" and suggestions[1].detail == "marco@mma.gob.cl"
+
+    assert [suggestion.id for suggestion in await autocomplete("users", "mar_", 10, session)] == ["user-4"]
+    assert len(await autocomplete("users", "mar", 1, session)) == 1
+
+@pytest.mark.asyncio
+async def test_autocomplete_answers_longer_prefixes_from_memory(session, statements):
+    assert [suggestion.label for suggestion in await autocomplete("institutions", "se", 10, session)] == ["SEREMI"]
+    queries = len(statements)
+    assert [suggestion.label for suggestion in await autocomplete("institutions", "ser", 10, session)] == ["SEREMI"]
+    assert await autocomplete("institutions", "sex", 10, session) == []
+    assert len(statements) == queries
+
+    session.add(Institution(id_institution="inst-2", institution_name="Servicio de Salud"))
+    session.commit()
+    assert len(await autocomplete("institutions", "ser", 10, session)) == 2
+
+@pytest.mark.asyncio
+async def test_autocomplete_cache_expires(session, monkeypatch):
+    import time
+    from sqlalchemy import text
+    from app.utils import autocomplete as autocomplete_utils
+
+    assert len(await autocomplete("institutions", "ser", 10, session)) == 1
+    # Written outside this process's sessions: only the TTL notices it
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO institution (id_institution, institution_name) VALUES ('inst-3', 'Servicio Agrícola')"))
+    assert len(await autocomplete("institutions", "ser", 10, session)) == 1
+
+    later = time.monotonic() + autocomplete_utils.cache_ttl + 1
+    monkeypatch.setattr(autocomplete_utils.time, "monotonic", lambda: later)
+    assert len(await autocomplete("institutions", "ser", 10, session)) == 2
@@ -4,13 +4,17 @@ from sqlmodel import Session, SQLModel, create_engine
 from app.models.Action import Action, ActionBase
 from app.models import ActionType, Ppda
 from app.models.PpdaStatus import PpdaStatus
+from pydantic import ValidationError
+
+PPDA_ID = "0190f1a2-7c3e-7a51-9b2d-5f4e3c2b1a00"
+USER_ID = "0190f1a2-7c3e-7a51-9b2d-5f4e3c2b1a01"
 
 # Fixtures para datos de prueba
 @pytest.fixture
 def valid_action_data():
     return {
-        "id_ppda": "PPDA-123",
-        "id_user": "12.345.678-9",
+        "id_ppda": PPDA_ID,
+        "id_user": USER_ID,
         "id_action_type": 1
     }
 
@@ -48,8 +52,8 @@ class TestActionBase:
         """Test que ActionBase se crea correctamente con datos válidos"""
         action = ActionBase(**valid_action_data)
         
-        assert action.id_ppda == "PPDA-123"
-        assert action.id_user == "12.345.678-9"
+        assert action.id_ppda == PPDA_ID
+        assert action.id_user == USER_ID
         assert action.id_action_type == 1
 
     def test_all_fields_optional(self):
@@ -59,16 +63,19 @@ class TestActionBase:
         assert action.id_user is None
         assert action.id_action_type is None
 
-    @pytest.mark.parametrize("rut", [
-        "12345678-9",  # Sin puntos
-        "12.345.678-K",  # Con K válida
-        None,  # Nulo es permitido
-    ])
-    def test_valid_rut_formats(self, valid_action_data, rut):
-        """Test que acepta varios formatos válidos de RUT"""
-        valid_action_data["id_user"] = rut
+    @pytest.mark.parametrize("id_user", [USER_ID, None])
+    def test_valid_ids(self, valid_action_data, id_user):
+        """Test que acepta ids UUID o nulos"""
+        valid_action_data["id_user"] = id_user
         action = ActionBase(**valid_action_data)
-        assert action.id_user == rut
+        assert action.id_user == id_user
+
+    @pytest.mark.parametrize("id_user", ["12345678-9", "12.345.678-K"])
+    def test_rejects_ids_that_are_not_uuids(self, valid_action_data, id_user):
+        """Test que rechaza ids que no son UUID (p. ej. un RUT)"""
+        valid_action_data["id_user"] = id_user
+        with pytest.raises(ValidationError):
+            ActionBase(**valid_action_data)
 
 # Tests para Action
 class TestAction:
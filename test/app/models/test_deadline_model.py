@@ -4,12 +4,14 @@ from uuid import UUID
 from sqlmodel import Session, SQLModel, create_engine
 from app.models.DeadLine import DeadLine, DeadLineBase
 
+ACTION_123 = "eb44688e-f8c2-5a63-b649-ee3c28fc9e7a"
+
 # Fixtures para datos de prueba
 @pytest.fixture
 def valid_deadline_data():
     return {
         "deadline_date": datetime(2023, 12, 31, 23, 59),
-        "id_action": "action_123",
+        "id_action": ACTION_123,
         "year": 2023
     }
 
@@ -44,7 +46,7 @@ class TestDeadLineBase:
         """Prueba creación con datos válidos"""
         deadline = DeadLineBase(**valid_deadline_data)
         assert deadline.deadline_date == datetime(2023, 12, 31, 23, 59)
-        assert deadline.id_action == "action_123"
+        assert deadline.id_action == ACTION_123
         assert deadline.year == 2023
 
     def test_create_with_minimal_data(self, minimal_deadline_data):
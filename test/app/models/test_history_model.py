@@ -1,16 +1,20 @@
 import pytest
 from datetime import datetime, timezone
 import uuid
+from sqlalchemy import inspect
 from sqlmodel import Session, SQLModel, create_engine
 from app.models.History import History, HistoryBase
 import time
 
+REPORT_123 = "a1ec911a-0c2d-53d1-a5fd-9af3b086ad74"
+VARIABLE_456 = "6eebb6c7-01c2-5581-b766-73412b9576d6"
+
 # Fixtures para datos de prueba
 @pytest.fixture
 def valid_history_data():
     return {
-        "id_report": "report_123",
-        "id_variable": "variable_456",
+        "id_report": REPORT_123,
+        "id_variable": VARIABLE_456,
         "value": "sample_value",
     }
 
@@ -44,11 +48,12 @@ class TestHistoryBase:
     def test_create_with_valid_data(self, valid_history_data):
         """Prueba creación con datos válidos"""
         history = HistoryBase(**valid_history_data)
-        assert history.id_report == "report_123"
-        assert history.id_variable == "variable_456"
+        assert history.id_report == REPORT_123
+        assert history.id_variable == VARIABLE_456
         assert history.value == "sample_value"
-        assert isinstance(history.created_at, int)
-        assert isinstance(history.updated_at, int)
+        # Los timestamps los asigna la base de datos al insertar
+        assert history.created_at is None
+        assert history.updated_at is None
 
     def test_create_with_minimal_data(self, minimal_history_data):
         """Prueba creación con datos mínimos"""
@@ -56,17 +61,8 @@ class TestHistoryBase:
         assert history.value == "minimal_value"
         assert history.id_report is None
         assert history.id_variable is None
-        assert isinstance(history.created_at, int)
-        assert isinstance(history.updated_at, int)
-
-    def test_timestamps_auto_generated(self):
-        """Test que los timestamps se generan automáticamente"""
-        before = int(datetime.now(timezone.utc).timestamp())
-        history = HistoryBase(value="test")
-        after = int(datetime.now(timezone.utc).timestamp())
-        
-        assert before <= history.created_at <= after
-        assert before <= history.updated_at <= after
+        assert history.created_at is None
+        assert history.updated_at is None
 
 # Tests para History
 class TestHistory:
@@ -79,7 +75,9 @@ class TestHistory:
         """Verifica configuración de tabla"""
         assert History.__tablename__ == "history"
         assert hasattr(History, "__table__")
-        assert History.__table__.primary_key.columns.keys() == ["id_history"]
+        # created_at forma parte de la clave para particionar por rango en PostgreSQL
+        assert History.__table__.primary_key.columns.keys() == ["id_history", "created_at"]
+        assert [column.name for column in inspect(History).primary_key] == ["id_history"]
 
     def test_primary_key_autogenerated(self):
         """Test que id_history es generado automáticamente"""
@@ -100,6 +98,31 @@ class TestHistory:
 
 # Tests de integración con base de datos
 class TestHistoryDB:
+    def test_timestamps_auto_generated(self, session: Session):
+        """Test que la base de datos genera los timestamps y se leen con RETURNING"""
+        before = int(datetime.now(timezone.utc).timestamp())
+        history = History(value="test")
+        session.add(history)
+        session.flush()
+        after = int(datetime.now(timezone.utc).timestamp())
+
+        # Ya cargados en el objeto, sin expirar ni volver a consultar
+        assert "created_at" in history.__dict__ and "updated_at" in history.__dict__
+        assert before <= history.created_at <= after
+        assert before <= history.updated_at <= after
+
+    def test_updated_at_set_on_update(self, session: Session):
+        """Test que updated_at lo actualiza la base de datos en cada UPDATE"""
+        history = History(value="test", created_at=1, updated_at=1)
+        session.add(history)
+        session.flush()
+
+        history.value = "changed"
+        session.flush()
+
+        assert history.created_at == 1
+        assert history.updated_at >= int(datetime.now(timezone.utc).timestamp()) - 1
+
     def test_save_to_database(self, session: Session, valid_history_data):
         """Test que se puede guardar en base de datos"""
         history = History(**valid_history_data)
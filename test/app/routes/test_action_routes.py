@@ -7,6 +7,14 @@ from app.models.Action import *
 from app.models import Ppda, User
 from app.utils.auth import get_admin_user, get_current_user
 
+UUID_USER_1 = "0bf9457c-ac78-5018-8cbf-fa0844a7a58d"
+UUID_USER_2 = "864bddfd-af2e-5117-861f-f4e3fa7d8cb1"
+UUID_PPDA_1 = "73d9eb6f-26e1-5e3c-ba43-a1e2aae4f14c"
+UUID_PPDA_2 = "0924ada0-89f8-5113-9690-bbbd708434c1"
+UUID_INSTITUTION_1 = "70b114a3-ba46-5ad0-a0b0-f4254edad87e"
+UUID_ACTION_1 = "bab6d1f2-41e4-57cc-9ccb-7b8050f48610"
+UUID_ACTION_2 = "dfc0b564-608e-5a60-85c9-79185cf81de4"
+
 @pytest.fixture(autouse=True)
 def override_admin_user():
     app.dependency_overrides[get_admin_user] = lambda: {
@@ -19,7 +27,7 @@ def override_admin_user():
 @pytest.fixture(autouse=True)
 def override_current_user():
     app.dependency_overrides[get_current_user] = lambda: User(
-        id_user="uuid_user_1",
+        id_user=UUID_USER_1,
         username="test_user",
         email="test@test.tes",
         is_admin=True,
@@ -33,10 +41,10 @@ def client():
 
 def test_get_all_actions(mocker, client):
   mock_data = [
-    {"id_action" : "uuid_action_1", "id_action_type": 1, "id_ppda": "uuid_ppda_1", "id_user": "uuid_user_1"},
-    {"id_action" : "uuid_action_2", "id_action_type": 2, "id_ppda": "uuid_ppda_2", "id_user": "uuid_user_2"}
+    {"id_action" : UUID_ACTION_1, "id_action_type": 1, "id_ppda": UUID_PPDA_1, "id_user": UUID_USER_1},
+    {"id_action" : UUID_ACTION_2, "id_action_type": 2, "id_ppda": UUID_PPDA_2, "id_user": UUID_USER_2}
   ]
-  mocker.patch.object(ActionController, "get_all", return_value=mock_data)
+  mocker.patch.object(ActionController, "get_all", return_value=[Action(**item) for item in mock_data])
 
   response = client.get("/action/")
 
@@ -44,8 +52,8 @@ def test_get_all_actions(mocker, client):
   assert response.json() == mock_data
 
 def test_get_action_by_id(mocker, client):
-  mock_data_action = {"id_action" : "uuid_action_1", "id_action_type": 1, "id_ppda": "uuid_ppda_1", "id_user": "uuid_user_1"}
-  mock_data_ppda = {"id_ppda": "uuid_ppda_1", "id_institution": "uuid_institution_1"}
+  mock_data_action = {"id_action" : UUID_ACTION_1, "id_action_type": 1, "id_ppda": UUID_PPDA_1, "id_user": UUID_USER_1}
+  mock_data_ppda = {"id_ppda": UUID_PPDA_1, "id_institution": UUID_INSTITUTION_1}
   
   mocker.patch.object(ActionController, "get_by_id", return_value=Action(**mock_data_action))
   mocker.patch.object(PpdaController, "get_by_id", return_value=Ppda(**mock_data_ppda))
@@ -56,8 +64,8 @@ def test_get_action_by_id(mocker, client):
   assert response.json() == mock_data_action
 
 def test_create_action(mocker, client):
-  new_data = {"id_action" : "uuid_action_1", "id_action_type": 1, "id_ppda": "uuid_ppda_1", "id_user": "uuid_user_1"}
-  mocker.patch.object(PpdaController, "get_by_id", return_value=Ppda(**{"id_ppda": "uuid_ppda_1", "id_institution": "uuid_institution_1"}))
+  new_data = {"id_action" : UUID_ACTION_1, "id_action_type": 1, "id_ppda": UUID_PPDA_1, "id_user": UUID_USER_1}
+  mocker.patch.object(PpdaController, "get_by_id", return_value=Ppda(**{"id_ppda": UUID_PPDA_1, "id_institution": UUID_INSTITUTION_1}))
   mocker.patch.object(ActionController, "create_action", return_value=new_data)
 
   response = client.post("/action/", json=new_data)
@@ -66,10 +74,10 @@ def test_create_action(mocker, client):
   assert response.json() == new_data
 
 def test_update_action(mocker, client):
-  mock_data_action = {"id_action" : "uuid_action_1", "id_action_type": 1, "id_ppda": "uuid_ppda_1", "id_user": "uuid_user_1"}
-  mock_data_ppda = {"id_ppda": "uuid_ppda_1", "id_institution": "uuid_institution_1"}
+  mock_data_action = {"id_action" : UUID_ACTION_1, "id_action_type": 1, "id_ppda": UUID_PPDA_1, "id_user": UUID_USER_1}
+  mock_data_ppda = {"id_ppda": UUID_PPDA_1, "id_institution": UUID_INSTITUTION_1}
   
-  updated_data = ActionUpdate(id_ppda="uuid_ppda_1", id_action_type=1, id_user="uuid_user_1")
+  updated_data = ActionUpdate(id_ppda=UUID_PPDA_1, id_action_type=1, id_user=UUID_USER_1)
   
   mocker.patch.object(ActionController, "get_by_id", return_value=Action(**mock_data_action))
   mocker.patch.object(PpdaController, "get_by_id", return_value=Ppda(**mock_data_ppda))
@@ -83,8 +91,8 @@ def test_update_action(mocker, client):
   assert response.json() == mock_data_action
 
 def test_delete_action(mocker, client):
-  mock_data = {"id_action" : "uuid_action_1", "id_action_type": 1, "id_ppda": "uuid_ppda_1", "id_user": "uuid_user_1"}
-  mock_data_ppda = {"id_ppda": "uuid_ppda_1", "id_institution": "uuid_institution_1"}
+  mock_data = {"id_action" : UUID_ACTION_1, "id_action_type": 1, "id_ppda": UUID_PPDA_1, "id_user": UUID_USER_1}
+  mock_data_ppda = {"id_ppda": UUID_PPDA_1, "id_institution": UUID_INSTITUTION_1}
   
   mocker.patch.object(ActionController, "get_by_id", return_value=Action(**mock_data))
   mocker.patch.object(PpdaController, "get_by_id", return_value=Ppda(**mock_data_ppda))
@@ -98,8 +106,8 @@ def test_delete_action(mocker, client):
 
 def test_get_actions_pubic(mocker, client):
   mock_data = [
-    {"id_ppda": "uuid_ppda_1", "action_type": "Type A"},
-    {"id_ppda": "uuid_ppda_2", "action_type": "Type B"}
+    {"id_ppda": UUID_PPDA_1, "action_type": "Type A"},
+    {"id_ppda": UUID_PPDA_2, "action_type": "Type B"}
   ]
   mocker.patch.object(ActionController, "get_all_public", return_value=mock_data)
 
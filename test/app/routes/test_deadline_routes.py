@@ -37,6 +37,8 @@ def client():
 
 from datetime import datetime
 
+ACTION_1 = "52a63d64-ba17-5def-84a0-a0ab89deb18b"
+
 def get_mock_deadline(id_action=None):
     return DeadLine(
         id_deadline=str(uuid4()),
@@ -46,7 +48,7 @@ def get_mock_deadline(id_action=None):
     )
 def test_get_all_deadlines(mocker, client):
     mock_data = [
-        get_mock_deadline("action-1"),
+        get_mock_deadline(ACTION_1),
         get_mock_deadline("action-2")
     ]
     mocker.patch.object(DeadLineController, "get_all", return_value=mock_data)
@@ -54,16 +56,16 @@ def test_get_all_deadlines(mocker, client):
     assert response.status_code == status.HTTP_200_OK
     assert isinstance(response.json(), list)
     assert len(response.json()) == 2
-    assert response.json()[0]["id_action"] == "action-1"
+    assert response.json()[0]["id_action"] == ACTION_1
     assert response.json()[1]["id_action"] == "action-2"
 
 def test_get_deadline_by_id(mocker, client):
-    mock_deadline = get_mock_deadline("action-1")
+    mock_deadline = get_mock_deadline(ACTION_1)
     mocker.patch.object(DeadLineController, "get_by_id", return_value=mock_deadline)
     response = client.get(f"/deadline/{mock_deadline.id_deadline}")
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["id_deadline"] == mock_deadline.id_deadline
-    assert response.json()["id_action"] == "action-1"
+    assert response.json()["id_action"] == ACTION_1
 
 def test_get_deadline_by_id_not_found(mocker, client):
     mocker.patch.object(DeadLineController, "get_by_id", side_effect=HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deadline not found"))
@@ -72,25 +74,25 @@ def test_get_deadline_by_id_not_found(mocker, client):
     assert "not found" in response.text.lower()
 
 def test_create_deadline(mocker, client):
-    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": "action-1", "year": 2025}
-    mock_deadline = get_mock_deadline("action-1")
+    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": ACTION_1, "year": 2025}
+    mock_deadline = get_mock_deadline(ACTION_1)
     mocker.patch.object(DeadLineController, "create_deadline", return_value=mock_deadline)
     response = client.post("/deadline/", json=payload)
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json()["id_action"] == "action-1"
+    assert response.json()["id_action"] == ACTION_1
     assert "id_deadline" in response.json()
 
 def test_update_deadline(mocker, client):
-    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": "action-1", "year": 2025}
-    mock_deadline = get_mock_deadline("action-1")
+    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": ACTION_1, "year": 2025}
+    mock_deadline = get_mock_deadline(ACTION_1)
     mocker.patch.object(DeadLineController, "update_deadline", return_value=mock_deadline)
     response = client.put(f"/deadline/{mock_deadline.id_deadline}", json=payload)
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["id_action"] == "action-1"
+    assert response.json()["id_action"] == ACTION_1
 
 def test_update_deadline_not_found(mocker, client):
     mocker.patch.object(DeadLineController, "update_deadline", side_effect=HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deadline not found"))
-    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": "action-1", "year": 2025}
+    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": ACTION_1, "year": 2025}
     response = client.put("/deadline/non-existent-id", json=payload)
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert "not found" in response.text.lower()
@@ -121,25 +123,25 @@ def test_get_deadline_by_id_not_found(mocker, client):
     assert "not found" in response.text.lower()
 
 def test_create_deadline(mocker, client):
-    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": "action-1", "year": 2025}
-    mock_deadline = get_mock_deadline("action-1")
+    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": ACTION_1, "year": 2025}
+    mock_deadline = get_mock_deadline(ACTION_1)
     mocker.patch.object(DeadLineController, "create_deadline", return_value=mock_deadline)
     response = client.post("/deadline/", json=payload)
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json()["id_action"] == "action-1"
+    assert response.json()["id_action"] == ACTION_1
     assert "id_deadline" in response.json()
 
 def test_update_deadline(mocker, client):
-    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": "action-1", "year": 2025}
-    mock_deadline = get_mock_deadline("action-1")
+    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": ACTION_1, "year": 2025}
+    mock_deadline = get_mock_deadline(ACTION_1)
     mocker.patch.object(DeadLineController, "update_deadline", return_value=mock_deadline)
     response = client.put(f"/deadline/{mock_deadline.id_deadline}", json=payload)
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["id_action"] == "action-1"
+    assert response.json()["id_action"] == ACTION_1
 
 def test_update_deadline_not_found(mocker, client):
     mocker.patch.object(DeadLineController, "update_deadline", side_effect=HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deadline not found"))
-    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": "action-1", "year": 2025}
+    payload = {"deadline_date": "2025-01-01T00:00:00", "id_action": ACTION_1, "year": 2025}
     response = client.put("/deadline/non-existent-id", json=payload)
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert "not found" in response.text.lower()
@@ -25,6 +25,9 @@ from app.controllers import HistoryController
 import uuid
 from datetime import datetime
 
+VAR1 = "2170abf0-f4f8-5153-8382-95faa5f1e154"
+REP1 = "4edf23ed-4b1a-57d9-ba1c-254623c268b4"
+
 @pytest.fixture(name="session")
 def session_fixture():
     engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
@@ -43,8 +46,8 @@ def client():
 def get_mock_history():
     return History(
         id_history=str(uuid4()),
-        id_variable='var1',
-        id_report='rep1',
+        id_variable=VAR1,
+        id_report=REP1,
         date=datetime.now()
     )
 
@@ -69,25 +72,32 @@ def test_get_history_by_id_not_found(mocker, client):
     assert "not found" in response.text.lower()
 
 def test_create_history(mocker, client):
-    payload = {"id_variable": "var1", "id_report": "rep1", "date": "2025-01-01T00:00:00"}
+    payload = {"id_variable": VAR1, "id_report": REP1, "date": "2025-01-01T00:00:00"}
     mock_history = get_mock_history()
     mocker.patch.object(HistoryController, "create_history", return_value=mock_history)
     response = client.post("/history/", json=payload)
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json()["id_variable"] == "var1"
+    assert response.json()["id_variable"] == VAR1
     assert "id_history" in response.json()
 
+def test_create_history_rejects_malformed_ids(mocker, client):
+    payload = {"id_variable": "var1", "id_report": REP1, "date": "2025-01-01T00:00:00"}
+    create = mocker.patch.object(HistoryController, "create_history")
+    response = client.post("/history/", json=payload)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    create.assert_not_called()
+
 def test_update_history(mocker, client):
-    payload = {"id_variable": "var1", "id_report": "rep1", "date": "2025-01-01T00:00:00"}
+    payload = {"id_variable": VAR1, "id_report": REP1, "date": "2025-01-01T00:00:00"}
     mock_history = get_mock_history()
     mocker.patch.object(HistoryController, "update_history", return_value=mock_history)
     response = client.put(f"/history/{mock_history.id_history}", json=payload)
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["id_variable"] == "var1"
+    assert response.json()["id_variable"] == VAR1
 
 def test_update_history_not_found(mocker, client):
     mocker.patch.object(HistoryController, "update_history", side_effect=HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="History not found"))
-    payload = {"id_variable": "var1", "id_report": "rep1", "date": "2025-01-01T00:00:00"}
+    payload = {"id_variable": VAR1, "id_report": REP1, "date": "2025-01-01T00:00:00"}
     response = client.put("/history/non-existent-id", json=payload)
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert "not found" in response.text.lower()
@@ -138,3 +148,20 @@ def test_get_history_by_action(mocker, client):
     response = client.get("/history/action/action1")
     assert response.status_code == status.HTTP_200_OK
     assert isinstance(response.json(), list)
+
+def test_get_all_history_as_arrow(mocker, client):
+    ipc = pytest.importorskip("pyarrow.ipc")
+    mocker.patch.object(HistoryController, "get_all", return_value=[get_mock_history()])
+    response = client.get("/history/", headers={"Accept": "application/vnd.apache.arrow.stream"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    assert ipc.open_stream(response.content).read_all().column("id_variable").to_pylist() == [VAR1]
+
+def test_get_all_history_fields(mocker, client):
+    get_all = mocker.patch.object(HistoryController, "get_all", return_value=[get_mock_history()])
+    response = client.get("/history/?fields=id_variable,value")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"id_variable": VAR1, "value": get_mock_history().value}]
+    assert [column.key for column in get_all.call_args.kwargs["columns"]] == ["id_variable", "value"]
+
+    assert client.get("/history/?fields=id_variable,nope").status_code == status.HTTP_400_BAD_REQUEST
@@ -17,7 +17,7 @@ with patch('app.db.engine', test_engine), patch('app.db.get_session', get_test_s
     from app.main import app
     SQLModel.metadata.create_all(test_engine)
 
-from app.models.Institution import InstitutionCreate, InstitutionUpdate
+from app.models.Institution import Institution, InstitutionCreate, InstitutionUpdate
 from app.controllers import InstitutionController
 from app.controllers import InstitutionTypeController
 from app.utils.auth import get_admin_user
@@ -40,7 +40,7 @@ def test_get_all_institutions(mocker, client):
       {"id_institution": "68d5412b-29d7-40ef-b234-64a5f55b5497", "institution_name": "Institution 1", "id_institution_type": 1},
       {"id_institution": "d4185081-2f8b-4714-8855-f48f9262c6c7", "institution_name": "Institution 2", "id_institution_type": 2},
   ]
-  mocker.patch.object(InstitutionController, "get_all", return_value=mock_data)
+  mocker.patch.object(InstitutionController, "get_all", return_value=[Institution(**item) for item in mock_data])
 
   response = client.get("/institution/")
 
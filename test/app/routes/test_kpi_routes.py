@@ -22,6 +22,9 @@ from app.models.Kpi import Kpi
 from app.controllers import KpiController
 from app.utils.auth import verify_access_token
 
+ACTION_2 = "ba250760-7dfb-59a1-b77e-d8a96e0ba635"
+ACTION_3 = "991740c4-377e-5657-a123-3bc6defe38bc"
+
 @pytest.fixture(autouse=True)
 def override_auth_dependency():
     # Override to bypass authentication
@@ -54,19 +57,19 @@ def test_get_kpis_by_action(mocker, client):
     assert data[1]["id_action"] == "action-1"
 
 def test_create_kpi(mocker, client):
-    mock_kpi = get_mock_kpi("action-2", "desc-create")
+    mock_kpi = get_mock_kpi(ACTION_2, "desc-create")
     mocker.patch.object(KpiController, "create_kpi", return_value=mock_kpi)
-    payload = {"id_action": "action-2", "description": "desc-create"}
+    payload = {"id_action": ACTION_2, "description": "desc-create"}
     response = client.post("/kpi/", json=payload)
     assert response.status_code == status.HTTP_201_CREATED
     data = response.json()
-    assert data["id_action"] == "action-2"
+    assert data["id_action"] == ACTION_2
     assert data["description"] == "desc-create"
 
 def test_update_kpi(mocker, client):
-    mock_kpi = get_mock_kpi("action-3", "desc-updated")
+    mock_kpi = get_mock_kpi(ACTION_3, "desc-updated")
     mocker.patch.object(KpiController, "update_kpi", return_value=mock_kpi)
-    payload = {"id_kpi": mock_kpi.id_kpi, "id_action": "action-3", "description": "desc-updated"}
+    payload = {"id_kpi": mock_kpi.id_kpi, "id_action": ACTION_3, "description": "desc-updated"}
     response = client.put(f"/kpi/{mock_kpi.id_kpi}", json=payload)
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
@@ -1,6 +1,6 @@
 import pytest
 from fastapi.testclient import TestClient
-from fastapi import status
+from fastapi import HTTPException, status
 from datetime import datetime
 from uuid import uuid4
 from app.main import app
@@ -29,6 +29,7 @@ def get_mock_ppda(id_institution=None):
     return Ppda(
         id_ppda=str(uuid4()),
         id_institution=id_institution or str(uuid4()),
+        name="PPDA de prueba",
         created_at=now,
         updated_at=now
     )
@@ -46,18 +47,19 @@ def test_get_all_ppda(mocker, client):
     # Convertimos los modelos a dict para la comparación
     assert response.json() == [item.model_dump() for item in mock_data]
 
-def test_get_ppda_by_id(mocker, client):
+def test_get_ppda_by_id(client):
     mock_data = get_mock_ppda("68d5412b-29d7-40ef-b234-64a5f55b5497")
-    mocker.patch.object(PpdaController, "get_by_id", return_value=mock_data)
-    mocker.patch.object(ppda_routes, "verify_institution_role", return_value=True)
+    app.dependency_overrides[ppda_routes.viewable_ppda] = lambda: mock_data
 
     response = client.get(f"/ppda/{mock_data.id_ppda}")
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == mock_data.model_dump()
 
-def test_get_ppda_not_found(mocker, client):
-    mocker.patch.object(PpdaController, "get_by_id", return_value=None)
+def test_get_ppda_not_found(client):
+    def not_found():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ppda not found")
+    app.dependency_overrides[ppda_routes.viewable_ppda] = not_found
 
     response = client.get(f"/ppda/{str(uuid4())}")
 
@@ -196,9 +198,62 @@ def test_delete_ppda(mocker, client):
 
 def test_delete_ppda_not_found(mocker, client):
     ppda_id = str(uuid4())
-    mocker.patch.object(PpdaController, "get_by_id", return_value=None)
+    mocker.patch.object(
+        PpdaController,
+        "delete_ppda",
+        side_effect=HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ppda not found")
+    )
 
     response = client.delete(f"/ppda/{ppda_id}")
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json() == {"detail": "Ppda not found"}
\ No newline at end of file
+    assert response.json() == {"detail": "Ppda not found"}
+def test_get_ppda_at_and_within(mocker, client):
+    mock_data = [get_mock_ppda()]
+    get_at = mocker.patch.object(PpdaController, "get_at", return_value=mock_data)
+    get_within = mocker.patch.object(PpdaController, "get_within", return_value=mock_data)
+
+    response = client.get("/ppda/at?lat=-33.45&lon=-70.66&fields=id_ppda")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"id_ppda": mock_data[0].id_ppda}]
+    assert get_at.call_args.args[:2] == (-33.45, -70.66)
+
+    assert client.get("/ppda/within?bbox=-71,-33.7,-70.4,-33.3").status_code == status.HTTP_200_OK
+    assert get_within.call_args.args[0] == (-71, -33.7, -70.4, -33.3)
+    assert client.get("/ppda/within?bbox=-71,-33.7").status_code == status.HTTP_400_BAD_REQUEST
+    assert client.get("/ppda/at?lat=-100&lon=0").status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+def test_get_my_ppda(mocker, client):
+    app.dependency_overrides[verify_access_token] = lambda: {"sub": "member"}
+    mock_data = [get_mock_ppda()]
+    get_mine = mocker.patch.object(PpdaController, "get_mine", return_value=mock_data)
+
+    response = client.get("/ppda/mine?role=2&limit=10&offset=20&fields=id_ppda")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"id_ppda": mock_data[0].id_ppda}]
+    assert get_mine.call_args.args[0] == "member"
+    assert get_mine.call_args.args[2] == 2
+    assert get_mine.call_args.args[5:] == (10, 20)
+    assert client.get("/ppda/mine?limit=0").status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+def test_get_ppda_by_institution(mocker, client):
+    app.dependency_overrides[verify_access_token] = lambda: {"sub": "member"}
+    get_by_institution = mocker.patch.object(
+        PpdaController, "get_by_institution",
+        side_effect=HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User in not member of all required institutions")
+    )
+
+    response = client.get("/ppda/institution/inst-1")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert get_by_institution.call_args.args[:2] == ("inst-1", "member")
+
+
+def test_create_ppda_rejects_invalid_bbox(mocker, client):
+    create_ppda = mocker.patch.object(PpdaController, "create_ppda")
+    partial = {"id_institution": str(uuid4()), "min_lon": 10}
+    inverted = {"id_institution": str(uuid4()), "min_lon": -70, "min_lat": -33, "max_lon": -71, "max_lat": -34}
+
+    assert client.post("/ppda/", json=partial).status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert client.post("/ppda/", json=inverted).status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert client.put(f"/ppda/{uuid4()}", json=partial).status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    create_ppda.assert_not_called()
@@ -7,6 +7,9 @@ from app.models.Report import Report
 from app.controllers import ReportController
 from app.utils.auth import verify_access_token
 
+ACTION_1 = "ff209516-5043-5ff8-8aa3-8c87d968d7b5"
+UPDATED_ACTION = "ac30fddf-59da-5292-a83f-ab61b5283e74"
+
 @pytest.fixture(autouse=True)
 def override_auth_dependency():
     # Override para bypassear la autenticación
@@ -26,20 +29,20 @@ def get_mock_report(id_action=None):
 
 def test_get_reports_by_action(mocker, client):
     mock_data = [
-        get_mock_report("action-1"),
-        get_mock_report("action-1")
+        get_mock_report(ACTION_1),
+        get_mock_report(ACTION_1)
     ]
     mocker.patch.object(ReportController, "get_by_action", return_value=mock_data)
     response = client.get("/report/action/action-1")
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert isinstance(data, list)
-    assert all(report["id_action"] == "action-1" for report in data)
+    assert all(report["id_action"] == ACTION_1 for report in data)
     assert len(data) == 2
 
 def test_get_all_reports(mocker, client):
     mock_data = [
-        get_mock_report("action-1"),
+        get_mock_report(ACTION_1),
         get_mock_report("action-2")
     ]
     mocker.patch.object(ReportController, "get_all", return_value=mock_data)
@@ -47,16 +50,16 @@ def test_get_all_reports(mocker, client):
     assert response.status_code == status.HTTP_200_OK
     assert isinstance(response.json(), list)
     assert len(response.json()) == 2
-    assert response.json()[0]["id_action"] == "action-1"
+    assert response.json()[0]["id_action"] == ACTION_1
     assert response.json()[1]["id_action"] == "action-2"
 
 def test_get_report_by_id(mocker, client):
-    mock_report = get_mock_report("action-1")
+    mock_report = get_mock_report(ACTION_1)
     mocker.patch.object(ReportController, "get_by_id", return_value=mock_report)
     response = client.get(f"/report/{mock_report.id_report}")
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["id_report"] == mock_report.id_report
-    assert response.json()["id_action"] == "action-1"
+    assert response.json()["id_action"] == ACTION_1
 
 def test_get_report_by_id_not_found(mocker, client):
     mocker.patch.object(ReportController, "get_by_id", side_effect=HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"))
@@ -65,25 +68,25 @@ def test_get_report_by_id_not_found(mocker, client):
     assert "not found" in response.text.lower()
 
 def test_create_report(mocker, client):
-    payload = {"id_action": "action-1"}
-    mock_report = get_mock_report("action-1")
+    payload = {"id_action": ACTION_1}
+    mock_report = get_mock_report(ACTION_1)
     mocker.patch.object(ReportController, "create_report", return_value=mock_report)
     response = client.post("/report/", json=payload)
     assert response.status_code == status.HTTP_201_CREATED
-    assert response.json()["id_action"] == "action-1"
+    assert response.json()["id_action"] == ACTION_1
     assert "id_report" in response.json()
 
 def test_update_report(mocker, client):
-    payload = {"id_action": "updated-action"}
-    mock_report = get_mock_report("updated-action")
+    payload = {"id_action": UPDATED_ACTION}
+    mock_report = get_mock_report(UPDATED_ACTION)
     mocker.patch.object(ReportController, "update_report", return_value=mock_report)
     response = client.put(f"/report/{mock_report.id_report}", json=payload)
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["id_action"] == "updated-action"
+    assert response.json()["id_action"] == UPDATED_ACTION
 
 def test_update_report_not_found(mocker, client):
     mocker.patch.object(ReportController, "update_report", side_effect=HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"))
-    payload = {"id_action": "updated-action"}
+    payload = {"id_action": UPDATED_ACTION}
     response = client.put("/report/non-existent-id", json=payload)
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert "not found" in response.text.lower()
@@ -0,0 +1,32 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from app.main import app
+from app.controllers import SearchController
+from app.models.Search import SearchPage, SearchResult
+from app.utils.auth import verify_access_token
+
+@pytest.fixture(autouse=True)
+def override_auth_dependency():
+    app.dependency_overrides[verify_access_token] = lambda: True
+    yield
+    app.dependency_overrides.clear()
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+def test_search(mocker, client):
+    page = SearchPage(total=1, limit=20, offset=0, results=[SearchResult(kind="ppda", id="p-1", title="PPDA Santiago", rank=0.5)])
+    search = mocker.patch.object(SearchController, "search", return_value=page)
+
+    response = client.get("/search/?q=santiago&kind=ppda")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == page.model_dump()
+    assert search.call_args.args[2] == ["ppda"]
+
+def test_search_validates_query(client):
+    assert client.get("/search/?q=").status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert client.get("/search/?q=x&kind=user").status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert client.get("/search/?q=x&limit=1000").status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -25,6 +25,10 @@ from app.controllers import VariableController, KpiController
 from app.utils.auth import verify_access_token, get_admin_user
 from uuid import uuid4
 
+KPI_2 = "da237429-631f-55a7-939b-e2d70b297b0d"
+KPI_3 = "f5034580-0eb3-53c2-8c89-e3f9b53fd2a4"
+INVALID_KPI = "3d94182e-a17b-5b37-8264-09a303ef30bc"
+
 @pytest.fixture(name="session")
 def session_fixture():
     engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
@@ -54,7 +58,7 @@ def get_mock_variable(id_kpi=None, formula=None, verification_medium=None):
 def test_get_all_variables(mocker, client):
     mock_data = [
         get_mock_variable("kpi-1", "formula-1", "medium-1"),
-        get_mock_variable("kpi-2", "formula-2", "medium-2")
+        get_mock_variable(KPI_2, "formula-2", "medium-2")
     ]
     mocker.patch.object(VariableController, "get_all_variables", return_value=mock_data)
     response = client.get("/variable/")
@@ -75,12 +79,12 @@ def test_get_variable_by_id(mocker, client):
     assert data["verification_medium"] == "medium-1"
 
 def test_create_variable(mocker, client):
-    mock_variable = get_mock_variable("kpi-2", "formula-create", "medium-create")
+    mock_variable = get_mock_variable(KPI_2, "formula-create", "medium-create")
     mocker.patch.object(VariableController, "create_variable", return_value=mock_variable)
     mocker.patch.object(KpiController, "get_kpi_by_id", return_value=True)  # Mock KPI validation
     
     payload = {
-        "id_kpi": "kpi-2", 
+        "id_kpi": KPI_2, 
         "formula": "formula-create", 
         "verification_medium": "medium-create"
     }
@@ -88,17 +92,17 @@ def test_create_variable(mocker, client):
     
     assert response.status_code == status.HTTP_201_CREATED
     data = response.json()
-    assert data["id_kpi"] == "kpi-2"
+    assert data["id_kpi"] == KPI_2
     assert data["formula"] == "formula-create"
     assert data["verification_medium"] == "medium-create"
 
 def test_update_variable(mocker, client):
-    mock_variable = get_mock_variable("kpi-3", "formula-updated", "medium-updated")
+    mock_variable = get_mock_variable(KPI_3, "formula-updated", "medium-updated")
     mocker.patch.object(VariableController, "update_variable", return_value=mock_variable)
     mocker.patch.object(KpiController, "get_kpi_by_id", return_value=True)  # Mock KPI validation
     
     payload = {
-        "id_kpi": "kpi-3", 
+        "id_kpi": KPI_3, 
         "formula": "formula-updated", 
         "verification_medium": "medium-updated"
     }
@@ -143,7 +147,7 @@ def test_create_variable_invalid_kpi(mocker, client):
         status_code=status.HTTP_404_NOT_FOUND, detail="KPI not found"))
     
     payload = {
-        "id_kpi": "invalid-kpi", 
+        "id_kpi": INVALID_KPI, 
         "formula": "formula-test", 
         "verification_medium": "medium-test"
     }
@@ -0,0 +1,124 @@
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, status
+from fastapi.testclient import TestClient
+from limits.storage import storage_from_string
+from pydantic import BaseModel, field_serializer
+from sqlmodel import SQLModel, Session, create_engine, select, text
+
+from app import db
+from app.db import LazySession, SessionRoute, get_session
+from app.models import InstitutionType
+from app.utils.auth import generate_access_token
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+handed_out = []
+
+
+class Answer(BaseModel):
+    value: int
+
+    @field_serializer("value")
+    def serialize_value(self, value):
+        # Runs while FastAPI serializes the response
+        assert not handed_out[-1].is_open
+        return value
+
+
+def deny():
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+
+router = APIRouter(prefix="/items", route_class=SessionRoute)
+
+
+@router.get("/", response_model=Answer)
+async def read(session=Depends(get_session)):
+    handed_out.append(session)
+    return {"value": session.exec(text("SELECT 1")).one()[0]}
+
+
+@router.get("/denied", dependencies=[Depends(deny)])
+async def denied(session=Depends(get_session)):
+    return {"value": 1}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(db, "engine", engine)
+    app = FastAPI()
+    app.include_router(router)
+    handed_out.clear()
+    return TestClient(app)
+
+
+def test_lazy_session_opens_on_first_use():
+    session = LazySession(engine)
+    assert not session.is_open
+    session.exec(text("SELECT 1"))
+    assert session.is_open
+    session.release()
+    assert not session.is_open
+
+
+def test_session_released_before_serialization(client):
+    response = client.get("/items/")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"value": 1}
+
+
+def test_failed_auth_never_opens_session(client, monkeypatch):
+    opened = []
+    monkeypatch.setattr(db, "SessionLocal", lambda **kwargs: opened.append(kwargs))
+    response = client.get("/items/denied")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert opened == []
+
+
+@pytest.fixture
+def replica_client(monkeypatch, tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path}/primary.db", connect_args={"check_same_thread": False})
+    replica = create_engine(f"sqlite:///{tmp_path}/replica.db", connect_args={"check_same_thread": False})
+    for bind, name in ((primary, "primary"), (replica, "replica")):
+        SQLModel.metadata.create_all(bind)
+        with Session(bind) as session:
+            session.add(InstitutionType(id_institution_type=1, institution_type=name))
+            session.commit()
+    monkeypatch.setattr(db, "engine", primary)
+    monkeypatch.setattr(db, "replica_engine", replica)
+    monkeypatch.setattr(db, "replica_sticky_storage", storage_from_string("memory://"))
+
+    replica_router = APIRouter(prefix="/types", route_class=SessionRoute)
+
+    @replica_router.get("/")
+    async def list_types(session=Depends(get_session)):
+        return [row.institution_type for row in session.exec(select(InstitutionType)).all()]
+
+    @replica_router.post("/")
+    async def create_type(session=Depends(get_session)):
+        session.add(InstitutionType(institution_type="new"))
+        session.commit()
+        return {"ok": True}
+
+    app = FastAPI()
+    app.include_router(replica_router)
+    return TestClient(app)
+
+
+def test_get_reads_from_replica(replica_client):
+    assert replica_client.get("/types/").json() == ["replica"]
+
+
+def test_client_sticks_to_primary_after_write(replica_client):
+    writer = {"Authorization": f"Bearer {generate_access_token({'sub': 'writer'})}"}
+    reader = {"Authorization": f"Bearer {generate_access_token({'sub': 'reader'})}"}
+    assert replica_client.post("/types/", headers=writer).status_code == status.HTTP_200_OK
+    assert replica_client.get("/types/", headers=writer).json() == ["primary", "new"]
+    assert replica_client.get("/types/", headers=reader).json() == ["replica"]
+
+
+def test_sticky_mark_is_read_once_on_first_query(replica_client, mocker):
+    lookup = mocker.spy(db, "reads_from_replica")
+    assert replica_client.post("/types/").status_code == status.HTTP_200_OK
+    assert lookup.call_count == 0
+    assert replica_client.get("/types/").json() == ["primary", "new"]
+    assert lookup.call_count == 1
@@ -0,0 +1,105 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.controllers import HistoryController
+from app.models import Action, History, Kpi, Ppda, Report, Variable
+from app.utils import archive
+
+pytest.importorskip("pyarrow")
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+OLD = int(datetime(2021, 6, 1, tzinfo=timezone.utc).timestamp())
+OLDER = int(datetime(2020, 6, 1, tzinfo=timezone.utc).timestamp())
+RECENT = int(datetime(2025, 6, 1, tzinfo=timezone.utc).timestamp())
+CUTOFF = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Ppda(id_ppda="ppda-1", name="PPDA Temuco"))
+        session.add(Action(id_action="action-1", id_ppda="ppda-1"))
+        session.add(Report(id_report="report-1", id_action="action-1"))
+        session.add(Kpi(id_kpi="kpi-1", id_action="action-1"))
+        session.add(Variable(id_variable="variable-1", id_kpi="kpi-1"))
+        for id_history, created_at in (("h-older", OLDER), ("h-old", OLD), ("h-recent", RECENT)):
+            session.add(History(
+                id_history=id_history, id_report="report-1", id_variable="variable-1",
+                value="1", created_at=created_at, updated_at=created_at
+            ))
+        session.commit()
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def archive_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "archive_dir", str(tmp_path))
+    return tmp_path
+
+
+def test_archive_moves_rows_to_files(session, archive_dir):
+    assert archive.archive_history(session, CUTOFF, batch_size=1) == 2
+    assert session.exec(select(History.id_history)).all() == ["h-recent"]
+    assert sorted(path.parent.name for path in archive_dir.glob("ppda=ppda-1/year=*/*.arrow")) == ["year=2020", "year=2021"]
+
+
+@pytest.fixture
+def statements():
+    executed = []
+    listener = lambda *args: executed.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    yield executed
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+def test_archive_deletes_within_the_batch_window(session, archive_dir, statements):
+    archive.archive_history(session, CUTOFF)
+    deletes = [statement for statement in statements if statement.startswith("DELETE")]
+    assert len(deletes) == 1
+    assert "history.created_at <=" in deletes[0]
+
+
+@pytest.mark.asyncio
+async def test_queries_union_hot_and_archived_rows(session, archive_dir):
+    archive.archive_history(session, CUTOFF)
+    by_action = await HistoryController.get_by_action("action-1", session)
+    assert sorted(h.id_history for h in by_action) == ["h-old", "h-older", "h-recent"]
+    by_kpi = await HistoryController.get_by_kpi("kpi-1", session)
+    assert len(by_kpi) == 3
+    assert await HistoryController.get_by_variable("other", session) == []
+
+
+@pytest.mark.asyncio
+async def test_archive_reads_respect_window(session, archive_dir):
+    archive.archive_history(session, CUTOFF)
+    window = await HistoryController.get_all(session, from_date=OLD, to_date=CUTOFF)
+    assert [h.id_history for h in window] == ["h-old"]
+    assert window[0].created_at == OLD
+
+
+@pytest.mark.asyncio
+async def test_rows_still_in_database_are_not_duplicated(session, archive_dir):
+    archive.archive_history(session, CUTOFF)
+    # Same rows again in the database, as after an interrupted run
+    session.add(History(id_history="h-old", id_report="report-1", created_at=OLD))
+    session.commit()
+    rows = await HistoryController.get_all(session)
+    assert sorted(h.id_history for h in rows) == ["h-old", "h-older", "h-recent"]
+
+
+@pytest.mark.asyncio
+async def test_filtered_reads_only_open_their_ppda(session, archive_dir):
+    archive.archive_history(session, CUTOFF)
+    assert archive.archive_folders(session, {"id_variable": "variable-1"}) == ["ppda-1", archive.NO_PPDA]
+    assert archive.archive_folders(session, {"id_kpi": "other"}) == [archive.NO_PPDA]
+    # Not a valid Arrow file: reading it would fail
+    other = archive_dir / "ppda=ppda-2" / "year=2021"
+    other.mkdir(parents=True)
+    (other / "part-broken.arrow").write_bytes(b"not arrow")
+    by_report = await HistoryController.get_by_report("report-1", session, from_date=OLD)
+    assert sorted(h.id_history for h in by_report) == ["h-old", "h-recent"]
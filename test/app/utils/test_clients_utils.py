@@ -0,0 +1,23 @@
+from fastapi import Request
+
+from app.utils.auth import generate_refresh_token
+from app.utils.clients import client_key
+
+
+def test_invalid_token_falls_back_to_address():
+    request = Request({
+        "type": "http",
+        "headers": [(b"authorization", b"Bearer not-a-token")],
+        "client": ("10.0.0.1", 1234),
+    })
+    assert client_key(request) == "10.0.0.1"
+
+
+def test_refresh_tokens_are_keyed_by_address():
+    refresh_token, _, _ = generate_refresh_token({"sub": "alice"})
+    request = Request({
+        "type": "http",
+        "headers": [(b"authorization", f"Bearer {refresh_token}".encode())],
+        "client": ("10.0.0.1", 1234),
+    })
+    assert client_key(request) == "10.0.0.1"
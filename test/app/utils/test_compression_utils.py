@@ -0,0 +1,142 @@
+import gzip
+import zlib
+
+import brotli
+import pytest
+import zstandard
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.utils import compression
+from app.utils.compression import CompressionMiddleware, negotiate_encoding
+
+BIG = "x" * 5000
+# Incremental decoders, as a client reading the stream would use
+DECODERS = {
+    "gzip": lambda: zlib.decompressobj(31).decompress,
+    "br": lambda: brotli.Decompressor().process,
+    "zstd": lambda: zstandard.ZstdDecompressor().decompressobj().decompress,
+}
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/big")
+    async def big():
+        return {"data": BIG}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for index in range(3):
+                yield f'"{index}{BIG}",'.encode()
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    @app.get("/encoded")
+    async def encoded():
+        return Response(gzip.compress(BIG.encode()), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/cached")
+    async def cached(request: Request):
+        if request.headers.get("if-none-match") == '"v1"':
+            return Response(status_code=304, headers={"ETag": '"v1"'})
+        return PlainTextResponse(BIG, headers={"ETag": '"v1"'})
+
+    @app.get("/cached-other")
+    async def cached_other():
+        return PlainTextResponse("y" * 5000, headers={"ETag": '"v1"'})
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    return TestClient(app)
+
+
+def raw_get(client, path, encoding="gzip"):
+    return client.get(path, headers={"Accept-Encoding": encoding})
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("") is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("*") == next(iter(compression.ENCODERS))
+
+
+def test_small_responses_are_not_compressed():
+    client = make_client()
+    response = raw_get(client, "/small")
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"ok": True}
+
+
+def test_large_responses_are_gzipped():
+    client = make_client()
+    response = raw_get(client, "/big")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(BIG)
+    assert response.json() == {"data": BIG}
+
+
+def test_identity_when_not_accepted():
+    client = make_client()
+    response = raw_get(client, "/big", "identity")
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"data": BIG}
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_streaming_responses_are_compressed_per_chunk(encoding):
+    client = make_client()
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": encoding}) as response:
+        assert response.headers["content-encoding"] == encoding
+        assert "content-length" not in response.headers
+        raw = b"".join(response.iter_raw())
+    body = DECODERS[encoding]()(raw).decode()
+    assert body == "".join(f'"{index}{BIG}",' for index in range(3))
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_encoder_chunks_decode_as_they_arrive(encoding):
+    encoder, decode = compression.ENCODERS[encoding](), DECODERS[encoding]()
+    assert decode(encoder.compress(b"first chunk ")) == b"first chunk "
+    assert decode(encoder.compress(b"second chunk") + encoder.finish()) == b"second chunk"
+
+
+def test_already_encoded_responses_pass_through():
+    client = make_client()
+    response = raw_get(client, "/encoded")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == BIG.encode()
+
+
+def test_bodies_with_etag_are_compressed_once(monkeypatch):
+    client = make_client()
+    calls = []
+    original = compression.compress
+    monkeypatch.setattr(compression, "compress", lambda body, encoding: calls.append(encoding) or original(body, encoding))
+    for _ in range(3):
+        assert raw_get(client, "/cached").text == BIG
+    assert calls == ["gzip"]
+
+
+def test_etag_cache_is_per_path():
+    client = make_client()
+    assert raw_get(client, "/cached").text == BIG
+    assert raw_get(client, "/cached-other").text == "y" * 5000
+
+
+def test_compressed_variant_has_its_own_etag():
+    client = make_client()
+    response = raw_get(client, "/cached")
+    assert response.headers["etag"] == '"v1-gzip"'
+    assert raw_get(client, "/cached", "identity").headers["etag"] == '"v1"'
+
+    revalidated = client.get("/cached", headers={"Accept-Encoding": "gzip", "If-None-Match": '"v1-gzip"'})
+    assert revalidated.status_code == 304
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session, create_engine, select
+from sqlmodel.pool import StaticPool
+
+from app.models import DeadLine, Ppda
+from app.utils.filters import ListQuery, list_query
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+ppda_query = list_query(Ppda, filters=("status", "region"), ranges=("start_date",), sort=("start_date", "end_date"))
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for index, (status, region) in enumerate([("vigente", "Metropolitana"), ("vigente", "Biobío"), ("derogado", "Metropolitana")]):
+            session.add(Ppda(id_ppda=f"p-{index}", name=f"PPDA {index}", status=status, region=region, start_date=100 * index))
+        session.commit()
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def client(session):
+    app = FastAPI()
+
+    @app.get("/ppda")
+    def ppda(query: ListQuery = Depends(ppda_query)):
+        return [row.id_ppda for row in session.exec(query.apply(select(Ppda)))]
+
+    return TestClient(app)
+
+
+def test_filters_and_sort_run_in_sql(client):
+    assert client.get("/ppda?status=vigente&sort=-start_date").json() == ["p-1", "p-0"]
+    assert client.get("/ppda?status=vigente&status=derogado&region=Metropolitana").json() == ["p-0", "p-2"]
+    assert client.get("/ppda?start_date_from=100&start_date_to=200&sort=start_date").json() == ["p-1"]
+
+
+def test_parameters_are_documented(client):
+    names = {parameter["name"] for parameter in client.get("/openapi.json").json()["paths"]["/ppda"]["get"]["parameters"]}
+    assert names == {"status", "region", "start_date_from", "start_date_to", "sort"}
+
+
+def test_invalid_values_are_rejected(client):
+    assert client.get("/ppda?start_date_from=yesterday").status_code == 400
+    assert client.get("/ppda?sort=-name").status_code == 400
+
+
+def test_values_are_bound_as_parameters():
+    query = ppda_query(status=["vigente'; DROP TABLE ppda; --"], region=None, start_date_from=None, start_date_to=None, sort=None)
+    statement = query.apply(select(Ppda))
+    assert "DROP" not in str(statement)
+    assert "DROP" in str(statement.compile().params)
+
+
+def test_datetime_columns_parse_iso_dates():
+    deadline_query = list_query(DeadLine, ranges=("deadline_date",))
+    query = deadline_query(deadline_date_from="2025-06-01", deadline_date_to=None)
+    assert query.where[0].right.value == datetime(2025, 6, 1)
+    assert query.order_by == []
+
+
+def test_filter_columns_are_indexed():
+    indexed = {column.key for index in Ppda.__table__.indexes for column in index.columns}
+    assert {"status", "region", "municipality", "start_date", "end_date"} <= indexed
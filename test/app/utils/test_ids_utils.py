@@ -0,0 +1,57 @@
+import time
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateTable
+
+from app.models import History, Ppda
+from app.utils.ids import NIL_UUID, UUIDComparison, UUIDString, new_id, uuid7
+
+
+def test_uuid7_layout():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    assert before <= value.int >> 80 <= after + 1
+
+
+def test_uuid7_is_time_ordered():
+    ids = [uuid7() for _ in range(10000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_new_id_is_canonical_string():
+    value = new_id()
+    assert str(uuid.UUID(value)) == value
+
+
+def test_native_uuid_on_postgres():
+    ddl = str(CreateTable(History.__table__).compile(dialect=postgresql.dialect()))
+    assert "id_history UUID" in ddl
+    assert "id_report UUID" in ddl
+    assert "id_history VARCHAR" in str(CreateTable(History.__table__).compile(dialect=sqlite.dialect()))
+
+
+def test_bind_and_result_processing():
+    column_type = UUIDString()
+    value = new_id()
+    assert column_type.process_bind_param(value, postgresql.dialect()) == uuid.UUID(value)
+    with pytest.raises(ValueError):
+        column_type.process_bind_param("not-a-uuid", postgresql.dialect())
+    assert column_type.process_bind_param("ppda-1", sqlite.dialect()) == "ppda-1"
+    assert column_type.process_result_value(uuid.UUID(value), postgresql.dialect()) == value
+
+
+def test_malformed_ids_compare_as_nil():
+    clause = History.id_report == "not-a-uuid"
+    bind = clause.right
+    assert isinstance(bind.type, UUIDComparison)
+    assert bind.type.process_bind_param(bind.value, postgresql.dialect()) == NIL_UUID
+
+
+def test_models_default_to_uuid7():
+    assert uuid.UUID(Ppda(name="PPDA").id_ppda).version == 7
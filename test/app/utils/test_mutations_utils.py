@@ -0,0 +1,100 @@
+import pytest
+from fastapi import HTTPException, status
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.controllers import InstitutionController, PpdaController
+from app.db import SessionLocal
+from app.models import Institution, InstitutionType, InstitutionUpdate, Ppda, PpdaUpdate
+from app.utils.mutations import delete_returning, update_returning
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(InstitutionType(id_institution_type=1, institution_type="Ministerio"))
+        session.add(Institution(id_institution="inst-1", institution_name="SEREMI", id_institution_type=1))
+        session.add(Institution(id_institution="inst-2", institution_name="SMA", id_institution_type=1))
+        session.add(Ppda(id_ppda="ppda-1", id_institution="inst-1", name="PPDA Temuco"))
+        session.commit()
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def statements():
+    executed = []
+    listener = lambda *args: executed.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    yield executed
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+def test_update_returning_single_statement(session, statements):
+    ppda = update_returning(Ppda, Ppda.id_ppda == "ppda-1", {"name": "PPDA Valdivia"}, session, "Ppda not found")
+    assert len(statements) == 1
+    assert "RETURNING" in statements[0]
+    assert ppda.name == "PPDA Valdivia"
+
+
+def test_update_returning_without_values_selects(session):
+    ppda = update_returning(Ppda, Ppda.id_ppda == "ppda-1", {}, session, "Ppda not found")
+    assert ppda.name == "PPDA Temuco"
+
+
+def test_update_returning_not_found(session):
+    with pytest.raises(HTTPException) as exc:
+        update_returning(Ppda, Ppda.id_ppda == "missing", {"name": "x"}, session, "Ppda not found")
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+    assert exc.value.detail == "Ppda not found"
+
+
+def test_delete_returning(session, statements):
+    assert delete_returning(Ppda, Ppda.id_ppda == "ppda-1", session, "Ppda not found") == "ppda-1"
+    assert len(statements) == 1
+    with pytest.raises(HTTPException) as exc:
+        delete_returning(Ppda, Ppda.id_ppda == "ppda-1", session, "Ppda not found")
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_ppda_update_in_one_statement(session, statements):
+    updated = await PpdaController.update_ppda("ppda-1", PpdaUpdate(name="PPDA Temuco y Padre Las Casas"), session)
+    assert len(statements) == 1
+    assert updated.name == "PPDA Temuco y Padre Las Casas"
+
+
+@pytest.mark.asyncio
+async def test_institution_update_in_two_statements(session, statements):
+    updated = await InstitutionController.update_institution("inst-1", InstitutionUpdate(institution_name="SEREMI Salud"), session)
+    assert len(statements) == 2
+    assert updated.institution_name == "SEREMI Salud"
+
+
+@pytest.mark.asyncio
+async def test_institution_update_duplicate(session):
+    with pytest.raises(HTTPException) as exc:
+        await InstitutionController.update_institution("inst-1", InstitutionUpdate(institution_name="SMA"), session)
+    assert exc.value.status_code == status.HTTP_409_CONFLICT
+
+
+@pytest.mark.asyncio
+async def test_institution_update_unknown_type(session):
+    with pytest.raises(HTTPException) as exc:
+        await InstitutionController.update_institution("inst-1", InstitutionUpdate(id_institution_type=99), session)
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_request_session_keeps_returned_values(statements):
+    SQLModel.metadata.create_all(engine)
+    with SessionLocal(bind=engine) as session:
+        session.add(Ppda(id_ppda="ppda-2", name="PPDA Osorno"))
+        session.commit()
+        statements.clear()
+        ppda = update_returning(Ppda, Ppda.id_ppda == "ppda-2", {"name": "PPDA Coyhaique"}, session, "Ppda not found")
+        assert ppda.name == "PPDA Coyhaique"
+        assert len(statements) == 1
+    SQLModel.metadata.drop_all(engine)
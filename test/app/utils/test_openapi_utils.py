@@ -0,0 +1,114 @@
+import gzip
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.utils import openapi
+
+
+def make_app() -> FastAPI:
+    app = FastAPI(title="test")
+
+    @app.get("/items/{id}")
+    async def get_item(id: str):
+        """Gets an item."""
+        return {"id": id}
+
+    return app
+
+
+def test_serves_build_time_file_with_etag(tmp_path, monkeypatch):
+    path = tmp_path / "openapi.json"
+    openapi.write_openapi(make_app(), str(path))
+    monkeypatch.setattr(openapi, "openapi_file", str(path))
+
+    app = make_app()
+    openapi.install_openapi(app)
+    monkeypatch.setattr(openapi, "render_openapi", lambda app: (_ for _ in ()).throw(AssertionError("rendered")))
+    client = TestClient(app)
+
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.content == path.read_bytes()
+    assert "/items/{id}" in response.json()["paths"]
+    assert app.openapi()["paths"] == response.json()["paths"]
+
+    revalidated = client.get("/openapi.json", headers={"If-None-Match": response.headers["ETag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_gzip_variant(tmp_path, monkeypatch):
+    monkeypatch.setattr(openapi, "openapi_file", str(tmp_path / "missing.json"))
+    app = make_app()
+    openapi.install_openapi(app)
+
+    response = TestClient(app).get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"].endswith('-gzip"')
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.json()["info"]["title"] == "test"
+
+
+def test_stale_file_is_regenerated(tmp_path, monkeypatch):
+    path = tmp_path / "openapi.json"
+    openapi.write_openapi(make_app(), str(path))
+    monkeypatch.setattr(openapi, "openapi_file", str(path))
+
+    app = make_app()
+
+    @app.get("/new")
+    async def new():
+        return {}
+
+    openapi.install_openapi(app)
+    body = TestClient(app).get("/openapi.json").json()
+    assert "/new" in body["paths"]
+    assert body[openapi.FINGERPRINT_KEY] == openapi.route_fingerprint(app)
+
+
+def test_fingerprint_covers_query_params():
+    app = make_app()
+
+    @app.get("/items")
+    async def list_items(limit: int = 10):
+        return []
+
+    changed = make_app()
+
+    @changed.get("/items")
+    async def list_items(limit: int = 10, fields: str | None = None):
+        return []
+
+    assert openapi.route_fingerprint(app) != openapi.route_fingerprint(changed)
+
+
+def test_fingerprint_covers_model_schemas():
+    def app_with(model) -> FastAPI:
+        app = FastAPI(title="test")
+
+        @app.post("/items", response_model=model)
+        async def create_item(item: model):
+            return item
+
+        return app
+
+    class Item(BaseModel):
+        name: str
+
+    Item.__qualname__ = "Item"
+
+    class ItemWithBox(BaseModel):
+        name: str
+        min_lon: float | None = None
+
+    ItemWithBox.__name__ = ItemWithBox.__qualname__ = "Item"
+    assert openapi.route_fingerprint(app_with(Item)) != openapi.route_fingerprint(app_with(ItemWithBox))
+    assert openapi.route_fingerprint(app_with(Item)) == openapi.route_fingerprint(app_with(Item))
+
+
+def test_gzip_body_decompresses_to_document():
+    document = openapi.OpenAPIDocument(json.dumps({"openapi": "3.1.0"}).encode())
+    assert gzip.decompress(document.variants["gzip"][0]) == document.body
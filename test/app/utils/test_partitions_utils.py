@@ -0,0 +1,103 @@
+from datetime import datetime, timezone
+
+from sqlmodel import SQLModel, create_engine
+
+from app.utils import partitions
+
+
+def test_month_arithmetic():
+    start = partitions.month_start(datetime(2025, 12, 31, 23, 59, tzinfo=timezone.utc))
+    assert start == datetime(2025, 12, 1, tzinfo=timezone.utc)
+    assert partitions.add_months(start, 1) == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert partitions.add_months(start, -12) == datetime(2024, 12, 1, tzinfo=timezone.utc)
+
+
+def test_partition_name():
+    assert partitions.partition_name(datetime(2026, 3, 1, tzinfo=timezone.utc)) == "history_y2026m03"
+
+
+def test_noop_without_partitioned_table():
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        assert not partitions.is_partitioned(connection)
+        assert partitions.existing_partitions(connection) is None
+        assert partitions.ensure_history_partitions(connection) == []
+        assert partitions.detach_history_partitions(connection, datetime.now(timezone.utc)) == []
+
+
+class FakePostgres:
+    """Connection answering the catalog queries of a partitioned ``history``."""
+
+    dialect = type("Dialect", (), {"name": "postgresql"})
+
+    def __init__(self, existing: set[str]):
+        self.existing = existing
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if "pg_partitioned_table" in sql:
+            return FakeResult((True, sorted(self.existing)))
+        if "to_regclass(:name)" in sql:
+            return FakeResult(params["name"] in self.existing)
+        return FakeResult(None)
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def one(self):
+        return self.value
+
+    def scalar(self):
+        return self.value
+
+
+def test_ensure_skips_the_lock_when_partitions_exist():
+    now = partitions.month_start(datetime.now(timezone.utc))
+    connection = FakePostgres({partitions.partition_name(partitions.add_months(now, offset)) for offset in range(3)})
+    assert partitions.ensure_history_partitions(connection, ahead=2) == []
+    assert len(connection.statements) == 1
+
+
+def test_ensure_locks_and_creates_missing_months():
+    now = partitions.month_start(datetime.now(timezone.utc))
+    months = [partitions.add_months(now, offset) for offset in range(-1, 3)]
+    connection = FakePostgres({partitions.partition_name(now)})
+
+    created = partitions.ensure_history_partitions(connection, since=months[0], ahead=2)
+    assert created == [partitions.partition_name(start) for start in months if start != now]
+    lock = next(index for index, sql in enumerate(connection.statements) if "pg_advisory_xact_lock" in sql)
+    first_create = next(index for index, sql in enumerate(connection.statements) if sql.startswith("CREATE TABLE"))
+    assert lock < first_create
+    attached = [sql for sql in connection.statements if "ATTACH PARTITION" in sql]
+    assert f"FROM ({int(months[0].timestamp())}) TO ({int(now.timestamp())})" in attached[0]
+
+
+def test_cli_ensures_partitions(monkeypatch, capsys):
+    from app import cli, db
+
+    monkeypatch.setattr(db, "create_db_engine", lambda: create_engine("sqlite:///:memory:"))
+    assert cli.main(["ensure-history-partitions", "--ahead", "6"]) == 0
+    assert capsys.readouterr().out.strip() == "Created history partitions: none"
+
+
+def test_migration_names_partitions_like_the_app(monkeypatch):
+    from alembic.script import ScriptDirectory
+
+    from app.utils.schema import MIGRATIONS_DIR
+
+    migration = ScriptDirectory(MIGRATIONS_DIR).get_revision("8c41d2e95a17").module
+    executed = []
+    monkeypatch.setattr(migration, "op", type("Op", (), {"execute": staticmethod(executed.append)}))
+    now = partitions.month_start(datetime.now(timezone.utc))
+    migration._create_monthly_partitions(partitions.add_months(now, -2))
+
+    months = [partitions.add_months(now, offset) for offset in range(-2, migration.PARTITIONS_AHEAD + 1)]
+    assert len(executed) == len(months)
+    for statement, start in zip(executed, months):
+        assert statement.startswith(f"CREATE TABLE {partitions.partition_name(start)} PARTITION OF")
+        assert f"FROM ({int(start.timestamp())}) TO ({int(partitions.add_months(start, 1).timestamp())})" in statement
@@ -0,0 +1,115 @@
+import pytest
+from typing import List
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import SlidingWindowCounterRateLimiter
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import SlowAPIMiddleware
+
+from app.utils import rate_limit
+from app.utils.auth import generate_access_token
+from app.utils.rate_limit import SQLiteStorage, WeightedLimiter
+
+
+@pytest.fixture
+def storage_uri(tmp_path):
+    return f"sqlite:///{tmp_path}/rate-limit.db"
+
+
+def test_sqlite_scheme_is_registered(storage_uri):
+    storage = storage_from_string(storage_uri)
+    assert isinstance(storage, SQLiteStorage)
+    assert storage.check()
+
+
+def test_incr_and_clear(storage_uri):
+    storage = SQLiteStorage(storage_uri)
+    assert storage.incr("key", 60) == 1
+    assert storage.incr("key", 60, amount=4) == 5
+    assert storage.get("key") == 5
+    storage.clear("key")
+    assert storage.get("key") == 0
+
+
+def test_counters_are_shared_between_workers(storage_uri):
+    # Two storages over the same file behave like two uvicorn workers
+    limit = parse("3/minute")
+    worker_a = SlidingWindowCounterRateLimiter(SQLiteStorage(storage_uri))
+    worker_b = SlidingWindowCounterRateLimiter(SQLiteStorage(storage_uri))
+
+    assert worker_a.hit(limit, "client")
+    assert worker_b.hit(limit, "client")
+    assert worker_a.hit(limit, "client")
+    assert not worker_b.hit(limit, "client")
+    assert not worker_a.hit(limit, "client")
+
+
+def test_counters_survive_restart(storage_uri):
+    limit = parse("2/minute")
+    assert SlidingWindowCounterRateLimiter(SQLiteStorage(storage_uri)).hit(limit, "client", cost=2)
+    restarted = SlidingWindowCounterRateLimiter(SQLiteStorage(storage_uri))
+    assert not restarted.hit(limit, "client")
+
+
+def test_reset(storage_uri):
+    storage = SQLiteStorage(storage_uri)
+    storage.incr("a", 60)
+    storage.incr("b", 60)
+    assert storage.reset() == 2
+    assert storage.get("a") == 0
+
+
+def build_app():
+    app = FastAPI()
+
+    @app.get("/items", response_model=List[int])
+    async def list_items():
+        return [1, 2]
+
+    @app.get("/items/export")
+    @rate_limit.cost(rate_limit.COST_EXPORT)
+    async def export_items():
+        return [1, 2]
+
+    @app.get("/items/{id}", response_model=int)
+    async def get_item(id: int):
+        return id
+
+    app.state.limiter = WeightedLimiter(application_limits=["10/minute"], storage_uri="memory://")
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    app.add_middleware(SlowAPIMiddleware)
+    return app
+
+
+def test_route_cost_is_inferred_or_explicit():
+    routes = {route.path: route for route in build_app().routes}
+    assert rate_limit.route_cost(routes["/items"]) == rate_limit.COST_LIST
+    assert rate_limit.route_cost(routes["/items/export"]) == rate_limit.COST_EXPORT
+    assert rate_limit.route_cost(routes["/items/{id}"]) == rate_limit.COST_GET
+
+
+def test_list_routes_consume_their_cost():
+    client = TestClient(build_app())
+    assert client.get("/items").status_code == 200
+    assert client.get("/items").status_code == 200
+    assert client.get("/items").status_code == 429
+    # One budget per client: the other routes are exhausted as well
+    assert client.get("/items/1").status_code == 429
+
+
+def test_export_above_limit_is_rejected():
+    client = TestClient(build_app())
+    assert client.get("/items/export").status_code == 429
+
+
+def test_limits_are_keyed_by_token_subject():
+    client = TestClient(build_app())
+    alice = {"Authorization": f"Bearer {generate_access_token({'sub': 'alice'})}"}
+    bob = {"Authorization": f"Bearer {generate_access_token({'sub': 'bob'})}"}
+    assert client.get("/items", headers=alice).status_code == 200
+    assert client.get("/items", headers=alice).status_code == 200
+    assert client.get("/items", headers=alice).status_code == 429
+    assert client.get("/items", headers=bob).status_code == 200
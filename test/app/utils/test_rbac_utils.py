@@ -0,0 +1,78 @@
+import pytest
+from fastapi import HTTPException, status
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.models import Institution, Ppda, Role, User, UserInstitution
+from app.utils.rbac import authorize_resource
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+viewable_ppda = authorize_resource(Ppda, Role.VIEWER, "Ppda not found")
+editable_ppda = authorize_resource(Ppda, Role.EDITOR, "Ppda not found")
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        institution = Institution(id_institution="inst-1", institution_name="SEREMI")
+        session.add(institution)
+        session.add(Ppda(id_ppda="ppda-1", id_institution="inst-1", name="PPDA Temuco"))
+        session.add(User(id_user="viewer", username="viewer", email="v@example.com", password="x"))
+        session.add(User(id_user="outsider", username="outsider", email="o@example.com", password="x"))
+        session.add(User(id_user="admin", username="admin", email="a@example.com", password="x", is_admin=True))
+        session.add(UserInstitution(id_user="viewer", id_institution="inst-1", role=Role.VIEWER))
+        session.commit()
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def statements():
+    executed = []
+    listener = lambda *args: executed.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    yield executed
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+@pytest.mark.asyncio
+async def test_member_reads_resource_in_one_statement(session, statements):
+    ppda = await viewable_ppda("ppda-1", {"sub": "viewer"}, session)
+    assert ppda.id_ppda == "ppda-1"
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_admin_bypasses_membership(session):
+    ppda = await editable_ppda("ppda-1", {"sub": "admin"}, session)
+    assert ppda.id_ppda == "ppda-1"
+
+
+@pytest.mark.asyncio
+async def test_insufficient_role(session):
+    with pytest.raises(HTTPException) as exc:
+        await editable_ppda("ppda-1", {"sub": "viewer"}, session)
+    assert exc.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+async def test_non_member(session):
+    with pytest.raises(HTTPException) as exc:
+        await viewable_ppda("ppda-1", {"sub": "outsider"}, session)
+    assert exc.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+async def test_resource_not_found(session):
+    with pytest.raises(HTTPException) as exc:
+        await viewable_ppda("missing", {"sub": "viewer"}, session)
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+    assert exc.value.detail == "Ppda not found"
+
+
+@pytest.mark.asyncio
+async def test_unknown_user(session):
+    with pytest.raises(HTTPException) as exc:
+        await viewable_ppda("ppda-1", {"sub": "ghost"}, session)
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,167 @@
+import msgpack
+import orjson
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+from starlette.requests import Request
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.models import History, Ppda
+from app.utils import responses
+from app.utils.responses import field_selection, json_rows_statement, rows_response, table_select
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+
+def test_table_select_returns_rows(session):
+    session.add(History(id_history="h-1", id_report="r-1", value="10", created_at=5, updated_at=6))
+    session.commit()
+    session.expunge_all()
+
+    rows = session.exec(table_select(History)).all()
+    assert rows[0].id_history == "h-1"
+    assert not isinstance(rows[0], History)
+    assert not session.identity_map
+
+    response = rows_response(rows, History)
+    assert response.media_type == "application/json"
+    assert orjson.loads(response.body) == [{
+        "id_history": "h-1", "id_report": "r-1", "id_variable": None,
+        "value": "10", "created_at": 5, "updated_at": 6,
+    }]
+
+
+def test_model_instances_are_serialized_the_same(session):
+    history = History(id_history="h-2", value="x", created_at=1, updated_at=1)
+    assert orjson.loads(rows_response([history], History).body)[0]["id_history"] == "h-2"
+
+
+
+def test_json_rows_statement_uses_row_to_json():
+    from sqlalchemy.dialects import postgresql
+
+    compiled = str(json_rows_statement(table_select(History).where(History.id_report == "r-1"))
+                   .compile(dialect=postgresql.dialect()))
+    assert compiled.startswith("SELECT CAST(row_to_json(rows) AS TEXT)")
+    assert "FROM (SELECT history.id_report" in compiled and ") AS rows" in compiled
+
+
+def test_stream_json_joins_batches(session, monkeypatch):
+    monkeypatch.setattr(responses, "JSON_STREAM_BATCH", 2)
+    for index in range(3):
+        session.add(History(id_history=f"h-{index}", value=f'{{"n": {index}}}', created_at=index))
+    session.commit()
+
+    chunks = list(responses._stream_json(engine, select(History.value).order_by(History.created_at)))
+    assert len(chunks) == 3  # two batches and the closing bracket
+    assert orjson.loads(b"".join(chunks)) == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert b"".join(responses._stream_json(engine, select(History.value).where(History.value == "none"))) == b"[]"
+
+
+@pytest.mark.asyncio
+async def test_controllers_return_rows_on_sqlite(session):
+    from app.controllers import KpiController
+
+    assert not responses.sql_json_available(session, table_select(History))
+    assert await KpiController.get_all_kpis(session) == []
+    # A response already built by a controller passes through
+    response = ORJSONResponse([])
+    assert rows_response(response, History) is response
+
+
+def accept(value):
+    return Request({"type": "http", "headers": [(b"accept", value.encode())]})
+
+
+def test_response_format_from_accept_header():
+    assert responses.response_format(accept("")) == responses.JSON
+    assert responses.response_format(accept("*/*")) == responses.JSON
+    assert responses.response_format(accept("application/msgpack")) == responses.MSGPACK
+    assert responses.response_format(
+        accept("application/json;q=0.5, application/vnd.apache.arrow.stream")
+    ) == responses.ARROW_STREAM
+    assert responses.response_format(accept("text/html, application/msgpack;q=0.1")) == responses.MSGPACK
+
+
+def test_arrow_stream_is_columnar(session):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+
+    for index in range(3):
+        session.add(History(id_history=f"h-{index}", value=str(index), created_at=100 + index, updated_at=100))
+    session.commit()
+
+    response = rows_response(session.exec(table_select(History)).all(), History, responses.ARROW_STREAM)
+    assert response.media_type == responses.ARROW_STREAM
+    table = pyarrow.ipc.open_stream(response.body).read_all()
+    assert table.schema.field("created_at").type == pa.int64()
+    assert table.column("created_at").to_pylist() == [100, 101, 102]
+    assert table.column("id_report").null_count == 3
+
+    empty = pyarrow.ipc.open_stream(rows_response([], History, responses.ARROW_STREAM).body).read_all()
+    assert empty.num_rows == 0 and empty.schema.names == table.schema.names
+
+
+def test_arrow_stream_with_archived_rows(session):
+    pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+
+    session.add(History(id_history="h-db", value="1", created_at=200, updated_at=200))
+    session.commit()
+    # Database rows followed by History objects, as returned by with_archive
+    rows = session.exec(table_select(History)).all() + [History(id_history="h-archived", value="0", created_at=100, updated_at=100)]
+
+    table = pyarrow.ipc.open_stream(rows_response(rows, History, responses.ARROW_STREAM).body).read_all()
+    assert table.column("id_history").to_pylist() == ["h-db", "h-archived"]
+    assert table.column("created_at").to_pylist() == [200, 100]
+
+
+def test_streamed_json_varies_on_accept(session):
+    response = responses.json_rows_response(session, table_select(History))
+    assert response.headers["vary"] == "Accept"
+
+
+def test_msgpack(session):
+    session.add(History(id_history="h-1", value="1", created_at=1, updated_at=1))
+    session.commit()
+    columns = field_selection(History)("id_history,value")
+    rows = session.exec(table_select(History, columns)).all()
+
+    response = rows_response(rows, History, responses.MSGPACK, columns=columns)
+    assert response.media_type == responses.MSGPACK
+    assert msgpack.unpackb(response.body) == [{"id_history": "h-1", "value": "1"}]
+
+
+def test_field_selection_narrows_the_select(session):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+
+    session.add(Ppda(id_ppda="p-1", name="Santiago", description="x" * 500, status="active", created_at=1, updated_at=1))
+    session.commit()
+
+    columns = field_selection(Ppda)(" status,id_ppda,status ")
+    assert [column.key for column in columns] == ["status", "id_ppda"]
+    statement = table_select(Ppda, columns)
+    assert "description" not in str(statement)
+
+    rows = session.exec(statement).all()
+    assert orjson.loads(rows_response(rows, Ppda, columns=columns).body) == [{"status": "active", "id_ppda": "p-1"}]
+    table = pyarrow.ipc.open_stream(rows_response(rows, Ppda, responses.ARROW_STREAM, columns=columns).body).read_all()
+    assert table.schema.names == ["status", "id_ppda"]
+
+
+def test_field_selection_rejects_unknown_fields():
+    select_fields = field_selection(Ppda)
+    assert select_fields(None) is None
+    for fields in ("id_ppda,password", " , "):
+        with pytest.raises(HTTPException) as exc:
+            select_fields(fields)
+        assert exc.value.status_code == 400
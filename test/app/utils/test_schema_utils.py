@@ -0,0 +1,80 @@
+import logging
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlmodel import create_engine
+
+from app import cli, db
+from app.utils import schema
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    yield engine
+    engine.dispose()
+
+
+def test_head_revision_comes_from_migrations():
+    from alembic.script import ScriptDirectory
+
+    # A single head: migrations form one linear chain
+    assert len(schema.head_revisions()) == 1
+    assert schema.head_revisions() == set(ScriptDirectory(schema.MIGRATIONS_DIR).get_heads())
+
+
+def test_check_fails_on_database_without_version(engine):
+    with pytest.raises(RuntimeError, match="no revision"):
+        schema.check_schema(engine, "fail")
+
+
+def test_check_warns_on_stale_version(engine, caplog):
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        connection.execute(text("INSERT INTO alembic_version VALUES ('8c41d2e95a17')"))
+    with caplog.at_level(logging.WARNING):
+        assert schema.check_schema(engine, "warn") is False
+    assert "8c41d2e95a17" in caplog.text
+
+
+def test_check_off_does_not_touch_database(engine, monkeypatch):
+    monkeypatch.setattr(schema, "current_revisions", lambda connection: pytest.fail("queried the database"))
+    assert schema.check_schema(engine, "off") is True
+
+
+def test_create_schema_stamps_head(engine):
+    schema.create_schema(engine)
+    assert "history" in inspect(engine).get_table_names()
+    assert schema.check_schema(engine, "fail") is True
+
+
+def test_create_schema_runs_migrations_outside_sqlite(engine, monkeypatch):
+    from alembic import command
+
+    upgrades = []
+    monkeypatch.setattr(engine.dialect, "name", "postgresql")
+    monkeypatch.setattr(command, "upgrade", lambda config, revision: upgrades.append(
+        (config.attributes["connection"].engine, revision)
+    ))
+    schema.create_schema(engine)
+    assert upgrades == [(engine, "heads")]
+    # Nothing created from the models
+    assert inspect(engine).get_table_names() == []
+
+
+def test_init_db_checks_instead_of_creating(engine, monkeypatch):
+    monkeypatch.setenv("DATABASE", "postgresql")
+    monkeypatch.setattr(db, "create_db_engine", lambda: engine)
+    monkeypatch.setattr(db, "engine", None)
+    with pytest.raises(RuntimeError):
+        db.init_db()
+    assert inspect(engine).get_table_names() == []
+
+
+def test_cli_create_and_check_schema(engine, monkeypatch, capsys):
+    monkeypatch.setattr(db, "create_db_engine", lambda: engine)
+    assert cli.main(["check-schema"]) == 1
+    assert cli.main(["create-schema"]) == 0
+    assert cli.main(["check-schema"]) == 0
+    (head,) = schema.head_revisions()
+    assert head in capsys.readouterr().out
@@ -0,0 +1,37 @@
+from app.utils.search import SEARCH_SOURCES, InvertedIndex, document_sql, search_statement, tokenize
+
+
+def test_tokenize_normalizes_spanish_words():
+    assert tokenize("Planes de Descontaminación, REGIÓN del Biobío") == ["plan", "descontaminacion", "region", "biobio"]
+    assert tokenize(None) == []
+
+
+def test_inverted_index_requires_every_word_and_ranks_by_bm25():
+    index = InvertedIndex()
+    index.add("ppda", "p-1", "Leña", "Calefacción a leña en Temuco", "leña seca")
+    index.add("ppda", "p-2", "Temuco", "Plan de Temuco")
+    index.add("institution", "i-1", "Seremi", "Seremi de Temuco")
+
+    total, hits = index.search("temuco leña", ["ppda", "institution"], 10, 0)
+    assert total == 1 and hits[0].id == "p-1"
+
+    total, hits = index.search("temuco", ["ppda"], 10, 0)
+    assert total == 2 and hits[0].id == "p-2"  # shorter document, same frequency
+    assert index.search("de", ["ppda"], 10, 0) == (0, [])
+
+
+def test_postgres_statement_uses_indexed_expression():
+    statement = str(search_statement(["ppda"]))
+    assert document_sql(SEARCH_SOURCES["ppda"]) in statement
+    assert "websearch_to_tsquery('es_unaccent', :q)" in statement
+    assert "institution" not in statement
+
+
+def test_migration_indexes_the_queried_expressions():
+    from alembic.script import ScriptDirectory
+
+    from app.utils.schema import MIGRATIONS_DIR
+
+    migration = ScriptDirectory(MIGRATIONS_DIR).get_revision("5d2f8e61c3a9").module
+    for source in SEARCH_SOURCES.values():
+        assert migration.SEARCH_INDEXES[f"ix_{source.table}_search"] == (source.table, document_sql(source))
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.controllers.PpdaController import get_at, get_within
+from app.models import Ppda
+from app.utils import spatial
+from app.utils.spatial import BBox, RTree, parse_bbox
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Ppda(id_ppda="santiago", name="Santiago", min_lon=-71.0, min_lat=-33.7, max_lon=-70.4, max_lat=-33.3))
+        session.add(Ppda(id_ppda="temuco", name="Temuco", min_lon=-72.7, min_lat=-38.8, max_lon=-72.5, max_lat=-38.6))
+        session.add(Ppda(id_ppda="sin-area", name="Sin área"))
+        session.commit()
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+
+def test_rtree_matches_linear_scan():
+    rng = random.Random(7)
+    items = []
+    for index in range(2000):
+        lon, lat = rng.uniform(-75, -66), rng.uniform(-56, -17)
+        items.append((BBox(lon, lat, lon + rng.uniform(0, 1), lat + rng.uniform(0, 1)), f"p-{index}"))
+    tree = RTree(items)
+    for _ in range(50):
+        lon, lat = rng.uniform(-75, -66), rng.uniform(-56, -17)
+        query = BBox(lon, lat, lon + 0.5, lat + 0.5)
+        assert sorted(tree.search(query)) == sorted(key for bbox, key in items if bbox.intersects(query))
+    assert RTree([]).search(BBox(0, 0, 1, 1)) == []
+
+
+def test_parse_bbox():
+    assert parse_bbox("-71,-33.7,-70.4,-33.3") == BBox(-71, -33.7, -70.4, -33.3)
+    for value in ("1,2,3", "a,b,c,d", "-70,-33,-71,-32", "0,0,200,1"):
+        with pytest.raises(HTTPException) as exc:
+            parse_bbox(value)
+        assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sqlite_rtree", [True, False])
+async def test_ppda_at_and_within(session, monkeypatch, sqlite_rtree):
+    if not sqlite_rtree:
+        monkeypatch.setattr(spatial, "_has_sqlite_rtree", lambda connection: False)
+    assert [row.id_ppda for row in await get_at(-33.45, -70.66, session)] == ["santiago"]
+    assert await get_at(-20.2, -70.1, session) == []
+    within = await get_within(BBox(-73, -39, -70, -33), session)
+    assert sorted(row.id_ppda for row in within) == ["santiago", "temuco"]
+
+    ppda = session.get(Ppda, "temuco")
+    ppda.min_lon, ppda.max_lon = -70.9, -70.8
+    session.commit()
+    assert sorted(row.id_ppda for row in await get_at(-38.7, -70.85, session)) == ["temuco"]
@@ -0,0 +1,29 @@
+from app.utils import startup
+
+ENV = {"DATABASE": "sqlite", "RATE_LIMIT": "500/minute"}
+
+IMPORTTIME = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |       _io
+import time:       850 |       1300 |     app.models.User
+import time:      2000 |       3300 |   app.models
+import time:      5000 |       8300 | app.main
+"""
+
+
+def test_parse_importtime():
+    rows = startup.parse_importtime(IMPORTTIME)
+    assert [row.module for row in rows] == ["_io", "app.models.User", "app.models", "app.main"]
+    assert rows[-1] == startup.ImportTime("app.main", 5000, 8300, 0)
+    assert rows[1].depth == 2
+
+
+def test_first_response_runs_in_new_interpreter():
+    timing = startup.first_response("app.main", "/", env=ENV)
+    assert timing["status"] == 200
+    assert timing["import"] > 0 and timing["first_response"] > 0
+
+
+def test_startup_does_not_load_optional_modules():
+    loaded = {row.module.split(".")[0] for row in startup.import_profile("app.main", env=ENV)}
+    # Only needed by maintenance commands
+    assert not {"alembic", "pyarrow"} & loaded
@@ -0,0 +1,38 @@
+import sqlmodel as sql
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.models import Ppda
+from app.utils.table_versions import table_version
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+SQLModel.metadata.create_all(engine)
+
+
+def test_version_is_bumped_on_commit_not_flush():
+    before = table_version("ppda")
+    with Session(engine) as session:
+        session.add(Ppda(name="PPDA Coyhaique"))
+        session.flush()
+        assert table_version("ppda") == before
+        session.commit()
+    assert table_version("ppda") == (before[0] + 1,)
+
+
+def test_rolled_back_writes_are_not_counted():
+    before = table_version("ppda")
+    with Session(engine) as session:
+        session.add(Ppda(name="PPDA Osorno"))
+        session.flush()
+        session.rollback()
+        session.exec(sql.select(Ppda)).all()
+        session.commit()
+    assert table_version("ppda") == before
+
+
+def test_bulk_writes_are_bumped_on_commit():
+    before = table_version("ppda")
+    with Session(engine) as session:
+        session.exec(sql.update(Ppda).values(status="active"))
+        assert table_version("ppda") == before
+        session.commit()
+    assert table_version("ppda") == (before[0] + 1,)
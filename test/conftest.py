@@ -1,7 +1,8 @@
 import os
 import pytest
 from unittest.mock import patch
-from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel import SQLModel, create_engine
+from app.db import SessionLocal
 
 # Parcheo global para tests de rutas: SQLite en memoria
 os.environ["DATABASE"] = "sqlite"
@@ -11,7 +12,7 @@ test_engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thre
 @pytest.fixture(autouse=True, scope="session")
 def patch_engine_and_session():
     def get_test_session():
-        with Session(test_engine) as session:
+        with SessionLocal(bind=test_engine) as session:
             yield session
     with patch("app.db.engine", test_engine), patch("app.db.get_session", get_test_session):
         SQLModel.metadata.create_all(test_engine)